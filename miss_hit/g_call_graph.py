@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+##############################################################################
+##                                                                          ##
+##          MATLAB Independent, Small & Safe, High Integrity Tools          ##
+##                                                                          ##
+##              Copyright (C) 2022, Florian Schanda                         ##
+##                                                                          ##
+##  This file is part of MISS_HIT.                                          ##
+##                                                                          ##
+##  MATLAB Independent, Small & Safe, High Integrity Tools (MISS_HIT) is    ##
+##  free software: you can redistribute it and/or modify                    ##
+##  it under the terms of the GNU Affero General Public License as          ##
+##  published by the Free Software Foundation, either version 3 of the      ##
+##  License, or (at your option) any later version.                         ##
+##                                                                          ##
+##  MISS_HIT is distributed in the hope that it will be useful,             ##
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of          ##
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the           ##
+##  GNU Afferto General Public License for more details.                    ##
+##                                                                          ##
+##  You should have received a copy of the GNU Affero General Public        ##
+##  License along with MISS_HIT. If not, see                                ##
+##  <http://www.gnu.org/licenses/>.                                         ##
+##                                                                          ##
+##############################################################################
+
+# Whole project call graph, built from the call sites each worker
+# records in File_Symbols and linked against the Project_Index.
+
+import json
+
+from miss_hit.graph import Compact_Graph
+from miss_hit.m_entity import Project_Index, File_Symbols
+
+
+# Above this many calls we keep a set of the called functions, so
+# that adding an edge does not have to search the successor list.
+LARGE_FAN_OUT = 16
+
+
+class Call_Graph(Compact_Graph):
+    # Each vertex is a function, with (File_Symbols, index into its
+    # function list) as the vertex data.
+    def __init__(self):
+        super().__init__()
+        self.primary = {}
+        # The vertex for the primary entity of each File_Symbols
+
+        self.targets = {}
+        # The set of successors, but only for vertices with more than
+        # LARGE_FAN_OUT of them
+
+    def add_edge(self, src, dst):
+        if src in self.targets:
+            targets = self.targets[src]
+        elif len(self.succ[src]) >= LARGE_FAN_OUT:
+            targets = set(self.succ[src])
+            self.targets[src] = targets
+        else:
+            super().add_edge(src, dst)
+            return
+
+        assert 0 <= dst < len(self.succ)
+        if dst not in targets:
+            targets.add(dst)
+            self.succ[src].append(dst)
+            self.pred[dst].append(src)
+
+    def add_file(self, fsym):
+        assert isinstance(fsym, File_Symbols)
+
+        l_vertices = [self.add_vertex(data=(fsym, function_index))
+                      for function_index in range(len(fsym.functions))]
+        if l_vertices:
+            self.primary[fsym] = l_vertices[0]
+        return l_vertices
+
+    def file_symbols(self, vid):
+        return self.data[vid][0]
+
+    def function(self, vid):
+        # Returns the (name, line, column, calls) tuple for the vertex
+        fsym, function_index = self.data[vid]
+        return fsym.functions[function_index]
+
+    def dot_label(self, vid):
+        return "%s:%s" % (self.file_symbols(vid).filename,
+                          self.function(vid)[0])
+
+    def write_json(self, filename):
+        # A compact representation: vertices are numbered in order,
+        # and each vertex only carries the list of vertices it calls.
+        with open(filename, "w", encoding="UTF-8") as fd:
+            json.dump({"functions" : [[self.file_symbols(vid).filename,
+                                       self.function(vid)[0],
+                                       self.function(vid)[1]]
+                                      for vid in range(len(self.succ))],
+                       "calls"     : [sorted(l_succ)
+                                      for l_succ in self.succ]},
+                      fd,
+                      separators=(",", ":"))
+            fd.write("\n")
+
+
+def build_call_graph(index):
+    assert isinstance(index, Project_Index)
+
+    graph = Call_Graph()
+
+    # Create vertices for all functions, in a stable order
+    file_vertices = [(fsym, graph.add_file(fsym))
+                     for fsym in sorted(index.files,
+                                        key=lambda f: f.filename)]
+
+    # Link call sites. Functions in the same file (local and nested
+    # functions) take precedence over anything in the index.
+    for fsym, l_vertices in file_vertices:
+        local = {}
+        for vertex in reversed(l_vertices):
+            local[graph.function(vertex)[0]] = vertex
+
+        for vertex in l_vertices:
+            for name in graph.function(vertex)[3]:
+                if name in local:
+                    graph.add_edge(vertex, local[name])
+                    continue
+                target = index.resolve(fsym, name)
+                if target is None and "." in name:
+                    # a.b might also be a field access on the result
+                    # of calling a
+                    target = index.resolve(fsym, name.split(".", 1)[0])
+                if target is not None and target in graph.primary:
+                    graph.add_edge(vertex, graph.primary[target])
+
+    # Old-style classes (and classes with methods in separate files):
+    # if the class is used, all methods in its class directories can
+    # be called.
+    for cls_name, l_clsdirs in index.class_directories.items():
+        if "." in cls_name:
+            pkg_name, name = cls_name.rsplit(".", 1)
+        else:
+            pkg_name, name = "", cls_name
+        ctor = index.packages[pkg_name].constructors.get(name)
+        if ctor is None or ctor not in graph.primary:
+            continue
+        for clsdir in l_clsdirs:
+            for method in clsdir.methods.values():
+                if method in graph.primary:
+                    graph.add_edge(graph.primary[ctor],
+                                   graph.primary[method])
+
+    return graph
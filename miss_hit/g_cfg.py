@@ -24,26 +24,63 @@
 ##                                                                          ##
 ##############################################################################
 
-from miss_hit.graph import Graph, Vertex_Root
+from miss_hit.graph import Compact_Graph
 from miss_hit_core.m_ast import *
 from miss_hit_core.errors import Message_Handler, ICE
 
 
-class Vertex(Vertex_Root):
-    def __init__(self, graph, n_node):
-        assert isinstance(n_node, Node)
+def new_vertex(graph, n_node):
+    # Vertices are plain integers; the AST node is kept as the vertex
+    # data in the graph.
+    assert isinstance(graph, Compact_Graph)
+    assert isinstance(n_node, Node)
 
-        super().__init__(graph)
+    return graph.add_vertex(data=n_node)
 
-        self.n_node = n_node
 
-    def dot_label(self):
-        return "%s" % self.n_node.__class__.__name__
+NON_RETURNING_FUNCTIONS = frozenset(["error",
+                                     "rethrow",
+                                     "throw",
+                                     "throwAsCaller"])
+
+
+def is_non_returning(n_statement):
+    # Returns true if the statement is a call to a function (such as
+    # error) that never returns normally.
+    assert isinstance(n_statement, (Statement,
+                                    Metric_Justification_Pragma))
+
+    if not isinstance(n_statement, Naked_Expression_Statement):
+        return False
+    n_expr = n_statement.n_expr
+    if isinstance(n_expr, (Reference, Function_Call)):
+        n_expr = n_expr.n_ident if isinstance(n_expr, Reference) \
+            else n_expr.n_name
+    return isinstance(n_expr, Identifier) and \
+        str(n_expr) in NON_RETURNING_FUNCTIONS
+
+
+def cannot_raise(n_node):
+    # Returns true if the node obviously cannot raise an exception,
+    # for example assigning a literal to a variable. This is only
+    # used to make exception edges more precise, so it's fine to
+    # return False when in doubt.
+    assert isinstance(n_node, Node)
+
+    if isinstance(n_node, Simple_Assignment_Statement):
+        return (isinstance(n_node.n_lhs, Identifier) and
+                isinstance(n_node.n_rhs, Literal))
+    else:
+        return isinstance(n_node, (Break_Statement,
+                                   Continue_Statement,
+                                   Global_Statement,
+                                   Metric_Justification_Pragma,
+                                   Persistent_Statement))
 
 
 class CFG_Context:
     def __init__(self, v_entry=None):
-        assert v_entry is None or isinstance(v_entry, Vertex_Root)
+        assert v_entry is None or isinstance(v_entry, int)
 
         self.v_entry = v_entry
         self.l_exits = []
@@ -62,11 +99,11 @@ class CFG_Context:
 
 
 def build_cfg_statement(graph, n_statement):
-    assert isinstance(graph, Graph)
+    assert isinstance(graph, Compact_Graph)
     assert isinstance(n_statement, (Statement,
                                     Metric_Justification_Pragma))
 
-    ctx = CFG_Context(Vertex(graph, n_statement))
+    ctx = CFG_Context(new_vertex(graph, n_statement))
 
     if isinstance(n_statement, (Compound_Assignment_Statement,
                                 Global_Statement,
@@ -76,21 +113,23 @@ def build_cfg_statement(graph, n_statement):
                                 Simple_Assignment_Statement,
                                 Metric_Justification_Pragma)):
         # All of these are simple statements. One entry, one obvious
-        # exit.
-        ctx.l_exits.append(ctx.v_entry)
+        # exit; unless we call something like error, in which case
+        # there is no exit at all.
+        if not is_non_returning(n_statement):
+            ctx.l_exits.append(ctx.v_entry)
 
     elif isinstance(n_statement, If_Statement):
         # If statements chain together the actions.
         current_link = ctx.v_entry
         for n_action in n_statement.l_actions:
-            v_action = Vertex(graph, n_action)
+            v_action = new_vertex(graph, n_action)
             graph.add_edge(current_link, v_action)
             current_link = v_action
 
             action_ctx = build_cfg_sos(graph, n_action.n_body)
             ctx.merge_loops(action_ctx)
             ctx.merge_exits(action_ctx)
-            if action_ctx.v_entry:
+            if action_ctx.v_entry is not None:
                 graph.add_edge(v_action, action_ctx.v_entry)
 
         if not n_statement.has_else:
@@ -106,14 +145,14 @@ def build_cfg_statement(graph, n_statement):
 
         current_link = ctx.v_entry
         for n_action in n_statement.l_actions:
-            v_action = Vertex(graph, n_action)
+            v_action = new_vertex(graph, n_action)
             graph.add_edge(current_link, v_action)
             current_link = v_action
 
             action_ctx = build_cfg_sos(graph, n_action.n_body)
             ctx.merge_loops(action_ctx)
             ctx.merge_exits(action_ctx)
-            if action_ctx.v_entry:
+            if action_ctx.v_entry is not None:
                 graph.add_edge(v_action, action_ctx.v_entry)
 
         if not n_statement.has_otherwise:
@@ -129,7 +168,7 @@ def build_cfg_statement(graph, n_statement):
         # Any break statements found in the body are processed here.
         body_ctx = build_cfg_sos(graph, n_statement.n_body)
 
-        if body_ctx.v_entry:
+        if body_ctx.v_entry is not None:
             graph.add_edge(ctx.v_entry, body_ctx.v_entry)
 
         for src in body_ctx.l_exits:
@@ -153,25 +192,46 @@ def build_cfg_statement(graph, n_statement):
         ctx.merge_loops(spmd_ctx)
         ctx.merge_exits(spmd_ctx)
 
-        if spmd_ctx.v_entry:
+        if spmd_ctx.v_entry is not None:
             graph.add_edge(ctx.v_entry, spmd_ctx.v_entry)
 
     elif isinstance(n_statement, Try_Statement):
+        # Any statement in the body may raise an exception, in which
+        # case we continue in the handler (or after the try statement
+        # if there is none) with the state from just before that
+        # statement. Vertices are numbered in order, so the body is
+        # the range of vertices created while building it.
+        v_first = graph.count_vertices()
         try_ctx = build_cfg_sos(graph, n_statement.n_body)
+        v_last = graph.count_vertices()
         ctx.merge_loops(try_ctx)
         ctx.merge_exits(try_ctx)
 
+        if try_ctx.v_entry is not None:
+            graph.add_edge(ctx.v_entry, try_ctx.v_entry)
+        else:
+            # An empty body cannot raise, so we just continue after
+            # the try statement
+            ctx.l_exits.append(ctx.v_entry)
+
+        l_raise = []
+        for v_body in range(v_first, v_last):
+            if not cannot_raise(graph.data[v_body]):
+                for v_pred in graph.pred[v_body]:
+                    if v_pred not in l_raise:
+                        l_raise.append(v_pred)
+
         if n_statement.n_handler:
             handler_ctx = build_cfg_sos(graph, n_statement.n_handler)
             ctx.merge_loops(handler_ctx)
             ctx.merge_exits(handler_ctx)
-            if handler_ctx.v_entry:
-                graph.add_edge(ctx.v_entry, handler_ctx.v_entry)
+            if handler_ctx.v_entry is not None:
+                for v_raise in l_raise:
+                    graph.add_edge(v_raise, handler_ctx.v_entry)
+            else:
+                ctx.l_exits += l_raise
         else:
-            ctx.l_exits.append(ctx.v_entry)
-
-        if try_ctx.v_entry:
-            graph.add_edge(ctx.v_entry, try_ctx.v_entry)
+            ctx.l_exits += l_raise
 
     else:
         raise ICE("unknown statement kind %s" %
@@ -181,7 +241,7 @@ def build_cfg_statement(graph, n_statement):
 
 
 def build_cfg_sos(graph, n_sos):
-    assert isinstance(graph, Graph)
+    assert isinstance(graph, Compact_Graph)
     assert isinstance(n_sos, Sequence_Of_Statements)
 
     ctx = CFG_Context()
@@ -211,9 +271,9 @@ def build_cfg(n_fdef):
     assert isinstance(n_fdef, (Function_Definition,
                                Script_File))
 
-    graph = Graph()
-    v_start = Vertex_Root(graph, "start")
-    v_end = Vertex_Root(graph, "end")
+    graph = Compact_Graph()
+    v_start = graph.add_vertex("start")
+    v_end = graph.add_vertex("end")
 
     if isinstance(n_fdef, Function_Definition):
         ctx = build_cfg_sos(graph, n_fdef.n_body)
@@ -222,7 +282,7 @@ def build_cfg(n_fdef):
 
     assert len(ctx.l_loop_breaks) == 0
 
-    if ctx.v_entry:
+    if ctx.v_entry is not None:
         graph.add_edge(v_start, ctx.v_entry)
         for v_exit in ctx.l_exits:
             graph.add_edge(v_exit, v_end)
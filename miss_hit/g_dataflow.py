@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+##############################################################################
+##                                                                          ##
+##          MATLAB Independent, Small & Safe, High Integrity Tools          ##
+##                                                                          ##
+##              Copyright (C) 2022, Florian Schanda                         ##
+##                                                                          ##
+##  This file is part of MISS_HIT.                                          ##
+##                                                                          ##
+##  MATLAB Independent, Small & Safe, High Integrity Tools (MISS_HIT) is    ##
+##  free software: you can redistribute it and/or modify                    ##
+##  it under the terms of the GNU Affero General Public License as          ##
+##  published by the Free Software Foundation, either version 3 of the      ##
+##  License, or (at your option) any later version.                         ##
+##                                                                          ##
+##  MISS_HIT is distributed in the hope that it will be useful,             ##
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of          ##
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the           ##
+##  GNU Afferto General Public License for more details.                    ##
+##                                                                          ##
+##  You should have received a copy of the GNU Affero General Public        ##
+##  License along with MISS_HIT. If not, see                                ##
+##  <http://www.gnu.org/licenses/>.                                         ##
+##                                                                          ##
+##############################################################################
+
+# Data-flow analysis over the control flow graphs built by g_cfg.
+#
+# All problems are classic gen/kill bit-vector problems: the facts
+# (e.g. variables or definitions) are numbered, and a set of facts is
+# an int used as a bitset. The solver is a worklist algorithm that
+# processes vertices in reverse post-order (of the reversed graph for
+# backwards problems), so that for structured code it converges in
+# very few passes.
+
+import heapq
+
+from miss_hit.graph import Compact_Graph
+from miss_hit.m_sem import root_identifier
+from miss_hit_core.m_ast import *
+
+
+def bits(bitset):
+    """ Yields the index of each bit set in the given int """
+    assert bitset >= 0
+    while bitset:
+        lowest = bitset & -bitset
+        yield lowest.bit_length() - 1
+        bitset ^= lowest
+
+
+class Dataflow_Problem:
+    """ A gen/kill bit-vector data-flow problem
+
+    For each vertex v of the graph the transfer function is
+
+       result(v) = gen[v] | (input(v) & ~kill[v])
+
+    where the input is the union (for may problems) or intersection
+    (for must problems) of the results of all predecessors (or
+    successors for backwards problems). The boundary vertex
+    (normally start or end) gets the boundary value as input
+    instead.
+    """
+    def __init__(self, graph, forwards, may, universe=0):
+        assert isinstance(graph, Compact_Graph)
+        assert isinstance(forwards, bool)
+        assert isinstance(may, bool)
+        assert isinstance(universe, int)
+
+        self.graph     = graph
+        self.forwards  = forwards
+        self.may       = may
+        self.universe  = universe
+        # The set of all facts. Only required for must problems.
+
+        self.gen       = [0] * graph.count_vertices()
+        self.kill      = [0] * graph.count_vertices()
+        self.boundary  = 0
+
+    def solve(self, v_boundary):
+        """ Computes the fixed point
+
+        Returns a pair of lists (before, after) with the facts that
+        hold before and after each vertex, in the direction of
+        execution (i.e. for backwards problems the result of the
+        transfer function is the before list).
+        """
+        graph = self.graph
+        assert 0 <= v_boundary < graph.count_vertices()
+
+        n_vertices = graph.count_vertices()
+        if self.forwards:
+            l_inputs, l_outputs = graph.pred, graph.succ
+        else:
+            l_inputs, l_outputs = graph.succ, graph.pred
+        initial = 0 if self.may else self.universe
+
+        # Process vertices in reverse post-order; anything not
+        # reachable from the boundary (e.g. dead code, or an infinite
+        # loop for backwards problems) is processed last.
+        order = graph.reverse_postorder([v_boundary],
+                                        backwards = not self.forwards)
+        if len(order) < n_vertices:
+            seen = bytearray(n_vertices)
+            for vid in order:
+                seen[vid] = 1
+            order += [vid for vid in range(n_vertices) if not seen[vid]]
+        position = [0] * n_vertices
+        for pos, vid in enumerate(order):
+            position[vid] = pos
+
+        gen    = self.gen
+        kill   = self.kill
+        l_in   = [initial] * n_vertices
+        l_out  = [initial] * n_vertices
+
+        # Initially all vertices are on the worklist. The worklist
+        # is a heap of positions in the order, so we always process
+        # the earliest vertex first.
+        worklist = list(range(n_vertices))
+        queued   = bytearray(b"\x01") * n_vertices
+
+        while worklist:
+            vid = order[heapq.heappop(worklist)]
+            queued[vid] = 0
+
+            if vid == v_boundary:
+                value = self.boundary
+            elif not l_inputs[vid]:
+                value = initial
+            elif self.may:
+                value = 0
+                for src in l_inputs[vid]:
+                    value |= l_out[src]
+            else:
+                value = self.universe
+                for src in l_inputs[vid]:
+                    value &= l_out[src]
+            l_in[vid] = value
+
+            value = gen[vid] | (value & ~kill[vid])
+            if value != l_out[vid]:
+                l_out[vid] = value
+                for dst in l_outputs[vid]:
+                    if not queued[dst]:
+                        queued[dst] = 1
+                        heapq.heappush(worklist, position[dst])
+
+        if self.forwards:
+            return l_in, l_out
+        else:
+            return l_out, l_in
+
+
+def target_identifier(n_target):
+    # Returns the variable written by an assignment target, e.g. for
+    # a.b(c).d this is a. Returns None for ~.
+    n_root = root_identifier(n_target)
+    if n_root is None or n_root.t_ident.kind != "IDENTIFIER":
+        return None
+    else:
+        return n_root
+
+
+class Def_Use:
+    """ The variables read and written by each vertex of a CFG
+
+    Variables are numbered in order of appearance (parameters first)
+    and each vertex has a bitset of variables it uses, variables it
+    defines completely (e.g. x = 1), and variables it only updates
+    (e.g. x(2) = 1).
+    """
+    def __init__(self, n_fdef, graph):
+        assert isinstance(n_fdef, Function_Definition)
+        assert isinstance(graph, Compact_Graph)
+
+        self.graph = graph
+
+        self.variables = []
+        # Name of each variable
+        self.var_id    = {}
+        # Id of each variable
+
+        self.inputs    = 0
+        self.outputs   = 0
+        # Bitset of parameters
+
+        self.static    = 0
+        # Bitset of global and persistent variables
+
+        n_vertices = graph.count_vertices()
+        self.uses       = [0] * n_vertices
+        self.defs       = [0] * n_vertices
+        self.updates    = [0] * n_vertices
+        self.use_sites  = [[] for _ in range(n_vertices)]
+        # For each vertex a list of (variable id, identifier) for
+        # each use, in order
+
+        self.names      = set()
+        # All names read anywhere in the function, variables or not
+
+        # Find all variables. In MATLAB anything that is assigned
+        # anywhere in a function is a variable everywhere in it.
+        for n_param in n_fdef.n_sig.l_inputs:
+            vid = self.declare(n_param)
+            if vid is not None:
+                self.inputs |= 1 << vid
+        for n_param in n_fdef.n_sig.l_outputs:
+            vid = self.declare(n_param)
+            if vid is not None:
+                self.outputs |= 1 << vid
+        if n_fdef.n_sig.is_constructor:
+            # The object is created by MATLAB before the constructor
+            # is called
+            self.inputs |= self.outputs
+        for n_node in graph.data:
+            for n_target in self.targets(n_node):
+                self.declare(target_identifier(n_target))
+
+        # Now record what each vertex does
+        for vertex, n_node in enumerate(graph.data):
+            if n_node is not None:
+                self.analyse_vertex(vertex, n_node)
+
+    def declare(self, n_ident):
+        if n_ident is None or n_ident.t_ident.kind != "IDENTIFIER":
+            return None
+        name = str(n_ident)
+        if name not in self.var_id:
+            self.var_id[name] = len(self.variables)
+            self.variables.append(name)
+        return self.var_id[name]
+
+    @staticmethod
+    def targets(n_node):
+        # Returns the list of names written by the given CFG node
+        if isinstance(n_node, Simple_Assignment_Statement):
+            return [n_node.n_lhs]
+        elif isinstance(n_node, Compound_Assignment_Statement):
+            return n_node.l_lhs
+        elif isinstance(n_node, (Global_Statement, Persistent_Statement)):
+            return n_node.l_names
+        elif isinstance(n_node, (For_Loop_Statement, Try_Statement)) and \
+             n_node.n_ident:
+            return [n_node.n_ident]
+        else:
+            return []
+
+    def add_uses(self, vertex, n_expr, shadowed=frozenset()):
+        # Record all variables read by the given expression
+        assert isinstance(n_expr, Node)
+
+        todo = [(n_expr, shadowed)]
+        while todo:
+            n_node, shadowed = todo.pop()
+            if isinstance(n_node, Identifier):
+                name = str(n_node)
+                self.names.add(name)
+                if name in self.var_id and name not in shadowed:
+                    var = self.var_id[name]
+                    self.uses[vertex] |= 1 << var
+                    self.use_sites[vertex].append((var, n_node))
+                continue
+            elif isinstance(n_node, Selection):
+                # The field is not a variable
+                children = [n_node.n_prefix]
+            elif isinstance(n_node, (Function_Pointer,
+                                     Metaclass,
+                                     Superclass_Reference)):
+                # These only contain function and class names
+                children = []
+            elif isinstance(n_node, Lambda_Function):
+                # Parameters of an anonymous function hide variables
+                # in its body
+                shadowed = shadowed | frozenset(map(str,
+                                                    n_node.l_parameters))
+                children = [n_node.n_body]
+            else:
+                children = [n_child for _, n_child in n_node.children()]
+
+            # Visit children left to right, so that use_sites are in
+            # source order
+            for n_child in reversed(children):
+                todo.append((n_child, shadowed))
+
+    def add_target(self, vertex, n_target):
+        # Record the assignment to the given name. Any index
+        # expressions are read, and the variable itself is either
+        # defined (x = ...) or updated (x(i) = ...).
+        n_root = target_identifier(n_target)
+        if n_root is None:
+            return
+
+        n_name = n_target
+        while n_name is not n_root:
+            if isinstance(n_name, (Reference, Cell_Reference)):
+                for n_arg in n_name.l_args:
+                    self.add_uses(vertex, n_arg)
+                n_name = n_name.n_ident
+            elif isinstance(n_name, Dynamic_Selection):
+                self.add_uses(vertex, n_name.n_field)
+                n_name = n_name.n_prefix
+            else:
+                n_name = n_name.n_prefix
+
+        if n_target is n_root:
+            self.defs[vertex] |= 1 << self.var_id[str(n_root)]
+        else:
+            self.updates[vertex] |= 1 << self.var_id[str(n_root)]
+
+    def analyse_vertex(self, vertex, n_node):
+        if isinstance(n_node, Simple_Assignment_Statement):
+            self.add_uses(vertex, n_node.n_rhs)
+            self.add_target(vertex, n_node.n_lhs)
+
+        elif isinstance(n_node, Compound_Assignment_Statement):
+            self.add_uses(vertex, n_node.n_rhs)
+            for n_lhs in n_node.l_lhs:
+                self.add_target(vertex, n_lhs)
+
+        elif isinstance(n_node, Naked_Expression_Statement):
+            self.add_uses(vertex, n_node.n_expr)
+
+        elif isinstance(n_node, (Action, Switch_Statement)):
+            if n_node.n_expr:
+                self.add_uses(vertex, n_node.n_expr)
+
+        elif isinstance(n_node, While_Statement):
+            self.add_uses(vertex, n_node.n_guard)
+
+        elif isinstance(n_node, General_For_Statement):
+            self.add_uses(vertex, n_node.n_expr)
+            self.add_target(vertex, n_node.n_ident)
+
+        elif isinstance(n_node, Parallel_For_Statement):
+            self.add_uses(vertex, n_node.n_range)
+            if n_node.n_workers:
+                self.add_uses(vertex, n_node.n_workers)
+            self.add_target(vertex, n_node.n_ident)
+
+        elif isinstance(n_node, (Global_Statement,
+                                 Persistent_Statement)):
+            for n_name in n_node.l_names:
+                self.add_target(vertex, n_name)
+                self.static |= 1 << self.var_id[str(n_name)]
+
+        elif isinstance(n_node, Try_Statement):
+            if n_node.n_ident:
+                self.add_target(vertex, n_node.n_ident)
+
+
+def liveness(du):
+    """ Computes live variables
+
+    Returns (live_before, live_after) for each vertex. Output
+    parameters are live at the end of the function. Updates (x(i) =
+    ...) do not kill a variable, since the rest of it is still
+    there.
+    """
+    assert isinstance(du, Def_Use)
+
+    problem = Dataflow_Problem(du.graph,
+                               forwards = False,
+                               may      = True)
+    problem.gen      = du.uses
+    problem.kill     = du.defs
+    problem.boundary = du.outputs
+
+    return problem.solve(du.graph.get_named_vertex("end"))
+
+
+class Reaching_Definitions:
+    """ Computes reaching definitions
+
+    Each assignment to a variable is a definition. In addition there
+    is one definition for each variable at the start of the function:
+    for input parameters it means the variable is set by the caller;
+    for everything else it means the variable is not (yet) defined.
+    """
+    def __init__(self, du):
+        assert isinstance(du, Def_Use)
+
+        graph = du.graph
+        v_start = graph.get_named_vertex("start")
+
+        self.du = du
+        self.definitions = []
+        # (vertex, variable id) for each definition
+
+        self.undefined = 0
+        # The bitset of all the initial "not yet defined" definitions
+
+        problem = Dataflow_Problem(graph,
+                                   forwards = True,
+                                   may      = True)
+
+        by_variable = [0] * len(du.variables)
+        for var in range(len(du.variables)):
+            bit = 1 << len(self.definitions)
+            self.definitions.append((v_start, var))
+            problem.gen[v_start] |= bit
+            by_variable[var] |= bit
+            if not du.inputs & (1 << var):
+                self.undefined |= bit
+
+        for vertex in range(graph.count_vertices()):
+            for var in bits(du.defs[vertex] | du.updates[vertex]):
+                bit = 1 << len(self.definitions)
+                self.definitions.append((vertex, var))
+                problem.gen[vertex] |= bit
+                by_variable[var] |= bit
+
+        # A definition kills all other definitions of the same
+        # variable
+        for vertex in range(graph.count_vertices()):
+            if vertex == v_start:
+                continue
+            for var in bits(du.defs[vertex] | du.updates[vertex]):
+                problem.kill[vertex] |= by_variable[var]
+            problem.kill[vertex] &= ~problem.gen[vertex]
+
+        self.by_variable = by_variable
+        self.before, self.after = problem.solve(v_start)
+
+    def reaching(self, vertex, var):
+        """ Returns the bitset of definitions of var reaching vertex """
+        return self.before[vertex] & self.by_variable[var]
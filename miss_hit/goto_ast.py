@@ -32,6 +32,7 @@
 # Be advised: this is extremely incomplete and only enough for the MVP
 # for the MH BMC project. To be completed in the future.
 
+import json
 from abc import ABCMeta, abstractmethod
 
 
@@ -55,6 +56,13 @@ class GOTO_Symbol_Table:
         return {"symbolTable" : {name: self.stab[name].to_json()
                                  for name in self.stab}}
 
+    def write_json(self, fd):
+        # Same as to_json, but streamed into the given file in compact
+        # form; see JSON_Writer
+        writer = JSON_Writer(fd)
+        writer.write_symbol_table(self)
+        writer.flush()
+
 
 class Node(metaclass=ABCMeta):
     @abstractmethod
@@ -127,6 +135,14 @@ class Symbol(Node):
         if self.value is not None:
             rv["value"] = self.value.to_json()
 
+        rv.update(self.json_attributes())
+        return rv
+
+    def json_attributes(self):
+        # Returns the JSON for everything except the name, mode, type
+        # and value
+        rv = {}
+
         if self.location:
             # TODO: Source location
             pass
@@ -177,6 +193,120 @@ class Symbol(Node):
         return rv
 
 
+class JSON_Writer:
+    """ Compact, streaming JSON output for goto ASTs
+
+    This produces the same JSON as the to_json methods, but without
+    building the intermediate dictionaries or any whitespace, and
+    without recursion (so arbitrarily deep expressions work). Output
+    is written to fd (anything with a write method) in chunks.
+
+    Types tend to be shared by many nodes (e.g. every expression has
+    a SignedBV_Type), so the text for each Type object is produced
+    only once and then re-used.
+    """
+    FLUSH_THRESHOLD = 4096
+
+    def __init__(self, fd):
+        self.fd      = fd
+        self.buffer  = []
+        self.strings = {}
+        # Cache of encoded strings
+        self.types   = {}
+        # Cache of encoded types, by id. We keep the type itself as
+        # well, so that the id cannot be re-used.
+
+    def quote(self, value):
+        assert isinstance(value, str)
+        if value not in self.strings:
+            self.strings[value] = json.dumps(value)
+        return self.strings[value]
+
+    def flush(self):
+        if self.buffer:
+            self.fd.write("".join(self.buffer))
+            self.buffer = []
+
+    def write_symbol_table(self, gst):
+        assert isinstance(gst, GOTO_Symbol_Table)
+
+        self.buffer.append('{"symbolTable":{')
+        for num, name in enumerate(gst.stab):
+            if num:
+                self.buffer.append(",")
+            self.buffer.append(self.quote(name) + ":")
+            self.write_symbol(gst.stab[name])
+        self.buffer.append("}}")
+
+    def write_symbol(self, sym):
+        assert isinstance(sym, Symbol)
+        assert sym.name is not None
+
+        self.buffer.append('{"name":%s,"mode":"C"' % self.quote(sym.name))
+        if sym.typ is not None:
+            self.buffer.append(',"type":')
+            self.encode(sym.typ, self.buffer)
+        if sym.value is not None:
+            self.buffer.append(',"value":')
+            self.encode(sym.value, self.buffer)
+        for key, value in sym.json_attributes().items():
+            self.buffer.append(",%s:%s" % (self.quote(key),
+                                           self.quote(value)
+                                           if isinstance(value, str)
+                                           else json.dumps(value)))
+        self.buffer.append("}")
+
+    def encode_type(self, typ):
+        assert isinstance(typ, Type)
+
+        if id(typ) not in self.types:
+            out = []
+            self.encode(typ, out, shared=False)
+            self.types[id(typ)] = (typ, "".join(out))
+        return self.types[id(typ)][1]
+
+    def encode(self, irep, out, shared=True):
+        # Append the JSON text for irep to out. If out is our buffer
+        # we also flush as we go.
+        assert isinstance(irep, Irep)
+
+        stack = [irep]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                out.append(item)
+                continue
+            elif isinstance(item, Type) and (shared or item is not irep):
+                out.append(self.encode_type(item))
+                continue
+
+            out.append('{"id":%s' % self.quote(item.id_str))
+
+            # Push the remaining parts in reverse order
+            stack.append("}")
+            if item.named_sub:
+                stack.append("}")
+                parts = []
+                for key, value in item.named_sub.items():
+                    parts.append(",%s:" % self.quote(key))
+                    parts.append(value)
+                parts[0] = ',"namedSub":{' + parts[0][1:]
+                stack.extend(reversed(parts))
+            if item.sub:
+                stack.append("]")
+                parts = []
+                for value in item.sub:
+                    parts.append(",")
+                    parts.append(value)
+                parts[0] = ',"sub":['
+                stack.extend(reversed(parts))
+
+            if out is self.buffer and \
+               len(out) >= JSON_Writer.FLUSH_THRESHOLD:
+                self.flush()
+                out = self.buffer
+
+
 class Irep(Node):
     def __init__(self, id_str):
         assert isinstance(id_str, str)
@@ -367,7 +497,6 @@ class Code_Return(Code):
 
 def sanity_test():
     # pylint: disable=import-outside-toplevel
-    import json
     from pprint import pprint
 
     sym_main = Symbol("main", "main")
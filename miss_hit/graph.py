@@ -26,52 +26,46 @@
 
 # A simple graph library that we use to build e.g. the CFG
 
-import os
+import array
 
 from miss_hit_core.errors import ICE
 
 
-class Vertex_Root:
-    def __init__(self, graph, name=None):
-        assert isinstance(graph, Graph)
-        assert name is None or isinstance(name, str)
+class Compact_Graph:
+    """ Directed graph using integer vertex ids
 
-        self.graph = graph
-        self.uid = graph.get_next_uid()
-        self.out_edges = set()
-        self.in_edges = set()
-        self.name = name
+    Vertices are the integers 0..n-1; the name and data (e.g. an AST
+    node) of each vertex are kept in lists, and edges are kept in
+    per-vertex arrays of successors and predecessors. All algorithms
+    are iterative, so they work for graphs of any size.
 
-        # Register vertex with host graph
-        self.graph.vertices.add(self)
+    Adding an edge searches the successor array for duplicates, which
+    is cheap when (as in the CFG) each vertex only has a few
+    successors. Graphs with a large fan-out should deal with this
+    themselves (see Call_Graph).
+    """
+    def __init__(self):
+        self.names = {}
+        self.labels = []
+        self.data = []
+        self.succ = []
+        self.pred = []
 
-        # Register named vertex
+    def add_vertex(self, name=None, data=None):
+        """ Create a new vertex, returning its id """
+        assert name is None or isinstance(name, str)
+
+        vid = len(self.succ)
         if name:
-            if name in graph.names:
+            if name in self.names:
                 raise ICE("attempted to create named vertex %s that"
                           " already exists" % name)
-            self.graph.names[name] = self
-
-    def dot_label(self):
-        if self.name:
-            return self.name
-        else:
-            return "vertex %u" % self.uid
-
-    def __lt__(self, other):
-        """Comparison for sorting vertices"""
-        return self.uid < other.uid
-
-
-class Graph:
-    def __init__(self):
-        self.vertices = set()
-        self.names = {}
-        self.uid_counter = 0
-
-    def get_next_uid(self):
-        self.uid_counter += 1
-        return self.uid_counter
+            self.names[name] = vid
+        self.labels.append(name)
+        self.data.append(data)
+        self.succ.append(array.array("I"))
+        self.pred.append(array.array("I"))
+        return vid
 
     def get_named_vertex(self, name):
         assert isinstance(name, str)
@@ -84,75 +78,203 @@ class Graph:
 
     def add_edge(self, src, dst):
         """ Add src -> dst edge, if it does not exist yet """
-        assert isinstance(src, Vertex_Root)
-        assert isinstance(dst, Vertex_Root)
-        assert src.graph == self
-        assert dst.graph == self
+        assert 0 <= src < len(self.succ)
+        assert 0 <= dst < len(self.succ)
 
-        src.out_edges.add(dst)
-        dst.in_edges.add(src)
+        if dst not in self.succ[src]:
+            self.succ[src].append(dst)
+            self.pred[dst].append(src)
 
-    def remove_edge(self, src, dst):
-        """ Removes src -> dst edge, if it exists """
-        assert isinstance(src, Vertex_Root)
-        assert isinstance(dst, Vertex_Root)
-        assert src.graph == self
-        assert dst.graph == self
+    def count_vertices(self):
+        return len(self.succ)
+
+    def count_edges(self):
+        return sum(map(len, self.succ))
 
-        if dst in src.out_edges:
-            src.out_edges.remove(dst)
-            dst.in_edges.remove(src)
+    def dot_label(self, vid):
+        if self.labels[vid]:
+            return self.labels[vid]
+        elif self.data[vid] is not None:
+            return self.data[vid].__class__.__name__
+        else:
+            return "vertex %u" % vid
 
     def debug_write_dot(self, filename):
         with open(filename + ".dot", "w", encoding="UTF-8") as fd:
             fd.write("digraph G {\n")
-            for vert in sorted(self.vertices):
+            for vid in range(len(self.succ)):
                 fd.write("  %u [label=\"%s\"];\n" %
-                         (vert.uid,
-                          vert.dot_label()))
+                         (vid, self.dot_label(vid)))
             fd.write("\n")
-            for src in sorted(self.vertices):
-                for dst in sorted(src.out_edges):
-                    fd.write("  %u -> %u;\n" %
-                             (src.uid, dst.uid))
+            for src, l_dst in enumerate(self.succ):
+                for dst in sorted(l_dst):
+                    fd.write("  %u -> %u;\n" % (src, dst))
             fd.write("}\n")
 
-    def debug_write_pdf(self, filename):  # pragma: no cover
-        self.debug_write_dot(filename)
-        os.system("dot -Tpdf -o%s.pdf %s.dot" % (filename, filename))
-
-    def count_vertices(self):
-        return len(self.vertices)
-
-    def count_edges(self):
-        return sum(len(v.out_edges) for v in self.vertices)
+    def reachable(self, roots):
+        """ Returns a bytearray, marking all vertices reachable from roots """
+        rv = bytearray(len(self.succ))
+        todo = []
+        for vid in roots:
+            if not rv[vid]:
+                rv[vid] = 1
+                todo.append(vid)
+        while todo:
+            for dst in self.succ[todo.pop()]:
+                if not rv[dst]:
+                    rv[dst] = 1
+                    todo.append(dst)
+        return rv
+
+    def strongly_connected_components(self):
+        """ Returns the list of SCCs (each a list of vertices)
+
+        This is Tarjan's algorithm, without recursion. The components
+        are returned in reverse topological order, i.e. a component
+        comes before all components that can reach it.
+        """
+        n_vertices = len(self.succ)
+        index = [-1] * n_vertices
+        lowlink = [0] * n_vertices
+        on_stack = bytearray(n_vertices)
+        stack = []
+        rv = []
+        counter = 0
+
+        for root in range(n_vertices):
+            if index[root] >= 0:
+                continue
+
+            # Each frame is (vertex, position in its successor list)
+            work = [(root, 0)]
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+
+            while work:
+                vid, pos = work[-1]
+                l_succ = self.succ[vid]
+                if pos < len(l_succ):
+                    work[-1] = (vid, pos + 1)
+                    dst = l_succ[pos]
+                    if index[dst] < 0:
+                        index[dst] = lowlink[dst] = counter
+                        counter += 1
+                        stack.append(dst)
+                        on_stack[dst] = 1
+                        work.append((dst, 0))
+                    elif on_stack[dst]:
+                        lowlink[vid] = min(lowlink[vid], index[dst])
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[vid])
+                if lowlink[vid] == index[vid]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component.append(member)
+                        if member == vid:
+                            break
+                    rv.append(component)
+
+        return rv
+
+    def reverse_postorder(self, roots, backwards=False):
+        """ Returns the vertices reachable from roots in reverse post-order
+
+        If backwards is set, edges are followed in the other direction
+        (i.e. this gives the reverse post-order of the reversed graph).
+        Vertices not reachable from any root are not included.
+
+        Edges are explored last to first, so that where there is a
+        choice the target of the first edge comes first. For the CFG
+        this means the body of a loop comes before the code after it.
+        """
+        l_next = self.pred if backwards else self.succ
+        order = []
+        seen = bytearray(len(self.succ))
+        for root in roots:
+            if seen[root]:
+                continue
+            seen[root] = 1
+            work = [(root, 0)]
+            while work:
+                vid, pos = work[-1]
+                if pos < len(l_next[vid]):
+                    work[-1] = (vid, pos + 1)
+                    dst = l_next[vid][-1 - pos]
+                    if not seen[dst]:
+                        seen[dst] = 1
+                        work.append((dst, 0))
+                else:
+                    work.pop()
+                    order.append(vid)
+        order.reverse()
+        return order
+
+    def transitive_closure(self):
+        """ Returns, for each vertex, the set of reachable vertices
+
+        Each set is an int used as a bitset (bit n set means vertex n
+        is reachable); a vertex can always reach itself. We compute
+        this once per SCC, in reverse topological order, so that each
+        component just combines the results of its successors.
+        """
+        rv = [0] * len(self.succ)
+        for component in self.strongly_connected_components():
+            reach = 0
+            for vid in component:
+                reach |= 1 << vid
+            for vid in component:
+                for dst in self.succ[vid]:
+                    reach |= rv[dst]
+            for vid in component:
+                rv[vid] = reach
+        return rv
 
 
 def sanity_check():
-    class Debug_Vertex(Vertex_Root):
-        pass
-
-    graph = Graph()
+    graph = Compact_Graph()
 
-    v_start = Debug_Vertex(graph, "start")
-    v_0 = Debug_Vertex(graph)
-    v_end = Debug_Vertex(graph, "end")
+    v_start = graph.add_vertex("start")
+    v_loop = graph.add_vertex()
+    v_body = graph.add_vertex()
+    v_end = graph.add_vertex("end")
+    v_dead = graph.add_vertex("dead")
 
     # Sanity check graph names work
     assert v_start == graph.get_named_vertex("start")
 
-    graph.add_edge(v_start, v_0)
-    graph.add_edge(v_0, v_end)
+    graph.add_edge(v_start, v_loop)
+    graph.add_edge(v_loop, v_body)
+    graph.add_edge(v_body, v_loop)
+    graph.add_edge(v_loop, v_end)
+    graph.add_edge(v_dead, v_end)
+
+    # Adding an edge twice does nothing
+    graph.add_edge(v_loop, v_body)
 
     print("vertices: %u" % graph.count_vertices())
     print("edges:    %u" % graph.count_edges())
     graph.debug_write_dot("test1")
 
-    graph.remove_edge(v_start, v_0)
-
-    print("vertices: %u" % graph.count_vertices())
-    print("edges:    %u" % graph.count_edges())
-    graph.debug_write_dot("test2")
+    print("reachable from start: %s" %
+          [vid for vid, flag in enumerate(graph.reachable([v_start]))
+           if flag])
+    print("components: %s" %
+          [sorted(component)
+           for component in graph.strongly_connected_components()])
+    print("reverse post-order: %s" %
+          graph.reverse_postorder([v_start]))
+    print("reverse post-order (backwards): %s" %
+          graph.reverse_postorder([v_end], backwards=True))
+    print("closure: %s" %
+          [bin(reach) for reach in graph.transitive_closure()])
 
 
 if __name__ == "__main__":
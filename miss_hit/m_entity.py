@@ -24,6 +24,8 @@
 ##                                                                          ##
 ##############################################################################
 
+import os
+
 from miss_hit_core.m_entity_root import Entity
 from miss_hit_core.m_ast import *
 
@@ -176,6 +178,14 @@ class Package_Entity(Entity):
         self.class_directories = []
         self.children = {}
 
+        self.constructors = {}
+        # Class constructors from @ directories in this package
+        # (name -> File_Symbols)
+
+        self.symbols = {}
+        # Functions and classes from ordinary files in this package
+        # (name -> File_Symbols)
+
     def add_directory(self, pkgdir):
         assert isinstance(pkgdir, Package_Directory)
         self.directories.append(pkgdir)
@@ -221,7 +231,12 @@ class Global_Scope(Package_Directory):
 
 
 class Class_Directory(Directory):
-    pass
+    def __init__(self, dirname):
+        super().__init__(dirname)
+
+        self.methods = {}
+        # Functions in this directory that are not the constructor
+        # (name -> File_Symbols)
 
 
 class Private_Directory(Directory):
@@ -247,6 +262,10 @@ class Function_Entity(Entity):
         # case the decclaration refers to the signature in the main
         # class file, and the definition refers to the separate body.
 
+    def dump(self):
+        print("Function Entity (%s)" % self.name)
+        print("  declaration: %s" % self.n_declaration.loc())
+
 
 class Class_Entity(Entity):
     def __init__(self, n_classdef):
@@ -265,3 +284,279 @@ class Class_Entity(Entity):
     def dump(self):
         print("Class Entity (%s)" % self.name)
         print("  definition: %s" % self.n_definition.loc())
+
+
+##############################################################################
+# Project index
+##############################################################################
+
+class File_Symbols:
+    # The externally visible symbols contributed by a single file,
+    # along with where that file lives in the MATLAB path. These are
+    # produced for each file by sem_pass_1 (i.e. in the worker
+    # processes) and later merged into one Project_Index.
+    def __init__(self, filename, dirname, path_index, packages):
+        assert isinstance(filename, str)
+        assert isinstance(dirname, str)
+        assert isinstance(path_index, int) and path_index >= 0
+        assert isinstance(packages, list)
+
+        self.filename = filename
+        # The name of the file, as given to us
+
+        self.dirname = dirname
+        # The absolute directory containing this file
+
+        self.path_index = path_index
+        # Position of the directory (on the entry point's source path)
+        # this file was found in. Lower is searched first.
+
+        self.packages = []
+        self.class_directory = None
+        self.in_private = False
+        for item in packages:
+            if item.startswith("+"):
+                self.packages.append(item[1:])
+            elif item.startswith("@"):
+                self.class_directory = item[1:]
+            elif item == "private":
+                self.in_private = True
+            else:
+                raise ICE("unexpected directory %s" % item)
+        # The package (e.g. ["foo", "bar"] for +foo/+bar), the class
+        # directory (if any), and if we're in a private directory.
+
+        self.name = None
+        self.kind = None
+        # Name and kind ("function" or "class") of the primary entity
+        # defined by this file (if any)
+
+        self.entity = None
+        # The primary entity itself. Note that this is not available
+        # for symbols loaded from an index cache.
+
+        self.functions = []
+        # All functions in this file, as tuples (name, line, column,
+        # names called). The first item is the primary entity (for
+        # classes and scripts this is a pseudo function).
+
+        self.is_script = False
+
+    def set_entity(self, entity):
+        assert isinstance(entity, (Function_Entity, Class_Entity))
+        self.entity = entity
+        self.name   = entity.name
+        self.kind   = ("class"
+                       if isinstance(entity, Class_Entity)
+                       else "function")
+
+    def set_functions(self, functions, is_script):
+        assert isinstance(functions, list)
+        assert isinstance(is_script, bool)
+        self.functions = functions
+        self.is_script = is_script
+
+    def to_json(self):
+        # The entity is not saved, since it refers to the parse tree
+        return {"filename"   : self.filename,
+                "dirname"    : self.dirname,
+                "path_index" : self.path_index,
+                "packages"   : self.packages,
+                "class"      : self.class_directory,
+                "private"    : self.in_private,
+                "name"       : self.name,
+                "kind"       : self.kind,
+                "script"     : self.is_script,
+                "functions"  : self.functions}
+
+    @staticmethod
+    def from_json(blob):
+        assert isinstance(blob, dict)
+
+        rv = File_Symbols(blob["filename"],
+                          blob["dirname"],
+                          blob["path_index"],
+                          [])
+        rv.packages        = blob["packages"]
+        rv.class_directory = blob["class"]
+        rv.in_private      = blob["private"]
+        rv.name            = blob["name"]
+        rv.kind            = blob["kind"]
+        rv.is_script       = blob["script"]
+        rv.functions       = [tuple(item) for item in blob["functions"]]
+        return rv
+
+    def package_name(self):
+        return ".".join(self.packages)
+
+    def precedence(self):
+        # If two files provide the same symbol, the one with the
+        # smaller precedence wins. Ties (i.e. two definitions in the
+        # same path entry) are resolved by filename, so that the
+        # result does not depend on the order in which files are
+        # processed.
+        return (self.path_index, self.filename)
+
+    def visibility_root(self):
+        # Functions in a private directory are only visible to the
+        # directory containing it (and to each other).
+        if self.in_private:
+            return os.path.dirname(self.dirname)
+        else:
+            return self.dirname
+
+
+class Project_Index:
+    # A symbol table for an entire entry point, built by merging the
+    # File_Symbols of all files. All lookups are dictionary lookups,
+    # performed in the precedence order documented in Scope. Note that
+    # items (1) to (5) are local to a file, and are not dealt with
+    # here.
+    def __init__(self):
+        self.packages = {"" : Package_Entity("")}
+        # All packages (by their dotted name). The global namespace
+        # is the package with the empty name.
+
+        self.directories = {}
+        # All package and class directories (dirname -> Directory)
+
+        self.private = {}
+        # Private functions, indexed by the directory they are
+        # visible from (dirname -> name -> File_Symbols)
+
+        self.class_directories = {}
+        # Class directories for each class, by dotted class name
+
+        self.files = []
+        # All File_Symbols merged into this index
+
+    def get_package(self, packages):
+        assert isinstance(packages, list)
+
+        name = ".".join(packages)
+        if name not in self.packages:
+            pkg = Package_Entity(packages[-1])
+            self.get_package(packages[:-1]).add_child_package(pkg)
+            self.packages[name] = pkg
+        return self.packages[name]
+
+    def get_directory(self, kind, dirname):
+        assert kind in (Package_Directory, Class_Directory)
+        assert isinstance(dirname, str)
+
+        if dirname not in self.directories:
+            self.directories[dirname] = kind(dirname)
+            if dirname in self.private:
+                self.link_private(self.directories[dirname])
+        return self.directories[dirname]
+
+    def link_private(self, directory):
+        assert isinstance(directory, Directory)
+
+        if directory.private_directory is None:
+            directory.set_private_directory(
+                Private_Directory(os.path.join(directory.dirname,
+                                               "private")))
+
+    @staticmethod
+    def add_symbol(table, name, fsym):
+        assert isinstance(table, dict)
+        assert isinstance(name, str)
+        assert isinstance(fsym, File_Symbols)
+
+        if name not in table or \
+           fsym.precedence() < table[name].precedence():
+            table[name] = fsym
+
+    def merge(self, fsym):
+        assert isinstance(fsym, File_Symbols)
+
+        pkg = self.get_package(fsym.packages)
+        self.files.append(fsym)
+
+        if fsym.in_private:
+            table = self.private.setdefault(fsym.visibility_root(), {})
+            if fsym.visibility_root() in self.directories:
+                self.link_private(
+                    self.directories[fsym.visibility_root()])
+
+        elif fsym.class_directory:
+            clsdir = self.get_directory(Class_Directory, fsym.dirname)
+            if clsdir not in pkg.class_directories:
+                pkg.add_class_directory(clsdir)
+            cls_name = ".".join(fsym.packages + [fsym.class_directory])
+            self.class_directories.setdefault(cls_name, [])
+            if clsdir not in self.class_directories[cls_name]:
+                self.class_directories[cls_name].append(clsdir)
+
+            if fsym.name == fsym.class_directory:
+                table = pkg.constructors
+            else:
+                table = clsdir.methods
+
+        else:
+            pkgdir = self.get_directory(Package_Directory, fsym.dirname)
+            if pkgdir not in pkg.directories:
+                pkg.add_directory(pkgdir)
+            table = pkg.symbols
+
+        if fsym.name is not None:
+            self.add_symbol(table, fsym.name, fsym)
+
+    def resolve(self, context, name):
+        """ Resolve name, as seen from the file described by context
+
+        Returns the File_Symbols providing name, or None.
+        """
+        assert isinstance(context, File_Symbols)
+        assert isinstance(name, str)
+
+        # Fully qualified names only ever refer to packages
+        if "." in name:
+            pkg_name, name = name.rsplit(".", 1)
+            pkg = self.packages.get(pkg_name)
+            if pkg is None:
+                return None
+            return pkg.constructors.get(name) or pkg.symbols.get(name)
+
+        pkg = self.packages[""]
+
+        # (6) Private functions
+        private = self.private.get(context.visibility_root())
+        if private and name in private:
+            return private[name]
+
+        # (8) Class constructors in @ directories
+        if name in pkg.constructors:
+            return pkg.constructors[name]
+
+        # (11) Functions on the path
+        return pkg.symbols.get(name)
+
+    def dump(self):
+        print("Project index with %u package(s):" % len(self.packages))
+        for pkg_name in sorted(self.packages):
+            pkg = self.packages[pkg_name]
+            print("=== Package %s ===" % (pkg_name or "(global)"))
+            for kind, table in (("constructor", pkg.constructors),
+                                ("symbol", pkg.symbols)):
+                for name in sorted(table):
+                    print("  %s %s from %s" % (kind,
+                                               name,
+                                               table[name].filename))
+        for cls_name in sorted(self.class_directories):
+            print("=== Class directory %s ===" % cls_name)
+            for clsdir in self.class_directories[cls_name]:
+                for name in sorted(clsdir.methods):
+                    print("  method %s from %s" %
+                          (name,
+                           clsdir.methods[name].filename))
+        for owner in sorted(self.private):
+            table = self.private[owner]
+            if not table:
+                continue
+            print("=== Private functions of %s ===" %
+                  os.path.relpath(owner))
+            for name in sorted(table):
+                print("  private %s from %s" % (name,
+                                                table[name].filename))
@@ -44,6 +44,111 @@ def treewalk(n_root, function):
     n_root.visit(None, Visitor(), "Root")
 
 
+def root_identifier(n_name):
+    # Returns the identifier at the root of a name, e.g. for a.b(c).d
+    # this is a.
+    assert isinstance(n_name, Name)
+
+    while not isinstance(n_name, Identifier):
+        if isinstance(n_name, (Reference, Cell_Reference)):
+            n_name = n_name.n_ident
+        elif isinstance(n_name, (Selection,
+                                 Dynamic_Selection,
+                                 Superclass_Reference)):
+            n_name = n_name.n_prefix
+        else:
+            return None
+
+    return n_name
+
+
+def collect_calls(n_body, variables):
+    # Returns the sorted list of names in the given body that could
+    # be calls to functions (or classes). Since we do not yet know
+    # what is an array index and what is a function call, we
+    # consider all names that are not variables. Names that cannot be
+    # found in the project index later on are simply ignored.
+    assert isinstance(n_body, Node)
+    assert isinstance(variables, set)
+
+    variables = set(variables)
+    candidates = set()
+
+    for node, n_parent, relation in n_body.pre_order():
+        if isinstance(node, Simple_Assignment_Statement):
+            l_targets = [node.n_lhs]
+        elif isinstance(node, Compound_Assignment_Statement):
+            l_targets = node.l_lhs
+        elif isinstance(node, (Global_Statement, Persistent_Statement)):
+            l_targets = node.l_names
+        elif isinstance(node, (For_Loop_Statement, Try_Statement)) and \
+             node.n_ident:
+            l_targets = [node.n_ident]
+
+        elif isinstance(node, Identifier) and \
+             node.t_ident.kind != "IDENTIFIER":
+            # Things like end or ~
+            continue
+        elif isinstance(node, Name) and \
+             node.is_simple_dotted_name() and \
+             not (isinstance(n_parent, Selection) and
+                  relation in ("Prefix", "Field")):
+            # We only consider complete names, so for a.b.c we do not
+            # add a.b or c.
+            candidates.add(str(node))
+            continue
+        else:
+            continue
+
+        for n_target in l_targets:
+            n_root = root_identifier(n_target)
+            if n_root:
+                variables.add(str(n_root))
+
+    return sorted(name
+                  for name in candidates
+                  if name.split(".", 1)[0] not in variables)
+
+
+def extract_functions(n_cu):
+    # Produces the function list of File_Symbols for the given
+    # compilation unit. The first item is the primary entity (the
+    # main function, the class, or the script body), followed by all
+    # other functions defined in the file.
+    assert isinstance(n_cu, Compilation_Unit)
+
+    rv = []
+
+    def add(name, location, calls):
+        rv.append((name, location.line, location.col_start, calls))
+
+    if isinstance(n_cu, Script_File):
+        add(os.path.splitext(n_cu.name)[0],
+            n_cu.loc() if not n_cu.n_statements.l_statements
+            else n_cu.n_statements.l_statements[0].loc(),
+            collect_calls(n_cu.n_statements, set()))
+
+    elif isinstance(n_cu, Class_File):
+        # Any method could be called on an object of this class, so
+        # we treat the class as calling all of its methods.
+        add(str(n_cu.n_classdef.n_name),
+            n_cu.n_classdef.loc(),
+            sorted(set(str(node.n_sig.n_name)
+                       for node, _, _ in n_cu.pre_order()
+                       if isinstance(node, Function_Definition))))
+
+    for node, _, _ in n_cu.pre_order():
+        if isinstance(node, Function_Definition):
+            variables = set(str(n_param)
+                            for n_param in (node.n_sig.l_inputs +
+                                            node.n_sig.l_outputs))
+            add(str(node.n_sig.n_name),
+                node.loc(),
+                collect_calls(node.n_body, variables))
+
+    return rv
+
+
 class Semantic_Analysis_Pass_1:
     def __init__(self, mh):
         assert isinstance(mh, Message_Handler)
@@ -51,6 +156,14 @@ class Semantic_Analysis_Pass_1:
         self.scope = Scope()
         self.pkg   = []
 
+        self.entity = None
+        # The primary (externally visible) entity of the compilation
+        # unit, if any
+
+        self.symbols = None
+        # The File_Symbols for the project index, if we have an entry
+        # point
+
     def sem_compilation_unit(self, n_cu):
         assert isinstance(n_cu, Compilation_Unit)
 
@@ -59,7 +172,7 @@ class Semantic_Analysis_Pass_1:
         if isinstance(n_cu, Class_File):
             self.sem_class_file(n_cu)
         elif isinstance(n_cu, Function_File):
-            pass
+            self.sem_function_file(n_cu)
         elif isinstance(n_cu, Script_File):
             pass
         else:
@@ -71,6 +184,16 @@ class Semantic_Analysis_Pass_1:
 
         e_cls = Class_Entity(n_cf.n_classdef)
         self.scope.register(self.mh, e_cls)
+        self.entity = e_cls
+
+    def sem_function_file(self, n_ff):
+        assert isinstance(n_ff, Function_File)
+
+        # Only the first function is visible outside this file
+        n_fdef = n_ff.l_functions[0]
+        e_fun = Function_Entity(n_fdef.n_sig)
+        e_fun.n_definition = n_fdef
+        self.entity = e_fun
 
 
 def sem_pass_1(mh, entrypoint, n_cu):
@@ -86,11 +209,14 @@ def sem_pass_1(mh, entrypoint, n_cu):
     item = os.path.normpath(n_cu.dirname)
     if entrypoint:
         best_match = None
-        for path in cfg_tree.get_source_path(entrypoint):
+        best_index = None
+        for path_index, path in enumerate(
+                cfg_tree.get_source_path(entrypoint)):
             search_item = os.path.normpath(path)
             if item.startswith(search_item):
                 if best_match is None or len(best_match) < len(search_item):
                     best_match = search_item
+                    best_index = path_index
         if best_match is None:
             raise ICE("could not find %s on path" % n_cu.dirname)
         packages = item[len(best_match) + 1:]
@@ -147,4 +273,17 @@ def sem_pass_1(mh, entrypoint, n_cu):
                          "illegal_directory_structure")
                 return None
 
+        # Record what this file contributes to the project index
+        # (MATLAB embedded in Simulink models cannot be called from
+        # anywhere else).
+        if n_cu.name.endswith(".m"):
+            rv.symbols = File_Symbols(n_cu.loc().filename,
+                                      os.path.normpath(n_cu.dirname),
+                                      best_index,
+                                      packages)
+            if rv.entity is not None:
+                rv.symbols.set_entity(rv.entity)
+            rv.symbols.set_functions(extract_functions(n_cu),
+                                     isinstance(n_cu, Script_File))
+
     return rv
@@ -29,78 +29,92 @@
 # the option must be in a specific class tree.
 
 import inspect
-from copy import copy
 
 from miss_hit_core import m_types
 from miss_hit import graph
 
 
 def build_masks():
-    cls_graph = graph.Graph()
-    nv_map = {}
-
-    rv = {
-        "leafs" : set(),
-        "mask"  : {}
-    }
+    # The lattice of possible types is the powerset of the leaf types
+    # in m_types, which we represent as an int: bit n is set if the
+    # n-th leaf (in alphabetical order) is possible. Here we compute
+    # for each type the mask of leaves below it.
+    cls_graph = graph.Compact_Graph()
 
     for name, c in inspect.getmembers(m_types, inspect.isclass):
         if not issubclass(c, m_types.Type):  # pragma: no cover
             continue
-        nv_map[name] = graph.Vertex_Root(cls_graph, name)
-    for name, c in inspect.getmembers(m_types, inspect.isclass):
+        cls_graph.add_vertex(name, c)
+    for vid, c in enumerate(cls_graph.data):
         for base in c.__bases__:
             if issubclass(base, m_types.Type):
-                cls_graph.add_edge(nv_map[base.__name__],
-                                   nv_map[name])
-
-    # Get a set of leaf nodes (since these are the only useful results
-    # of inference)
-    for vrt in cls_graph.vertices:
-        if not vrt.out_edges:
-            rv["leafs"].add(vrt.name)
-
-    # Get mask for each type. Not ideal, ideally we have a transitive
-    # closure algorithm in the graph class, but this works for now.
-    def add_mask(base, vrt):
-        rv["mask"][base].add(vrt.name)
-        for child in vrt.out_edges:
-            add_mask(base, child)
-    for vrt in cls_graph.vertices:
-        rv["mask"][vrt.name] = set()
-        add_mask(vrt.name, vrt)
-
-        # Reduce mask by just including the leaves
-        rv["mask"][vrt.name] &= rv["leafs"]
-
-    return rv
+                cls_graph.add_edge(cls_graph.get_named_vertex(base.__name__),
+                                   vid)
+
+    # Get the leaf nodes (since these are the only useful results of
+    # inference), and number them
+    leafs = [vid
+             for vid, l_succ in enumerate(cls_graph.succ)
+             if not l_succ]
+    leaf_bits = 0
+    for vid in leafs:
+        leaf_bits |= 1 << vid
+
+    # The mask for each type are the leaves reachable from it
+    closure = cls_graph.transitive_closure()
+    masks = {}
+    for vid, reach in enumerate(closure):
+        mask = 0
+        for bit, leaf in enumerate(leafs):
+            if reach & (1 << leaf):
+                mask |= 1 << bit
+        masks[cls_graph.data[vid]] = mask
+
+    return [cls_graph.data[vid] for vid in leafs], masks
 
 
 class Type_Inference:
-    MASKS = build_masks()
+    LEAFS, MASKS = build_masks()
+    # The leaf types, and for each type (class) in m_types the mask
+    # of leaf types it contains
+
+    ALL = (1 << len(LEAFS)) - 1
 
-    def __init__(self):
-        self.options = copy(Type_Inference.MASKS["leafs"])
+    def __init__(self, options=ALL):
+        assert isinstance(options, int)
+        self.options = options
 
     def is_resolved(self):
-        return len(self.options) == 1
+        return self.options != 0 and self.options & (self.options - 1) == 0
 
     def is_conflicted(self):
-        return len(self.options) == 0
+        return self.options == 0
 
     def assert_positive(self, choice):
-        assert issubclass(choice, m_types.Type)
-        self.options &= Type_Inference.MASKS["mask"][choice.__name__]
+        self.options &= Type_Inference.MASKS[choice]
 
     def assert_negative(self, choice):
-        assert issubclass(choice, m_types.Type)
-        self.options -= Type_Inference.MASKS["mask"][choice.__name__]
+        self.options &= ~Type_Inference.MASKS[choice]
+
+    def join(self, other):
+        # Merge the options from another path (e.g. after an if
+        # statement)
+        assert isinstance(other, Type_Inference)
+        self.options |= other.options
+
+    def get_options(self):
+        # Returns the list of leaf types that are still possible
+        return [cls
+                for bit, cls in enumerate(Type_Inference.LEAFS)
+                if self.options & (1 << bit)]
 
     def dump(self):
         print("Type inference")
         print("  resolved: %s" % self.is_resolved())
         print("  conflict: %s" % self.is_conflicted())
-        print("  options:  %s" % ", ".join(sorted(self.options)))
+        print("  options:  %s" % ", ".join(sorted(cls.__name__
+                                                  for cls in
+                                                  self.get_options())))
 
 
 def sanity_test():
@@ -24,13 +24,27 @@
 ##                                                                          ##
 ##############################################################################
 
+import io
 import os
 import json
+import hashlib
+import tempfile
+import functools
+import threading
 import subprocess
+import collections
+import concurrent.futures
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # Not available on Windows, so we cannot limit memory there
+    resource = None
 
 from miss_hit_core import command_line
 from miss_hit_core import work_package
 from miss_hit_core import m_ast
+from miss_hit_core.version import VERSION
 from miss_hit_core.errors import Message_Handler, Error, Location, ICE
 from miss_hit_core.m_lexer import MATLAB_Lexer
 from miss_hit_core.m_parser import MATLAB_Parser
@@ -53,10 +67,16 @@ def set_location(sym, loc):
     sym.named_sub["#source_location"] = sloc
 
 
+INTEGER_TYPE = goto_ast.SignedBV_Type(32)
+
+
 def make_type():
     # One of the key limitations of the MVP: we assume that everything
     # is a 32-bit signed integer.
-    return goto_ast.SignedBV_Type(32)
+    #
+    # Types are never modified once created, so we can share one
+    # object (which also means it is only serialised once).
+    return INTEGER_TYPE
 
 
 def compile_name(mh, gst, stab, n_name):
@@ -246,95 +266,443 @@ def compile_file(mh, n_tree):
     return gst
 
 
-def analyze(mh, new_filename, lexer, n_file):
-    assert isinstance(mh, Message_Handler)
-    assert isinstance(new_filename, str)
-    assert new_filename.endswith(".json_symtab")
-    assert isinstance(lexer, MATLAB_Lexer)
-    assert isinstance(n_file, m_ast.Function_File)
-
-    def fmt_value(trace_value):
-        assert trace_value["type"] == "int"
-        return trace_value["data"]
-
-    for n_fdef in n_file.l_functions:
-        function_name = str(n_fdef.n_sig.n_name)
-
-        cmd = ["cbmc",
-               new_filename,
-               "--json-ui",
-               "--function", function_name,
-               "--bounds-check",
+CBMC_CHECKS = ["--bounds-check",
                "--div-by-zero-check",
                "--signed-overflow-check",
                "--unsigned-overflow-check",
                "--float-overflow-check",
                "--nan-check"]
-        cbmc_result = subprocess.run(cmd,
-                                     check=False,
-                                     capture_output=True,
-                                     encoding="utf-8")
-        assert cbmc_result.stderr == ""
-
-        if cbmc_result.returncode == 0:
-            mh.info(n_fdef.loc(), "verification successful")
+
+
+def iter_json_array(fd, chunk_size=65536):
+    # Yields the items of a JSON array read from the given (text)
+    # file, as soon as each one is complete; so we do not need to
+    # keep all of the output of cbmc in memory. Items must be objects
+    # (which is all cbmc produces). We always read at least as much
+    # as we have pending, so that retrying an incomplete item is
+    # amortised linear in its size.
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    in_array = False
+
+    while True:
+        while pos < len(buf) and buf[pos] in " \t\r\n":
+            pos += 1
+
+        if pos < len(buf):
+            if not in_array:
+                if buf[pos] != "[":
+                    raise ValueError("expected JSON array")
+                in_array = True
+                pos += 1
+                continue
+            elif buf[pos] == "]":
+                return
+            elif buf[pos] == ",":
+                pos += 1
+                continue
+            try:
+                item, pos = decoder.raw_decode(buf, pos)
+                yield item
+                continue
+            except json.JSONDecodeError:
+                pass
+
+        chunk = fd.read(max(chunk_size, len(buf) - pos))
+        if not chunk:
+            raise ValueError("unexpected end of JSON array")
+        buf = buf[pos:] + chunk
+        pos = 0
+
+
+class CBMC_Job:
+    """ Verification of a single function with cbmc
+
+    These are created by the workers (which also write the symbol
+    table) and are run by the parent in the CBMC_Pool.
+    """
+    def __init__(self, filename, function_name, location, symtab, digest):
+        assert isinstance(filename, str)
+        assert isinstance(function_name, str)
+        assert isinstance(location, Location)
+        assert isinstance(symtab, str)
+        assert isinstance(digest, str)
+
+        self.filename      = filename
+        self.function_name = function_name
+        self.location      = location
+        self.symtab        = symtab
+        self.digest        = digest
+        # Hash of the part of the symbol table for this function, see
+        # function_digest
+
+    def flags(self):
+        return ["--json-ui",
+                "--function", self.function_name] + CBMC_CHECKS
+
+    def command(self):
+        return ["cbmc", self.symtab] + self.flags()
+
+
+def function_digest(gst, function_name):
+    # Returns a hash of all symbols that make up the given function:
+    # the function itself, and its parameters (which are all prefixed
+    # with its name). Since functions cannot call each other yet,
+    # this (and the cbmc flags) is all that determines the result of
+    # cbmc. Source locations are included, so the hash also changes
+    # if the function moves.
+    assert isinstance(gst, goto_ast.GOTO_Symbol_Table)
+    assert isinstance(function_name, str)
+
+    buf = io.StringIO()
+    writer = goto_ast.JSON_Writer(buf)
+    for name in sorted(gst.stab):
+        if name == function_name or \
+           name.startswith(function_name + "::") or \
+           name.startswith("__CPROVER_"):
+            writer.buffer.append(writer.quote(name) + ":")
+            writer.write_symbol(gst.stab[name])
+    writer.flush()
+
+    return hashlib.sha256(buf.getvalue().encode("utf-8")).hexdigest()
+
+
+class CBMC_Verdict:
+    def __init__(self, status, failures=None, message=None):
+        assert status in ("success", "failure", "timeout", "error")
+        assert failures is None or isinstance(failures, list)
+        assert message is None or isinstance(message, str)
+
+        self.status   = status
+        self.failures = failures or []
+        # List of (line, col_start, col_end, trace) for each failed
+        # property, where trace is a list of (lhs, value)
+        self.message  = message
+
+    def to_json(self):
+        return {"status"   : self.status,
+                "failures" : self.failures}
+
+    @staticmethod
+    def from_json(blob):
+        assert isinstance(blob, dict)
+        return CBMC_Verdict(
+            blob["status"],
+            [(line, col_start, col_end, [tuple(step) for step in trace])
+             for line, col_start, col_end, trace in blob["failures"]])
+
+
+class Result_Cache:
+    """ Verdicts of cbmc from previous runs
+
+    Each verdict is stored in its own file, named after the hash of
+    the cbmc version, the flags, and the function digest; so
+    unchanged functions do not need to be verified again. Timeouts
+    and errors are never cached.
+    """
+    def __init__(self, directory, cbmc_version):
+        assert isinstance(directory, str)
+        assert isinstance(cbmc_version, str)
+
+        self.directory    = directory
+        self.cbmc_version = cbmc_version
+        os.makedirs(self.directory, exist_ok=True)
+
+    def cache_file(self, job):
+        assert isinstance(job, CBMC_Job)
+
+        key = hashlib.sha256()
+        key.update(json.dumps([VERSION,
+                               self.cbmc_version,
+                               job.flags(),
+                               job.digest]).encode("utf-8"))
+        return os.path.join(self.directory, key.hexdigest() + ".json")
+
+    def lookup(self, job):
+        # Returns the cached CBMC_Verdict, or None
+        try:
+            with open(self.cache_file(job), "r", encoding="UTF-8") as fd:
+                return CBMC_Verdict.from_json(json.load(fd))
+        except (OSError, ValueError, KeyError, TypeError, AssertionError):
+            return None
+
+    def store(self, job, verdict):
+        assert isinstance(verdict, CBMC_Verdict)
+        if verdict.status not in ("success", "failure"):
+            return
+
+        # Write atomically, since another run might be reading the
+        # same entry
+        handle, tmp_name = tempfile.mkstemp(dir=self.directory,
+                                            prefix=".mh_",
+                                            suffix=".tmp")
+        try:
+            with os.fdopen(handle, "w", encoding="UTF-8") as fd:
+                json.dump(verdict.to_json(), fd)
+            os.replace(tmp_name, self.cache_file(job))
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+
+def summarise_results(results):
+    # Extract the failed properties and their counter-example traces
+    # from the result message of cbmc, so we can drop the rest.
+    def fmt_value(trace_value):
+        assert trace_value["type"] == "int"
+        return trace_value["data"]
+
+    rv = []
+    for item in results:
+        if item["status"] != "FAILURE":
             continue
 
-        cbmc_msg = json.loads(cbmc_result.stdout)
+        fail_loc = item["trace"][-1]
+        assert fail_loc["stepType"] == "failure"
+        assert fail_loc["property"] == "overflow.1"
+
+        orig_line = int(fail_loc["sourceLocation"]["line"])
+        orig_cols = fail_loc["sourceLocation"]["column"].split(":")
+
+        trace = []
+        for step in item["trace"][:-1]:
+            if step["internal"] or step["hidden"]:
+                continue
+            if step["stepType"] == "assignment":
+                trace.append((step["lhs"], fmt_value(step["value"])))
+
+        rv.append((orig_line, int(orig_cols[0]), int(orig_cols[1]), trace))
+
+    return rv
+
+
+def run_cbmc(job, timeout, memory_limit):
+    # Runs cbmc for the given job, and returns a CBMC_Verdict. This is
+    # executed on one of the threads of the CBMC_Pool; all the real
+    # work happens in the cbmc process.
+    assert isinstance(job, CBMC_Job)
+    assert timeout is None or timeout > 0
+    assert memory_limit is None or memory_limit > 0
+
+    def limit_memory():  # pragma: no cover
+        resource.setrlimit(resource.RLIMIT_AS,
+                           (memory_limit * 1024 * 1024,
+                            memory_limit * 1024 * 1024))
+
+    timed_out = threading.Event()
+
+    def kill(proc):
+        timed_out.set()
+        proc.kill()
+
+    # The pool threads only wait for cbmc, and the child only calls
+    # setrlimit before exec, so preexec_fn is safe here.
+    # pylint: disable=subprocess-popen-preexec-fn
+    with tempfile.TemporaryFile(mode="w+", encoding="utf-8") as err_fd:
+        with subprocess.Popen(job.command(),
+                              stdout=subprocess.PIPE,
+                              stderr=err_fd,
+                              encoding="utf-8",
+                              preexec_fn=(limit_memory
+                                          if memory_limit
+                                          else None)) as proc:
+            timer = None
+            if timeout:
+                timer = threading.Timer(timeout, kill, [proc])
+                timer.start()
+
+            failures = None
+            try:
+                for msg in iter_json_array(proc.stdout):
+                    if "result" in msg:
+                        if failures is not None:
+                            raise ICE("duplicate results")
+                        failures = summarise_results(msg["result"])
+            except ValueError:
+                # Truncated or broken output; we find out why below
+                pass
+            finally:
+                if timer:
+                    timer.cancel()
+
+        if timed_out.is_set():
+            return CBMC_Verdict("timeout",
+                                message=("cbmc timed out after %u seconds" %
+                                         timeout))
+        elif failures is None and proc.returncode == 0:
+            return CBMC_Verdict("error",
+                                message="cbmc did not produce a result")
+        elif failures is None:
+            err_fd.seek(0)
+            stderr = err_fd.read().strip()
+            return CBMC_Verdict("error",
+                                message=("cbmc failed (exit code %i)%s" %
+                                         (proc.returncode,
+                                          ": " + stderr.splitlines()[-1]
+                                          if stderr else "")))
+        elif failures:
+            return CBMC_Verdict("failure", failures)
+        else:
+            return CBMC_Verdict("success")
 
-        results = None
-        for msg in cbmc_msg:
-            if "result" in msg:
-                if results is None:
-                    results = msg["result"]
-                else:
-                    raise ICE("duplicate results")
-        if results is None:
-            raise ICE("result not found in cbmc output")
 
-        for item in results:
-            assert item["status"] == "FAILURE"
+def report_verdict(mh, job, verdict, context_line):
+    assert isinstance(mh, Message_Handler)
+    assert isinstance(job, CBMC_Job)
+    assert isinstance(verdict, CBMC_Verdict)
+    assert isinstance(context_line, list)
 
-            fail_loc = item["trace"][-1]
-            assert fail_loc["stepType"] == "failure"
-            assert fail_loc["property"] == "overflow.1"
+    if verdict.status == "success":
+        mh.info(job.location, "verification successful")
 
-            orig_file = fail_loc["sourceLocation"]["file"]
-            assert orig_file == lexer.filename
-            orig_line = int(fail_loc["sourceLocation"]["line"])
-            orig_cols = fail_loc["sourceLocation"]["column"].split(":")
-            orig_col_start = int(orig_cols[0])
-            orig_col_end   = int(orig_cols[1])
+    elif verdict.status in ("timeout", "error"):
+        mh.warning(job.location,
+                   "verification not completed: %s" % verdict.message)
 
+    else:
+        for line, col_start, col_end, trace in verdict.failures:
             loc = Location(
-                filename  = orig_file,
-                line      = orig_line,
-                col_start = orig_col_start,
-                col_end   = orig_col_end,
-                context   = lexer.context_line[orig_line - 1])
+                filename  = job.filename,
+                line      = line,
+                col_start = col_start,
+                col_end   = col_end,
+                context   = context_line[line - 1])
 
             mh.check(loc,
                      "operation saturates for some inputs",
                      "integer_overflow")
 
-            for trace in item["trace"][:-1]:
-                if trace["internal"] or trace["hidden"]:
-                    continue
-                if trace["stepType"] == "assignment":
-                    mh.info(loc,
-                            "counter-example trace: %s = %s" %
-                            (trace["lhs"],
-                             fmt_value(trace["value"])))
+            for lhs, value in trace:
+                mh.info(loc,
+                        "counter-example trace: %s = %s" % (lhs, value))
+
+
+class CBMC_Pool:
+    """ A bounded pool of cbmc processes
+
+    Jobs are submitted per file, as the workers finish compiling
+    them, and are run by a fixed number of threads that each wait for
+    one cbmc process at a time. Results are reported per file, in the
+    order the files were submitted.
+
+    While the worker processes are still compiling files they occupy
+    the CPUs as well, so until parsing_done is called we only run as
+    many cbmc processes as there are CPUs left over (but at least
+    one).
+    """
+    def __init__(self, mh, options, cache=None):
+        assert isinstance(mh, Message_Handler)
+        assert cache is None or isinstance(cache, Result_Cache)
+
+        self.mh       = mh
+        self.options  = options
+        self.cache    = cache
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers = options.cbmc_jobs)
+        self.pending  = collections.deque()
+        # (result, [(job, future)]) for each file not yet reported
+
+        if options.single:
+            parse_workers = 0
+        else:
+            parse_workers = os.cpu_count() or 1
+        self.slots = threading.BoundedSemaphore(options.cbmc_jobs)
+        self.held  = options.cbmc_jobs - max(1,
+                                             options.cbmc_jobs - parse_workers)
+        # Each cbmc process needs one of the slots; we hold on to some
+        # of them until parsing is done.
+        for _ in range(self.held):
+            # pylint: disable=consider-using-with
+            self.slots.acquire()
+
+    def submit(self, result):
+        assert isinstance(result, MH_BMC_Result)
+
+        futures = []
+        for job in result.jobs:
+            verdict = self.cache.lookup(job) if self.cache else None
+            if verdict:
+                future = concurrent.futures.Future()
+                future.set_result(verdict)
+            else:
+                future = self.executor.submit(self.run, job)
+                if self.cache:
+                    future.add_done_callback(
+                        functools.partial(self.store, job))
+            futures.append((job, future))
+        self.pending.append((result, futures))
+
+    def run(self, job):
+        # Called on a pool thread
+        with self.slots:
+            return run_cbmc(job,
+                            self.options.cbmc_timeout,
+                            self.options.cbmc_memory)
+
+    def parsing_done(self):
+        # Make all slots available for cbmc
+        for _ in range(self.held):
+            self.slots.release()
+        self.held = 0
+
+    def store(self, job, future):
+        # Called (on a pool thread) when cbmc for job has finished
+        if not future.cancelled() and future.exception() is None:
+            self.cache.store(job, future.result())
+
+    def report(self, block):
+        # Report all files (in order) whose jobs are complete. If block
+        # is set, we wait for all of them.
+        while self.pending:
+            result, futures = self.pending[0]
+            if not block and not all(future.done()
+                                     for _, future in futures):
+                return
+            self.pending.popleft()
+
+            self.mh.register_file(result.wp.filename)
+            try:
+                for job, future in futures:
+                    report_verdict(self.mh,
+                                   job,
+                                   future.result(),
+                                   result.context_line)
+            finally:
+                if not self.options.keep:
+                    os.unlink(result.symtab)
+            self.mh.finalize_file(result.wp.filename)
+
+    def shutdown(self):
+        # Anything still pending at this point is abandoned (because
+        # something went wrong), so do not start the remaining jobs.
+        for _, futures in self.pending:
+            for _, future in futures:
+                future.cancel()
+        self.parsing_done()
+        self.executor.shutdown(wait=True)
+        if not self.options.keep:
+            for result, _ in self.pending:
+                os.unlink(result.symtab)
+        self.pending.clear()
 
 
 class MH_BMC_Result(work_package.Result):
-    def __init__(self, wp):
+    def __init__(self, wp, jobs=None, symtab=None, context_line=None):
         super().__init__(wp, True)
+        self.jobs         = jobs or []
+        self.symtab       = symtab
+        self.context_line = context_line
 
 
 class MH_BMC(command_line.MISS_HIT_Back_End):
-    def __init__(self, _):
+    def __init__(self, options, mh, cbmc_version):
         super().__init__("MH Bounded Model Checker")
+        if options.result_cache:
+            cache = Result_Cache(options.result_cache, cbmc_version)
+        else:
+            cache = None
+        self.pool = CBMC_Pool(mh, options, cache)
 
     @classmethod
     def process_wp(cls, wp):
@@ -357,18 +725,41 @@ class MH_BMC(command_line.MISS_HIT_Back_End):
         except Error:
             return MH_BMC_Result(wp)
 
-        new_filename = wp.filename.replace(".m", ".json_symtab")
+        # Write the symbol table. Normally this goes into a temporary
+        # file (removed once cbmc is done); with --keep we write it
+        # next to the source file instead.
+        if wp.options.keep:
+            new_filename = wp.filename.replace(".m", ".json_symtab")
+        else:
+            handle, new_filename = tempfile.mkstemp(
+                dir=wp.options.symtab_dir,
+                prefix="mh_bmc_",
+                suffix=".json_symtab")
+            os.close(handle)
         with open(new_filename, "w", encoding="UTF-8") as fd:
-            json.dump(gst.to_json(), fd, indent=2)
-        # wp.mh.info(n_tree.loc(),
-        #            "wrote goto symbol table to %s" % new_filename)
+            gst.write_json(fd)
 
-        analyze(wp.mh, new_filename, lexer, n_tree)
+        # Verification happens later, in the parent's cbmc pool
+        jobs = [CBMC_Job(wp.filename,
+                         str(n_fdef.n_sig.n_name),
+                         n_fdef.loc(),
+                         new_filename,
+                         function_digest(gst, str(n_fdef.n_sig.n_name)))
+                for n_fdef in n_tree.l_functions]
 
-        if not wp.options.keep:
-            os.unlink(new_filename)
+        return MH_BMC_Result(wp, jobs, new_filename, lexer.context_line)
 
-        return MH_BMC_Result(wp)
+    def process_result(self, result):
+        if result.jobs:
+            self.pool.submit(result)
+        self.pool.report(block=False)
+
+    def post_process(self):
+        try:
+            self.pool.parsing_done()
+            self.pool.report(block=True)
+        finally:
+            self.pool.shutdown()
 
 
 def main_handler():
@@ -379,13 +770,69 @@ def main_handler():
         action="store_true",
         default=False)
 
+    clp["ap"].add_argument(
+        "--cbmc-jobs",
+        default=os.cpu_count() or 1,
+        type=int,
+        metavar="N",
+        help=("Run at most N instances of cbmc at the same time."
+              " By default this is the number of CPUs. While files are"
+              " still being compiled fewer instances are used, so that"
+              " the CPUs are not oversubscribed."))
+    clp["ap"].add_argument(
+        "--cbmc-timeout",
+        default=None,
+        type=int,
+        metavar="SECONDS",
+        help="Give up verifying a function after the given time.")
+    clp["ap"].add_argument(
+        "--cbmc-memory",
+        default=None,
+        type=int,
+        metavar="MB",
+        help=("Limit the memory (address space) of each instance of cbmc"
+              " to the given size."))
+    clp["ap"].add_argument(
+        "--symtab-dir",
+        default=None,
+        metavar="DIR",
+        help=("Write the temporary GOTO symbol tables for cbmc to the"
+              " given directory (e.g. a tmpfs such as /dev/shm) instead"
+              " of the default temporary directory."))
+    clp["ap"].add_argument(
+        "--result-cache",
+        default=None,
+        metavar="DIR",
+        help=("Keep the results of cbmc in the given directory. Functions"
+              " that have not changed since a previous run are not"
+              " verified again."))
+
     options = command_line.parse_args(clp)
 
+    if options.cbmc_jobs < 1:
+        clp["ap"].error("--cbmc-jobs must be at least 1")
+    if options.cbmc_timeout is not None and options.cbmc_timeout < 1:
+        clp["ap"].error("--cbmc-timeout must be at least 1")
+    if options.cbmc_memory is not None:
+        if options.cbmc_memory < 1:
+            clp["ap"].error("--cbmc-memory must be at least 1")
+        if resource is None:
+            clp["ap"].error("--cbmc-memory is not supported on this"
+                            " platform")
+    if options.symtab_dir and not os.path.isdir(options.symtab_dir):
+        clp["ap"].error("Cannot write symbol tables to %s: it is not a"
+                        " directory" % options.symtab_dir)
+    if options.result_cache and \
+       os.path.exists(options.result_cache) and \
+       not os.path.isdir(options.result_cache):
+        clp["ap"].error("Cannot use %s as result cache: it is not a"
+                        " directory" % options.result_cache)
+
     try:
-        subprocess.run(["cbmc", "--version"],
-                       check=True,
-                       capture_output=True,
-                       encoding="utf-8")
+        cbmc_version = subprocess.run(["cbmc", "--version"],
+                                      check=True,
+                                      capture_output=True,
+                                      encoding="utf-8").stdout.strip()
     except FileNotFoundError:
         clp["ap"].error("MH BMC needs 'cbmc' from the CPROVER tools on "
                         "your PATH")
@@ -396,7 +843,7 @@ def main_handler():
     mh.show_checks  = True
     mh.autofix      = False
 
-    bmc_backend = MH_BMC(options)
+    bmc_backend = MH_BMC(options, mh, cbmc_version)
     command_line.execute(mh, options, {}, bmc_backend)
 
 
@@ -30,9 +30,8 @@ from miss_hit_core import command_line
 from miss_hit_core import work_package
 from miss_hit_core.m_ast import *
 from miss_hit_core.errors import Error, Message_Handler, ICE
-from miss_hit_core.m_lexer import MATLAB_Lexer, Token_Buffer
-from miss_hit_core.m_parser import MATLAB_Parser
-from miss_hit_core.m_parse_utils import parse_docstrings
+from miss_hit_core.m_lexer import MATLAB_Lexer
+from miss_hit_core.m_parse_utils import parse_header_docstrings
 from miss_hit_core.m_language import Base_Octave_Language
 
 
@@ -101,8 +100,34 @@ class MH_Copyright_Result(work_package.Result):
 
 
 class MH_Copyright(command_line.MISS_HIT_Back_End):
-    def __init__(self):
+    def __init__(self, options, mh):
+        assert isinstance(mh, Message_Handler)
         super().__init__("MH Copyright")
+        self.options       = options
+        self.mh            = mh
+        self.touched_files = set()
+
+    def process_result(self, result):
+        assert isinstance(result, MH_Copyright_Result)
+
+        if result.wp.modified:
+            self.touched_files.add(result.wp.filename)
+
+    def post_process(self):
+        if not self.touched_files:
+            return
+
+        # Emit all outstanding messages first, so that the list of
+        # files comes after the diagnostics (and just before the
+        # summary).
+        self.mh.finalize_all_files()
+
+        print("Updated copyright notices in %u file(s)%s" %
+              (len(self.touched_files),
+               "" if self.options.brief else ":"))
+        if not self.options.brief:
+            for filename in sorted(self.touched_files):
+                print("  %s" % filename)
 
     @classmethod
     def process_wp(cls, wp):
@@ -148,27 +173,23 @@ class MH_Copyright(command_line.MISS_HIT_Back_End):
         if len(lexer.text.strip()) == 0:
             return MH_Copyright_Result(wp, False)
 
-        # Parse
+        # Find docstrings. We only need to look at the file header
+        # (and the first function or classdef), so we stop lexing as
+        # soon as we've seen it instead of parsing the whole file.
         try:
-            tbuf = Token_Buffer(lexer, wp.cfg)
-            parser = MATLAB_Parser(wp.mh, tbuf, wp.cfg)
-            parse_tree = parser.parse_file()
-            parse_docstrings(wp.mh, wp.cfg, parse_tree, tbuf)
+            n_file_docstring, n_docstring = \
+                parse_header_docstrings(wp.cfg, lexer)
         except Error:  # pragma: no cover
             return MH_Copyright_Result(wp, False)
 
         # Determine the docstring of the primary entity. We use the
-        # script/class docstring, if it exists and contains copyright
-        # info. Otherwise we use the compilation unit's docstring
-        # (i.e. file header). The style checker worries about the case
-        # where we have copyright in more than one location.
-        n_docstring = None
-        if isinstance(parse_tree, Class_File):
-            n_docstring = parse_tree.n_classdef.n_docstring
-        elif isinstance(parse_tree, Function_File):
-            n_docstring = parse_tree.l_functions[0].n_docstring
+        # function/class docstring, if it exists and contains
+        # copyright info. Otherwise we use the compilation unit's
+        # docstring (i.e. file header). The style checker worries
+        # about the case where we have copyright in more than one
+        # location.
         if n_docstring is None or not n_docstring.copyright_info:
-            n_docstring = parse_tree.n_docstring
+            n_docstring = n_file_docstring
         # Note that n_docstring could be None at this point, so we do
         # need to deal with that correctly.
 
@@ -272,9 +293,9 @@ class MH_Copyright(command_line.MISS_HIT_Back_End):
                     # a new one.
                     action_taken = True
 
-                    if parse_tree.n_docstring:
-                        is_block, line_no = parse_tree.n_docstring.final_line()
-                        off = parse_tree.n_docstring.guess_docstring_offset()
+                    if n_file_docstring:
+                        is_block, line_no = n_file_docstring.final_line()
+                        off = n_file_docstring.guess_docstring_offset()
 
                         # Duplicate the last line
                         lines = \
@@ -305,7 +326,9 @@ class MH_Copyright(command_line.MISS_HIT_Back_End):
         except Error:
             return MH_Copyright_Result(wp, False)
 
-        if action_taken:
+        # Only touch the file if the text actually changed. Updating
+        # the year of a notice that is already current is a no-op.
+        if action_taken and lines != lexer.context_line:
             wp.write_modified("\n".join(lines) + "\n")
 
         return MH_Copyright_Result(wp, True)
@@ -396,7 +419,7 @@ def main_handler():
     mh.show_checks  = False
     mh.autofix      = True
 
-    copyright_backend = MH_Copyright()
+    copyright_backend = MH_Copyright(options, mh)
     command_line.execute(mh, options, {},
                          copyright_backend,
                          options.process_slx)
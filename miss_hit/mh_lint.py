@@ -25,13 +25,17 @@
 ##############################################################################
 
 import os
+import json
+import hashlib
 
 from miss_hit_core import pathutil
 from miss_hit_core import command_line
 from miss_hit_core import work_package
 from miss_hit_core import cfg_tree
+from miss_hit_core.version import VERSION
 from miss_hit_core.m_ast import *
 from miss_hit_core.errors import (Error,
+                                  Location,
                                   Message_Handler,
                                   HTML_Message_Handler,
                                   JSON_Message_Handler)
@@ -40,6 +44,14 @@ from miss_hit_core.m_parser import MATLAB_Parser
 from miss_hit_core.m_language_builtins import BUILTIN_FUNCTIONS
 
 from miss_hit.m_sem import sem_pass_1
+from miss_hit.m_entity import Project_Index, File_Symbols
+from miss_hit.g_call_graph import build_call_graph
+from miss_hit.g_cfg import build_cfg
+from miss_hit.g_dataflow import Def_Use, Reaching_Definitions, liveness
+
+
+INDEX_CACHE_FORMAT = 3
+# Bump this whenever the content of File_Symbols changes
 
 
 class Stage_1_Linting(AST_Visitor):
@@ -157,6 +169,124 @@ class Stage_1_Linting(AST_Visitor):
                           "low")
 
 
+DYNAMIC_WORKSPACE_FUNCTIONS = frozenset(["assignin",
+                                         "clear",
+                                         "eval",
+                                         "evalc",
+                                         "evalin",
+                                         "exist",
+                                         "load"])
+# Functions that can create, remove, or inspect variables in ways we
+# cannot see. We do not perform data-flow checks on functions using
+# any of these.
+
+
+def check_dataflow(mh, n_cu):
+    """ Checks for unused assignments and uninitialised variables """
+    assert isinstance(mh, Message_Handler)
+    assert isinstance(n_cu, Compilation_Unit)
+
+    # We only need the top-level functions and methods, so we can
+    # find them directly instead of walking the entire tree (which is
+    # slow for large generated functions).
+    l_functions = list(n_cu.l_functions)
+    if isinstance(n_cu, Class_File):
+        for n_block in n_cu.n_classdef.l_methods:
+            l_functions += [n_item
+                            for n_item in n_block.l_items
+                            if isinstance(n_item, Function_Definition)]
+
+    for n_fdef in l_functions:
+        # Nested functions share variables with their parent, and
+        # scripts share them with their caller; so we only look at
+        # functions that have a workspace of their own.
+        if not n_fdef.l_nested:
+            check_function_dataflow(mh, n_fdef)
+
+
+def check_function_dataflow(mh, n_fdef):
+    assert isinstance(mh, Message_Handler)
+    assert isinstance(n_fdef, Function_Definition)
+
+    cfg = build_cfg(n_fdef)
+    du = Def_Use(n_fdef, cfg)
+    if du.names & DYNAMIC_WORKSPACE_FUNCTIONS:
+        return
+    v_start = cfg.get_named_vertex("start")
+    v_end = cfg.get_named_vertex("end")
+    reachable = cfg.reachable([v_start])
+    rd = Reaching_Definitions(du)
+    _, live_after = liveness(du)
+
+    # Variables that might be read before they are written. We only
+    # complain once about each variable.
+    reported = set()
+    for vertex in range(cfg.count_vertices()):
+        for var, n_ident in du.use_sites[vertex]:
+            if var in reported:
+                continue
+            reaching = rd.reaching(vertex, var)
+            if not reaching & rd.undefined:
+                continue
+            reported.add(var)
+            if reaching == reaching & rd.undefined:
+                mh.check(n_ident.loc(),
+                         "variable %s is used before it is defined" %
+                         du.variables[var],
+                         "uninitialised_variable",
+                         "high")
+            else:
+                mh.check(n_ident.loc(),
+                         "variable %s might be used before it is defined" %
+                         du.variables[var],
+                         "uninitialised_variable",
+                         "medium")
+
+    # Outputs that might not be set
+    if reachable[v_end]:
+        for n_param in n_fdef.n_sig.l_outputs:
+            name = str(n_param)
+            if name == "varargout" or name not in du.var_id:
+                continue
+            var = du.var_id[name]
+            if rd.reaching(v_end, var) & rd.undefined:
+                mh.check(n_param.loc(),
+                         "output %s might not be set" % name,
+                         "uninitialised_variable",
+                         "medium")
+
+    # Assignments that are never read. We ignore global and
+    # persistent variables (which can be read elsewhere), and
+    # onCleanup objects (which are only kept around so they are
+    # destroyed at the end of the function).
+    for vertex, n_statement in enumerate(cfg.data):
+        if not reachable[vertex]:
+            continue
+        elif isinstance(n_statement, Simple_Assignment_Statement):
+            l_targets = [n_statement.n_lhs]
+        elif isinstance(n_statement, Compound_Assignment_Statement):
+            l_targets = n_statement.l_lhs
+        else:
+            continue
+        n_rhs = n_statement.n_rhs
+        if isinstance(n_rhs, Reference) and \
+           str(n_rhs.n_ident) == "onCleanup":
+            continue
+
+        unused = du.defs[vertex] & ~live_after[vertex] & ~du.static
+        for n_target in l_targets:
+            if not isinstance(n_target, Identifier) or \
+               str(n_target) not in du.var_id:
+                continue
+            var = du.var_id[str(n_target)]
+            if unused & (1 << var):
+                mh.check(n_target.loc(),
+                         "value assigned to %s is never used" %
+                         str(n_target),
+                         "unused_assignment",
+                         "low")
+
+
 class MH_Lint_Result(work_package.Result):
     def __init__(self, wp, sem=None):
         super().__init__(wp, True)
@@ -164,13 +294,21 @@ class MH_Lint_Result(work_package.Result):
 
 
 class MH_Lint(command_line.MISS_HIT_Back_End):
-    def __init__(self, options):
+    def __init__(self, options, mh):
+        assert isinstance(mh, Message_Handler)
         super().__init__("MH Lint")
+        self.mh = mh
         self.perform_sem = options.entry_point is not None
         self.debug_show_st = options.debug_show_global_symbol_table
+        self.options = options
+        self.index = Project_Index()
+
+        self.file_symbols = {}
+        # File_Symbols (or None) of each file we have processed, by
+        # absolute filename
 
     @classmethod
-    def process_wp(cls, wp):
+    def parse(cls, wp):
         # Create lexer
         lexer = MATLAB_Lexer(wp.cfg.language,
                              wp.mh,
@@ -180,13 +318,19 @@ class MH_Lint(command_line.MISS_HIT_Back_End):
         if not wp.cfg.pragmas:
             lexer.process_pragmas = False
         if len(lexer.text.strip()) == 0:
-            return MH_Lint_Result(wp)
+            return None
 
         # Create parse tree
         try:
             parser = MATLAB_Parser(wp.mh, lexer, wp.cfg)
-            n_cu = parser.parse_file()
+            return parser.parse_file()
         except Error:
+            return None
+
+    @classmethod
+    def process_wp(cls, wp):
+        n_cu = cls.parse(wp)
+        if n_cu is None:
             return MH_Lint_Result(wp)
 
         # Check compilation units for shadowing a built-in
@@ -205,6 +349,10 @@ class MH_Lint(command_line.MISS_HIT_Back_End):
         # Initial checks
         n_cu.visit(None, Stage_1_Linting(wp.mh), "Root")
 
+        # Data-flow checks
+        if wp.options.dataflow:
+            check_dataflow(wp.mh, n_cu)
+
         # First pass of semantic analysis
         entrypoint = cfg_tree.get_entry_point(wp.options.entry_point)
         sem = sem_pass_1(wp.mh, entrypoint, n_cu)
@@ -217,13 +365,210 @@ class MH_Lint(command_line.MISS_HIT_Back_End):
         if not isinstance(result, MH_Lint_Result):
             return
         if result.sem is None:
+            self.file_symbols[pathutil.abspath(result.wp.filename)] = None
             return
+        self.file_symbols[pathutil.abspath(result.wp.filename)] = \
+            result.sem.symbols
 
         if self.debug_show_st:
             result.sem.scope.dump(result.wp.filename)
 
+        # Merge what this file defines into the project-wide index
+        if result.sem.symbols:
+            self.index.merge(result.sem.symbols)
+
     def post_process(self):
-        pass
+        if not self.perform_sem:
+            return
+
+        if self.options.index_cache:
+            self.update_index_cache()
+
+        if self.options.call_graph or self.options.dead_functions:
+            graph = build_call_graph(self.index)
+            if self.options.call_graph:
+                graph.write_json(self.options.call_graph)
+            if self.options.dead_functions:
+                self.report_dead_functions(graph)
+
+        if self.debug_show_st:
+            self.index.dump()
+
+    def report_dead_functions(self, graph):
+        # All scripts and classes are assumed to be used. Unless we
+        # are told what the main functions (--main) are, we also
+        # assume that all (non-package) functions in the entry
+        # point's own directories are used, since they could be called
+        # from outside. This means dead top-level functions are only
+        # found with --main. We only report on the entry point's own
+        # code, since libraries are shared with other entry points.
+        entrypoint = cfg_tree.get_entry_point(self.options.entry_point)
+        n_global = (len(cfg_tree.get_source_path(entrypoint)) -
+                    len(entrypoint.get_source_path()))
+        own_paths = range(n_global,
+                          n_global +
+                          len(entrypoint.path_list_source.get_path()))
+
+        main_functions = set()
+        for name in self.options.main:
+            if "." in name:
+                pkg_name, function_name = name.rsplit(".", 1)
+            else:
+                pkg_name, function_name = "", name
+            pkg = self.index.packages.get(pkg_name)
+            if pkg is None or function_name not in pkg.symbols:
+                self.mh.command_line_error("main function %s does not"
+                                           " exist" % name)
+            main_functions.add(pkg.symbols[function_name])
+
+        def is_root(fsym):
+            if fsym.is_script or fsym.kind == "class":
+                return True
+            elif self.options.main:
+                return fsym in main_functions
+            elif fsym.path_index not in own_paths:
+                return False
+            elif fsym.packages or fsym.in_private:
+                return False
+            elif fsym.class_directory:
+                return fsym.name == fsym.class_directory
+            else:
+                return True
+
+        reachable = graph.reachable([graph.primary[fsym]
+                                     for fsym in graph.primary
+                                     if is_root(fsym)])
+
+        for vertex in range(graph.count_vertices()):
+            fsym = graph.file_symbols(vertex)
+            if reachable[vertex] or fsym.path_index not in own_paths:
+                continue
+            name, line, column, _ = graph.function(vertex)
+            if fsym.filename.replace("\\", "/") not in self.mh.files:
+                # Messages for files we have already reported on (or
+                # files taken from the index cache)
+                self.mh.register_file(fsym.filename)
+            self.mh.check(Location(fsym.filename,
+                                   line      = line,
+                                   col_start = column),
+                          "function %s is never called" % name,
+                          "dead_function",
+                          "low")
+
+    def analyse_symbols(self, filename):
+        # Parse the given file (that was not part of this run) just
+        # enough to find out what it contributes to the index.
+        assert isinstance(filename, str)
+
+        if not cfg_tree.get_config(filename).enabled:
+            return None
+
+        wp = work_package.create(False,
+                                 filename,
+                                 self.options.input_encoding,
+                                 Message_Handler("lint"),
+                                 self.options,
+                                 {})
+        wp.register_file()
+        try:
+            n_cu = self.parse(wp)
+        except Error:
+            return None
+        if n_cu is None:
+            return None
+
+        entrypoint = cfg_tree.get_entry_point(self.options.entry_point)
+        sem = sem_pass_1(wp.mh, entrypoint, n_cu)
+        return sem.symbols if sem else None
+
+    def update_index_cache(self):
+        # Complete the project index with all files on the source
+        # path, not just the ones we have processed. Files whose
+        # content has not changed since the last run are taken from
+        # the cache, and only the remaining ones are parsed. To find
+        # out if a file has changed we first check its size and
+        # modification time, and only hash it if these differ.
+        entrypoint = cfg_tree.get_entry_point(self.options.entry_point)
+        source_path = [pathutil.abspath(path)
+                       for path in cfg_tree.get_source_path(entrypoint)]
+        cache_file = os.path.join(self.options.index_cache,
+                                  "%s.json" % self.options.entry_point)
+
+        # Load the old cache. If it was made by a different version
+        # of MISS_HIT or the path has changed it is useless, since
+        # the path determines the package structure.
+        old_cache = {}
+        if os.path.isfile(cache_file):
+            try:
+                with open(cache_file, "r", encoding="UTF-8") as fd:
+                    blob = json.load(fd)
+                if blob["version"] == VERSION and \
+                   blob["format"] == INDEX_CACHE_FORMAT and \
+                   blob["path"] == source_path:
+                    old_cache = blob["files"]
+            except (ValueError, KeyError, TypeError):
+                pass
+
+        new_cache = {}
+        origin = {}
+        for path_root in source_path:
+            for _, files in command_line.walk_matlab_path(path_root):
+                for filename in files:
+                    if filename in new_cache or not filename.endswith(".m"):
+                        continue
+
+                    stat = os.stat(filename)
+                    old_entry = old_cache.get(filename, None)
+                    if old_entry and \
+                       old_entry["size"] == stat.st_size and \
+                       old_entry["mtime"] == stat.st_mtime_ns:
+                        digest = old_entry["hash"]
+                    else:
+                        with open(filename, "rb") as fd:
+                            digest = hashlib.sha256(fd.read()).hexdigest()
+
+                    if filename in self.file_symbols:
+                        # Already merged in process_result
+                        fsym = self.file_symbols[filename]
+                        origin[filename] = "processed"
+                    elif old_entry and old_entry["hash"] == digest:
+                        origin[filename] = "from cache"
+                        if old_entry["symbols"] is None:
+                            fsym = None
+                        else:
+                            fsym = File_Symbols.from_json(
+                                old_entry["symbols"])
+                            fsym.filename = os.path.relpath(filename)
+                            self.index.merge(fsym)
+                    else:
+                        origin[filename] = "analysed"
+                        fsym = self.analyse_symbols(os.path.relpath(filename))
+                        if fsym:
+                            self.index.merge(fsym)
+
+                    new_cache[filename] = {
+                        "size"    : stat.st_size,
+                        "mtime"   : stat.st_mtime_ns,
+                        "hash"    : digest,
+                        "symbols" : fsym.to_json() if fsym else None
+                    }
+
+        if self.options.debug_show_index_cache:
+            print("Index for %s:" % self.options.entry_point)
+            for filename in sorted(origin, key=os.path.relpath):
+                print("  %s %s" % (os.path.relpath(filename),
+                                   origin[filename]))
+
+        os.makedirs(self.options.index_cache, exist_ok=True)
+        with open(cache_file, "w", encoding="UTF-8") as fd:
+            json.dump({"version" : VERSION,
+                       "format"  : INDEX_CACHE_FORMAT,
+                       "path"    : source_path,
+                       "files"   : new_cache},
+                      fd,
+                      indent=1,
+                      sort_keys=True)
+            fd.write("\n")
 
 
 def main_handler():
@@ -239,15 +584,88 @@ def main_handler():
         default=None,
         help="Produce JSON report")
 
+    clp["ap"].add_argument(
+        "--index-cache",
+        default=None,
+        metavar="DIR",
+        help=("Keep the symbol index for the entry point in the given"
+              " directory. Only files that have changed since the last"
+              " run are re-analysed to build the index. This only"
+              " saves time if you check some of the files, since all"
+              " files you check are always fully analysed."
+              " Requires --entry-point."))
+
+    clp["ap"].add_argument(
+        "--call-graph",
+        default=None,
+        metavar="FILE",
+        help=("Write the call graph of the entry point to the given file"
+              " (as JSON). Requires --entry-point."))
+    clp["ap"].add_argument(
+        "--dead-functions",
+        default=False,
+        action="store_true",
+        help=("Report functions that are never called."
+              " Requires --entry-point."))
+    clp["ap"].add_argument(
+        "--main",
+        default=[],
+        action="append",
+        metavar="FUNCTION",
+        help=("A function that is called from outside the entry point"
+              " (e.g. pkg.name for a package function). Can be given"
+              " more than once. If given, --dead-functions assumes"
+              " only these functions, scripts, and classes are used;"
+              " otherwise all top-level functions of the entry point"
+              " are assumed to be used."))
+
+    clp["ap"].add_argument(
+        "--dataflow",
+        default=False,
+        action="store_true",
+        help=("Perform data-flow analysis of each function, to find"
+              " assignments that are never used and variables that"
+              " might be used before they are defined."))
+
     # Extra debug options
     clp["debug_options"].add_argument(
         "--debug-show-global-symbol-table",
         default=False,
         action="store_true",
         help="Show global symbol table")
+    clp["debug_options"].add_argument(
+        "--debug-show-index-cache",
+        default=False,
+        action="store_true",
+        help=("Show which files the index was built from, with"
+              " --index-cache"))
 
     options = command_line.parse_args(clp)
 
+    if options.index_cache:
+        if options.entry_point is None:
+            clp["ap"].error("--index-cache requires --entry-point")
+        if os.path.exists(options.index_cache) and \
+           not os.path.isdir(options.index_cache):
+            clp["ap"].error("Cannot use %s as index cache: it is not a"
+                            " directory" % options.index_cache)
+
+    if options.call_graph or options.dead_functions:
+        if options.entry_point is None:
+            clp["ap"].error("--call-graph and --dead-functions require"
+                            " --entry-point")
+        if options.files and not options.index_cache:
+            clp["ap"].error("--call-graph and --dead-functions need to see"
+                            " the whole entry point; either do not"
+                            " specify files or use --index-cache")
+    if options.main and not options.dead_functions:
+        clp["ap"].error("--main requires --dead-functions")
+    if options.call_graph and \
+       os.path.exists(options.call_graph) and \
+       not os.path.isfile(options.call_graph):
+        clp["ap"].error("Cannot write to %s: it is not a file" %
+                        options.call_graph)
+
     if options.html:
         if options.json:
             clp["ap"].error("Cannot produce JSON and HTML at the same time")
@@ -268,7 +686,7 @@ def main_handler():
     mh.show_checks  = True
     mh.autofix      = False
 
-    lint_backend = MH_Lint(options)
+    lint_backend = MH_Lint(options, mh)
     command_line.execute(mh, options, {}, lint_backend)
 
 
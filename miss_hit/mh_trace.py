@@ -293,12 +293,89 @@ class Simulink_Walker:
         self.naming_stack.pop()
 
 
+class LOBSTER_Writer:
+    """ Writes a LOBSTER file, one item at a time
+
+    Items are written as soon as they arrive, so we never hold the
+    whole trace in memory. The output is the same as json.dump of the
+    whole document with sorted keys (either indented or compact);
+    this works since "data" is the first key.
+    """
+    def __init__(self, filename, schema, compact):
+        assert isinstance(filename, str)
+        assert isinstance(schema, str)
+        assert isinstance(compact, bool)
+
+        self.filename = filename
+        self.schema   = schema
+        self.compact  = compact
+        self.fd       = None
+        self.count    = 0
+
+    def open(self):
+        assert self.fd is None
+        # The file stays open until close, so we can't use with here
+        # pylint: disable=consider-using-with
+        self.fd = open(self.filename, "w", encoding="UTF-8")
+        # pylint: enable=consider-using-with
+        if self.compact:
+            self.fd.write('{"data":[')
+        else:
+            self.fd.write('{\n  "data": [')
+
+    def write(self, item):
+        assert isinstance(item, dict)
+
+        if self.fd is None:
+            self.open()
+        if self.count:
+            self.fd.write(",")
+        if self.compact:
+            self.fd.write(json.dumps(item,
+                                     sort_keys=True,
+                                     separators=(",", ":")))
+        else:
+            # Items are nested two levels deep in the document
+            self.fd.write("\n    ")
+            self.fd.write(json.dumps(item,
+                                     indent=2,
+                                     sort_keys=True).replace("\n",
+                                                             "\n    "))
+        self.count += 1
+
+    def close(self):
+        if self.fd is None:
+            self.open()
+
+        trailer = {"generator" : "MH Trace",
+                   "schema"    : self.schema,
+                   "version"   : 3}
+        if self.compact:
+            self.fd.write("],")
+            self.fd.write(json.dumps(trailer,
+                                     sort_keys=True,
+                                     separators=(",", ":"))[1:])
+        else:
+            self.fd.write("\n  ],\n" if self.count else "],\n")
+            self.fd.write(json.dumps(trailer,
+                                     indent=2,
+                                     sort_keys=True)[2:])
+        self.fd.write("\n")
+
+        self.fd.close()
+        self.fd = None
+
+
 class MH_Trace(command_line.MISS_HIT_Back_End):
     def __init__(self, options):
         super().__init__("MH Trace")
-        self.imp_items = []
-        self.act_items = []
-        self.options   = options
+        self.options    = options
+        self.imp_writer = LOBSTER_Writer(options.out_imp,
+                                         "lobster-imp-trace",
+                                         options.compact)
+        self.act_writer = LOBSTER_Writer(options.out_act,
+                                         "lobster-act-trace",
+                                         options.compact)
 
     @classmethod
     def process_wp(cls, wp):
@@ -348,34 +425,24 @@ class MH_Trace(command_line.MISS_HIT_Back_End):
             return MH_Trace_Result(wp, walker.imp_items, walker.act_items)
 
     def process_result(self, result):
-        if result.imp_items:
-            self.imp_items += result.imp_items
-        if result.act_items:
-            self.act_items += result.act_items
+        # Results arrive in the same (deterministic) order as the
+        # files were found, so we can write them straight away
+        for item in result.imp_items or []:
+            if self.options.only_tagged_blocks and \
+               item["language"] == "Simulink" and \
+               not item["refs"]:
+                continue
+            self.imp_writer.write(item)
+        for item in result.act_items or []:
+            if self.options.only_tagged_blocks and \
+               item["framework"] == "Simulink" and \
+               not item["refs"]:
+                continue
+            self.act_writer.write(item)
 
     def post_process(self):
-        if self.options.only_tagged_blocks:
-            self.imp_items = list(filter(
-                lambda x: x["language"] != "Simulink" or x["refs"],
-                self.imp_items))
-            self.act_items = list(filter(
-                lambda x: x["framework"] != "Simulink" or x["refs"],
-                self.act_items))
-
-        with open(self.options.out_imp, "w", encoding="UTF-8") as fd:
-            data = {"data"      : self.imp_items,
-                    "generator" : "MH Trace",
-                    "schema"    : "lobster-imp-trace",
-                    "version"   : 3}
-            json.dump(data, fd, indent=2, sort_keys=True)
-            fd.write("\n")
-        with open(self.options.out_act, "w", encoding="UTF-8") as fd:
-            data = {"data"      : self.act_items,
-                    "generator" : "MH Trace",
-                    "schema"    : "lobster-act-trace",
-                    "version"   : 3}
-            json.dump(data, fd, indent=2, sort_keys=True)
-            fd.write("\n")
+        self.imp_writer.close()
+        self.act_writer.close()
 
 
 def main_handler():
@@ -401,6 +468,12 @@ def main_handler():
         action="store_true",
         default=False,
         help="Blocks without tags inherit all tags from their parent block")
+    clp["output_options"].add_argument(
+        "--compact",
+        action="store_true",
+        default=False,
+        help=("Write the LOBSTER artefacts without any indentation,"
+              " which makes them much smaller"))
 
     options = command_line.parse_args(clp)
 
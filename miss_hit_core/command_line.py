@@ -55,6 +55,28 @@ def has_relevant_extension(path, process_slx=True):
         return os.path.splitext(path)[1] in (".m", ".tst")
 
 
+def walk_matlab_path(path_root):
+    # Yields all directories MATLAB would consider for the given
+    # path entry (i.e. the root, and any package, class, and private
+    # directories below it), along with the relevant files in each.
+    #
+    # See
+    # https://www.mathworks.com/help/matlab/matlab_env/files-and-folders-that-matlab-accesses.html
+    assert isinstance(path_root, str)
+
+    for path, dirs, files in os.walk(path_root):
+        yield (os.path.normpath(path),
+               [os.path.normpath(os.path.join(path, f))
+                for f in files
+                if has_relevant_extension(f)])
+        irrelevant_dirs = set(d for d in dirs
+                              if not (d.startswith("+") or
+                                      d.startswith("@") or
+                                      d == "private"))
+        for idir in irrelevant_dirs:
+            dirs.remove(idir)
+
+
 def create_basic_clp(epilog=None):
     rv = {}
 
@@ -301,26 +323,13 @@ def execute(mh, options, extra_options, back_end,
             # Determine relevant files based on these
             # directories. This is a bit more complex than
             # "everything".
-            #
-            # See
-            # https://www.mathworks.com/help/matlab/matlab_env/files-and-folders-that-matlab-accesses.html
-
             code_in_path = set()
             test_in_path = set()
             for in_test_dir, path_root in item_list:
                 container = test_in_path if in_test_dir else code_in_path
-                for path, dirs, files in os.walk(path_root):
-                    container.add(os.path.normpath(path))
-                    for f in files:
-                        if has_relevant_extension(f):
-                            container.add(
-                                os.path.normpath(os.path.join(path, f)))
-                    irrelevant_dirs = set(d for d in dirs
-                                          if not (d.startswith("+") or
-                                                  d.startswith("@") or
-                                                  d == "private"))
-                    for idir in irrelevant_dirs:
-                        dirs.remove(idir)
+                for path, files in walk_matlab_path(path_root):
+                    container.add(path)
+                    container.update(files)
 
             if options.files:
                 # If the user has supplied files/dirs to analyze, we
@@ -25,10 +25,21 @@
 
 # pylint: disable=consider-using-dict-items
 
+import re
+import functools
 from copy import deepcopy
 from miss_hit_core.m_language import MATLAB_Latest_Language
 
 
+@functools.lru_cache(maxsize=None)
+def compile_regex(regex):
+    # There are only very few distinct regular expressions in the
+    # configuration (e.g. naming schemes), even across large
+    # projects, so we compile each only once per process.
+    assert isinstance(regex, str)
+    return re.compile(regex)
+
+
 ##############################################################################
 # Configuration class. This will be passed to every bit of code that
 # analyzes anything.
@@ -117,6 +128,32 @@ class Config:
             else:
                 print("%s| %s" % (" " * indent, item))
 
+    def style_fingerprint(self):
+        """ Returns a hashable summary of the style settings.
+
+        Two configurations with the same fingerprint will produce
+        identical results when style checking.
+        """
+        return (frozenset(self.style_rules),
+                tuple(sorted((name,
+                              frozenset(value)
+                              if isinstance(value, set)
+                              else value)
+                             for name, value in self.style_config.items())))
+
+    def naming_regex(self, kind):
+        """ Returns the compiled naming regex for the given kind of name
+
+        For example for kind 'function' this is regex_function_name,
+        anchored at both ends.
+        """
+        return compile_regex(
+            "^(" + self.style_config["regex_" + kind + "_name"] + ")$")
+
+    def copyright_regex(self):
+        """ Returns the compiled copyright_regex """
+        return compile_regex(self.style_config["copyright_regex"])
+
     def active(self, rule):
         """ Returns true if the given rule is active. """
         assert isinstance(rule, str)
@@ -303,6 +303,31 @@ class Message_Handler:
                 self.justifications[filename][line] += \
                   other.justifications[filename][line]
 
+    def adopt_messages(self, other, selector, justifications):
+        # Take over the (not yet emitted) messages of other, a forked
+        # message handler, for which the selector is true. Fatal
+        # messages have already been raised in other, so they are not
+        # raised again. Justifications are optionally taken as well.
+        assert isinstance(other, Message_Handler)
+        assert isinstance(justifications, bool)
+
+        for filename in other.messages:
+            for messages in other.messages[filename].values():
+                for msg in messages:
+                    if not selector(msg):
+                        continue
+                    elif msg.location.line in self.messages[filename]:
+                        self.messages[filename][msg.location.line].append(msg)
+                    else:
+                        self.messages[filename][msg.location.line] = [msg]
+
+            if justifications:
+                for line, items in other.justifications[filename].items():
+                    if line in self.justifications[filename]:
+                        self.justifications[filename][line] += items
+                    else:
+                        self.justifications[filename][line] = list(items)
+
     def register_file(self, filename):
         assert isinstance(filename, str)
         canonical_filename = filename.replace("\\", "/")
@@ -606,11 +631,14 @@ class Message_Handler:
         print("%s: error: %s" % (os.path.basename(sys.argv[0]), message))
         sys.exit(1)
 
-    def summary_and_exit(self):
+    def finalize_all_files(self):
         files = list(self.messages)
         for filename in files:
             self.finalize_file(filename)
 
+    def summary_and_exit(self):
+        self.finalize_all_files()
+
         self.emit_summary()
 
         if self.style_issues or \
@@ -205,6 +205,10 @@ class Node:
         NODE_UID[0] += 1
         self.uid = NODE_UID[0]
         self.n_parent = None
+        self.indentation_cfg = None
+        self.indentation_level = None
+        # Cached indentation level of this node (for the given
+        # configuration), see get_indentation
 
     def loc(self):
         raise ICE("cannot produce error location")
@@ -216,30 +220,58 @@ class Node:
     def debug_parse_tree(self):
         pass
 
-    def _visit(self, parent, function, relation):
-        # This function must not be overwritten
-        assert parent is None or isinstance(parent, Node)
-        assert isinstance(function, AST_Visitor)
-        assert isinstance(relation, str)
-        function.visit(self, parent, relation)
-
-    def _visit_end(self, parent, function, relation):
-        # This function must not be overwritten
-        assert parent is None or isinstance(parent, Node)
-        assert isinstance(function, AST_Visitor)
+    def children(self):
+        # This function should be over-written by each node that has
+        # child nodes. It yields (relation, node) for each child, in
+        # the order in which they should be visited.
+        return ()
+
+    def walk(self, n_parent=None, relation="Root"):
+        # Iterate over the tree rooted at this node, using an explicit
+        # stack (i.e. there is no limit on the depth of the tree). We
+        # yield (node, n_parent, relation, is_end) twice for each
+        # node: once before (is_end is False) and once after (is_end
+        # is True) visiting all its children.
+        #
+        # The children of a node are only considered after the
+        # consumer has seen the node itself.
+        assert n_parent is None or isinstance(n_parent, Node)
         assert isinstance(relation, str)
-        function.visit_end(self, parent, relation)
 
-    def _visit_list(self, the_list, function, relation):
-        # This function must not be overwritten
-        for the_node in the_list:
-            the_node.visit(self, function, relation)
+        stack = [(self, n_parent, relation, False)]
+        while stack:
+            node, n_parent, relation, is_end = stack.pop()
+            yield node, n_parent, relation, is_end
+            if not is_end:
+                stack.append((node, n_parent, relation, True))
+                stack.extend((n_child, node, child_relation, False)
+                             for child_relation, n_child
+                             in reversed(list(node.children())))
+
+    def pre_order(self):
+        # Iterate over (node, n_parent, relation) for the tree rooted
+        # at this node, visiting parents before children
+        for node, n_parent, relation, is_end in self.walk():
+            if not is_end:
+                yield node, n_parent, relation
+
+    def post_order(self):
+        # Iterate over (node, n_parent, relation) for the tree rooted
+        # at this node, visiting children before parents
+        for node, n_parent, relation, is_end in self.walk():
+            if is_end:
+                yield node, n_parent, relation
 
     def visit(self, parent, function, relation):
-        # This function should be over-written by each node to
-        # implement the visitor pattern.
-        self._visit(parent, function, relation)
-        self._visit_end(parent, function, relation)
+        # This function must not be overwritten. To implement the
+        # visitor pattern for a new node, override children instead.
+        assert isinstance(function, AST_Visitor)
+        for node, n_parent, node_relation, is_end in self.walk(parent,
+                                                               relation):
+            if is_end:
+                function.visit_end(node, n_parent, node_relation)
+            else:
+                function.visit(node, n_parent, node_relation)
 
     def pp_node(self, fd=None):
         self.visit(None, Text_Visitor(fd), "Root")
@@ -269,13 +301,29 @@ class Node:
     def get_indentation(self, cfg):
         # Indentation is the same level as the parent. + 1 if the
         # parent itself causes children to be indented.
+        #
+        # We remember the indentation of each node (for the given
+        # configuration), so that we only walk up the tree until we
+        # find a node whose indentation we already know. The levels
+        # are then filled in top-down.
+        chain = []
+        node = self
+        while node is not None and node.indentation_cfg is not cfg:
+            chain.append(node)
+            node = node.n_parent
+
+        if node is not None:
+            indent = node.indentation_level
+        else:
+            indent = None
 
-        if self.n_parent:
-            indent = self.n_parent.get_indentation(cfg)
-            if self.n_parent.causes_indentation(cfg):
+        for node in reversed(chain):
+            if indent is None:
+                indent = 0
+            elif node.n_parent.causes_indentation(cfg):
                 indent += 1
-        else:
-            indent = 0
+            node.indentation_cfg = cfg
+            node.indentation_level = indent
 
         return indent
 
@@ -482,11 +530,10 @@ class Script_File(Compilation_Unit):
         for n_function in self.l_functions:
             n_function.debug_parse_tree()
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_statements.visit(self, function, "Statements")
-        self._visit_list(self.l_functions, function, "Functions")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        yield "Statements", self.n_statements
+        for n_item in self.l_functions:
+            yield "Functions", n_item
 
     def sty_check_naming(self, mh, cfg):
         assert isinstance(mh, Message_Handler)
@@ -495,9 +542,8 @@ class Script_File(Compilation_Unit):
             n_function.sty_check_naming(mh, cfg)
 
         if cfg.active("naming_scripts"):
-            regex = cfg.style_config["regex_script_name"]
             file_root = self.name.rsplit(".", 1)[0]
-            if not re.match("^(" + regex + ")$", file_root):
+            if not cfg.naming_regex("script").match(file_root):
                 mh.style_issue(self.loc(),
                                "violates naming scheme for scripts",
                                "naming_scripts")
@@ -539,11 +585,11 @@ class Function_File(Compilation_Unit):
         for n_function in self.l_functions:
             n_function.debug_parse_tree()
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self._visit_list(self.l_pragmas, function, "Pragmas")
-        self._visit_list(self.l_functions, function, "Functions")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        for n_item in self.l_pragmas:
+            yield "Pragmas", n_item
+        for n_item in self.l_functions:
+            yield "Functions", n_item
 
     def sty_check_naming(self, mh, cfg):
         assert isinstance(mh, Message_Handler)
@@ -595,12 +641,12 @@ class Class_File(Compilation_Unit):
                 if isinstance(n_item, Function_Definition):
                     n_item.debug_parse_tree()
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self._visit_list(self.l_pragmas, function, "Pragmas")
-        self.n_classdef.visit(self, function, "Classdef")
-        self._visit_list(self.l_functions, function, "Functions")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        for n_item in self.l_pragmas:
+            yield "Pragmas", n_item
+        yield "Classdef", self.n_classdef
+        for n_item in self.l_functions:
+            yield "Functions", n_item
 
     def sty_check_naming(self, mh, cfg):
         assert isinstance(mh, Message_Handler)
@@ -690,22 +736,24 @@ class Class_Definition(Definition):
         assert isinstance(n_parent, Class_File)
         super().set_parent(n_parent)
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_name.visit(self, function, "Name")
+    def children(self):
+        yield "Name", self.n_name
         if self.n_constructor:
-            self.n_constructor.visit(self, function, "Constructor")
+            yield "Constructor", self.n_constructor
         elif self.n_constructor_sig:
-            self.n_constructor_sig.visit(self,
-                                         function,
-                                         "Constructor Signature")
-        self._visit_list(self.l_super, function, "Superclasses")
-        self._visit_list(self.l_attr, function, "Attributes")
-        self._visit_list(self.l_properties, function, "Properties")
-        self._visit_list(self.l_events, function, "Events")
-        self._visit_list(self.l_enumerations, function, "Enumerations")
-        self._visit_list(self.l_methods, function, "Methods")
-        self._visit_end(parent, function, relation)
+            yield "Constructor Signature", self.n_constructor_sig
+        for n_item in self.l_super:
+            yield "Superclasses", n_item
+        for n_item in self.l_attr:
+            yield "Attributes", n_item
+        for n_item in self.l_properties:
+            yield "Properties", n_item
+        for n_item in self.l_events:
+            yield "Events", n_item
+        for n_item in self.l_enumerations:
+            yield "Enumerations", n_item
+        for n_item in self.l_methods:
+            yield "Methods", n_item
 
     def add_block(self, mh, n_block):
         assert isinstance(mh, Message_Handler)
@@ -838,13 +886,13 @@ class Function_Definition(Definition):
         for n_function in self.l_nested:
             n_function.debug_parse_tree()
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_sig.visit(self, function, "Signature")
-        self._visit_list(self.l_validation, function, "Validation")
-        self.n_body.visit(self, function, "Body")
-        self._visit_list(self.l_nested, function, "Nested")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        yield "Signature", self.n_sig
+        for n_item in self.l_validation:
+            yield "Validation", n_item
+        yield "Body", self.n_body
+        for n_item in self.l_nested:
+            yield "Nested", n_item
 
     def sty_check_naming(self, mh, cfg):
         assert isinstance(mh, Message_Handler)
@@ -956,11 +1004,11 @@ class Copyright_Info(Node):
 
 
 class Docstring(Node):
-    def __init__(self, copyright_regex):
+    def __init__(self, re_copyright):
         super().__init__()
-        assert isinstance(copyright_regex, str)
+        assert isinstance(re_copyright, re.Pattern)
         self.l_comments = []
-        self.re_copyright = re.compile(copyright_regex)
+        self.re_copyright = re_copyright
 
         self.copyright_info = []
 
@@ -1119,12 +1167,12 @@ class Function_Signature(Node):
         # implemented functions.
         super().set_parent(n_parent)
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_name.visit(self, function, "Name")
-        self._visit_list(self.l_inputs, function, "Inputs")
-        self._visit_list(self.l_outputs, function, "Outputs")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        yield "Name", self.n_name
+        for n_item in self.l_inputs:
+            yield "Inputs", n_item
+        for n_item in self.l_outputs:
+            yield "Outputs", n_item
 
     def sty_check_naming(self, mh, cfg):
         assert isinstance(mh, Message_Handler)
@@ -1221,10 +1269,9 @@ class Sequence_Of_Statements(Node):
                                      Function_Definition))
         super().set_parent(n_parent)
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self._visit_list(self.l_statements, function, "Statements")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        for n_item in self.l_statements:
+            yield "Statements", n_item
 
 
 class Name_Value_Pair(Node):
@@ -1270,12 +1317,10 @@ class Name_Value_Pair(Node):
         # as references).
         super().set_parent(n_parent)
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_name.visit(self, function, "Name")
+    def children(self):
+        yield "Name", self.n_name
         if self.n_value:
-            self.n_value.visit(self, function, "Value")
-        self._visit_end(parent, function, relation)
+            yield "Value", self.n_value
 
 
 class Special_Block(Node):
@@ -1328,11 +1373,11 @@ class Special_Block(Node):
                                      Function_Definition))
         super().set_parent(n_parent)
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self._visit_list(self.l_attr, function, "Attributes")
-        self._visit_list(self.l_items, function, "Items")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        for n_item in self.l_attr:
+            yield "Attributes", n_item
+        for n_item in self.l_items:
+            yield "Items", n_item
 
     def kind(self):
         return self.t_kw.value
@@ -1442,15 +1487,14 @@ class Entity_Constraints(Node):
         assert n_parent.kind() in ("properties", "arguments")
         super().set_parent(n_parent)
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_name.visit(self, function, "Name")
+    def children(self):
+        yield "Name", self.n_name
         if self.n_class_name:
-            self.n_class_name.visit(self, function, "Class")
-        self._visit_list(self.l_fun_constraint, function, "Functions")
+            yield "Class", self.n_class_name
+        for n_item in self.l_fun_constraint:
+            yield "Functions", n_item
         if self.n_default_value:
-            self.n_default_value.visit(self, function, "Default")
-        self._visit_end(parent, function, relation)
+            yield "Default", self.n_default_value
 
 
 class Argument_Validation_Delegation(Node):
@@ -1490,11 +1534,9 @@ class Argument_Validation_Delegation(Node):
         assert n_parent.kind() == "arguments"
         super().set_parent(n_parent)
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_name.visit(self, function, "Name")
-        self.n_class_name.visit(self, function, "Class")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        yield "Name", self.n_name
+        yield "Class", self.n_class_name
 
 
 class Class_Enumeration(Node):
@@ -1524,11 +1566,10 @@ class Class_Enumeration(Node):
         assert n_parent.kind() == "enumeration"
         super().set_parent(n_parent)
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_name.visit(self, function, "Name")
-        self._visit_list(self.l_args, function, "Arguments")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        yield "Name", self.n_name
+        for n_item in self.l_args:
+            yield "Arguments", n_item
 
     def sty_check_naming(self, mh, cfg):
         assert isinstance(mh, Message_Handler)
@@ -1583,12 +1624,10 @@ class Action(Node):
             assert isinstance(n_parent, Switch_Statement)
         super().set_parent(n_parent)
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
+    def children(self):
         if self.n_expr:
-            self.n_expr.visit(self, function, "Guard")
-        self.n_body.visit(self, function, "Body")
-        self._visit_end(parent, function, relation)
+            yield "Guard", self.n_expr
+        yield "Body", self.n_body
 
 
 class Row(Node):
@@ -1615,10 +1654,9 @@ class Row(Node):
         n_item.set_parent(self)
         self.l_items.append(n_item)
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self._visit_list(self.l_items, function, "Items")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        for n_item in self.l_items:
+            yield "Items", n_item
 
     def is_empty(self):
         return not bool(self.l_items)
@@ -1647,10 +1685,9 @@ class Row_List(Node):
         n_item.set_parent(self)
         self.l_items.append(n_item)
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self._visit_list(self.l_items, function, "Items")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        for n_item in self.l_items:
+            yield "Items", n_item
 
 
 ##############################################################################
@@ -1692,11 +1729,10 @@ class Reference(Name):
         for n_arg in self.l_args:
             n_arg.set_parent(self)
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_ident.visit(self, function, "Name")
-        self._visit_list(self.l_args, function, "Arguments")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        yield "Name", self.n_ident
+        for n_item in self.l_args:
+            yield "Arguments", n_item
 
     def __str__(self):
         if self.l_args:
@@ -1726,11 +1762,10 @@ class Cell_Reference(Name):
         self.l_args.append(n_arg)
         n_arg.set_parent(self)
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_ident.visit(self, function, "Name")
-        self._visit_list(self.l_args, function, "Arguments")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        yield "Name", self.n_ident
+        for n_item in self.l_args:
+            yield "Arguments", n_item
 
     def __str__(self):
         if self.l_args:
@@ -1777,8 +1812,7 @@ class Identifier(Name):
         if self.t_ident.kind == "OPERATOR" and self.t_ident.value == "~":
             return
 
-        regex = cfg.style_config["regex_" + kind + "_name"]
-        if not re.match("^(" + regex + ")$", self.t_ident.value):
+        if not cfg.naming_regex(kind).match(self.t_ident.value):
             mh.style_issue(self.t_ident.location,
                            "violates naming scheme for %s" % kind,
                            check_id)
@@ -1816,11 +1850,9 @@ class Selection(Name):
     def loc(self):
         return self.t_selection.location
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_prefix.visit(self, function, "Prefix")
-        self.n_field.visit(self, function, "Field")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        yield "Prefix", self.n_prefix
+        yield "Field", self.n_field
 
     def __str__(self):
         return "%s.%s" % (self.n_prefix, self.n_field)
@@ -1852,11 +1884,9 @@ class Dynamic_Selection(Name):
     def loc(self):
         return self.t_selection.location
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_prefix.visit(self, function, "Prefix")
-        self.n_field.visit(self, function, "Field")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        yield "Prefix", self.n_prefix
+        yield "Field", self.n_field
 
     def __str__(self):
         return "%s.(%s)" % (self.n_prefix, self.n_field)
@@ -1885,11 +1915,9 @@ class Superclass_Reference(Name):
     def loc(self):
         return self.t_at.location
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_prefix.visit(self, function, "Prefix")
-        self.n_reference.visit(self, function, "Reference")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        yield "Prefix", self.n_prefix
+        yield "Reference", self.n_reference
 
     def __str__(self):
         return "%s@%s" % (self.n_prefix, self.n_reference)
@@ -1932,7 +1960,7 @@ class For_Loop_Statement(Compound_Statement):
         self.n_body = n_body
         self.n_body.set_parent(self)
 
-    def visit(self, parent, function, relation):
+    def children(self):
         raise ICE("reached visit procedure for abstract base class for"
                   " for-loops")
 
@@ -1952,12 +1980,10 @@ class General_For_Statement(For_Loop_Statement):
         self.n_expr = n_expr
         self.n_expr.set_parent(self)
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_ident.visit(self, function, "Identifier")
-        self.n_expr.visit(self, function, "Expression")
-        self.n_body.visit(self, function, "Body")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        yield "Identifier", self.n_ident
+        yield "Expression", self.n_expr
+        yield "Body", self.n_body
 
 
 class Parallel_For_Statement(For_Loop_Statement):
@@ -1983,14 +2009,12 @@ class Parallel_For_Statement(For_Loop_Statement):
         self.n_workers = n_workers
         self.n_workers.set_parent(self)
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_ident.visit(self, function, "Identifier")
-        self.n_range.visit(self, function, "Range")
+    def children(self):
+        yield "Identifier", self.n_ident
+        yield "Range", self.n_range
         if self.n_workers:
-            self.n_workers.visit(self, function, "Workers")
-        self.n_body.visit(self, function, "Body")
-        self._visit_end(parent, function, relation)
+            yield "Workers", self.n_workers
+        yield "Body", self.n_body
 
 
 class While_Statement(Compound_Statement):
@@ -2020,11 +2044,9 @@ class While_Statement(Compound_Statement):
         self.n_body = n_body
         self.n_body.set_parent(self)
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_guard.visit(self, function, "Guard")
-        self.n_body.visit(self, function, "Body")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        yield "Guard", self.n_guard
+        yield "Body", self.n_body
 
 
 class If_Statement(Compound_Statement):
@@ -2054,10 +2076,9 @@ class If_Statement(Compound_Statement):
     def loc(self):
         return self.l_actions[0].loc()
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self._visit_list(self.l_actions, function, "Action")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        for n_item in self.l_actions:
+            yield "Action", n_item
 
 
 class Switch_Statement(Compound_Statement):
@@ -2095,11 +2116,10 @@ class Switch_Statement(Compound_Statement):
         if n_action.kind() == "otherwise":
             self.has_otherwise = True
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_expr.visit(self, function, "Guard")
-        self._visit_list(self.l_actions, function, "Action")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        yield "Guard", self.n_expr
+        for n_item in self.l_actions:
+            yield "Action", n_item
 
 
 class Try_Statement(Compound_Statement):
@@ -2150,14 +2170,12 @@ class Try_Statement(Compound_Statement):
         self.n_ident = n_ident
         self.n_ident.set_parent(self)
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_body.visit(self, function, "Body")
+    def children(self):
+        yield "Body", self.n_body
         if self.n_ident:
-            self.n_ident.visit(self, function, "Identifier")
+            yield "Identifier", self.n_ident
         if self.n_handler:
-            self.n_handler.visit(self, function, "Handler")
-        self._visit_end(parent, function, relation)
+            yield "Handler", self.n_handler
 
 
 class SPMD_Statement(Compound_Statement):
@@ -2182,10 +2200,8 @@ class SPMD_Statement(Compound_Statement):
         self.n_body = n_body
         self.n_body.set_parent(self)
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_body.visit(self, function, "Body")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        yield "Body", self.n_body
 
 
 ##############################################################################
@@ -2216,11 +2232,9 @@ class Simple_Assignment_Statement(Simple_Statement):
     def loc(self):
         return self.t_eq.location
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_lhs.visit(self, function, "LHS")
-        self.n_rhs.visit(self, function, "RHS")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        yield "LHS", self.n_lhs
+        yield "RHS", self.n_rhs
 
 
 class Compound_Assignment_Statement(Simple_Statement):
@@ -2268,11 +2282,10 @@ class Compound_Assignment_Statement(Simple_Statement):
         self.n_rhs = n_rhs
         self.n_rhs.set_parent(self)
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self._visit_list(self.l_lhs, function, "LHS")
-        self.n_rhs.visit(self, function, "RHS")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        for n_item in self.l_lhs:
+            yield "LHS", n_item
+        yield "RHS", self.n_rhs
 
 
 class Naked_Expression_Statement(Simple_Statement):
@@ -2287,10 +2300,8 @@ class Naked_Expression_Statement(Simple_Statement):
     def loc(self):
         return self.n_expr.loc()
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_expr.visit(self, function, "Expression")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        yield "Expression", self.n_expr
 
 
 class Return_Statement(Simple_Statement):
@@ -2357,10 +2368,9 @@ class Global_Statement(Simple_Statement):
         n_name.set_parent(self)
         self.l_names.append(n_name)
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self._visit_list(self.l_names, function, "Names")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        for n_item in self.l_names:
+            yield "Names", n_item
 
 
 class Persistent_Statement(Simple_Statement):
@@ -2385,10 +2395,9 @@ class Persistent_Statement(Simple_Statement):
         n_name.set_parent(self)
         self.l_names.append(n_name)
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self._visit_list(self.l_names, function, "Names")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        for n_item in self.l_names:
+            yield "Names", n_item
 
 
 class Import_Statement(Simple_Statement):
@@ -2504,10 +2513,8 @@ class Metric_Justification_Pragma(Justification_Pragma):
     def reason(self):
         return self.n_reason.evaluate_static_string_expression()
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_reason.visit(self, function, "Reason")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        yield "Reason", self.n_reason
 
 
 ##############################################################################
@@ -2641,13 +2648,11 @@ class Range_Expression(Expression):
     def loc(self):
         return self.t_first_colon.location
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_first.visit(self, function, "First")
+    def children(self):
+        yield "First", self.n_first
         if self.n_stride:
-            self.n_stride.visit(self, function, "Stride")
-        self.n_last.visit(self, function, "Last")
-        self._visit_end(parent, function, relation)
+            yield "Stride", self.n_stride
+        yield "Last", self.n_last
 
     def __str__(self):
         if self.n_stride:
@@ -2686,10 +2691,8 @@ class Matrix_Expression(Expression):
         self.t_close = t_close
         self.t_close.set_ast(self)
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_content.visit(self, function, "Content")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        yield "Content", self.n_content
 
 
 class Cell_Expression(Expression):
@@ -2721,10 +2724,8 @@ class Cell_Expression(Expression):
         self.t_close = t_close
         self.t_close.set_ast(self)
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_content.visit(self, function, "Content")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        yield "Content", self.n_content
 
 
 class Function_Call(Expression):
@@ -2760,12 +2761,11 @@ class Function_Call(Expression):
     def loc(self):
         return self.n_name.loc()
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
+    def children(self):
         if self.variant != "escape":
-            self.n_name.visit(self, function, "Name")
-        self._visit_list(self.l_args, function, "Arguments")
-        self._visit_end(parent, function, relation)
+            yield "Name", self.n_name
+        for n_item in self.l_args:
+            yield "Arguments", n_item
 
     def __str__(self):
         if self.variant == "normal":
@@ -2809,10 +2809,8 @@ class Unary_Operation(Expression):
     def loc(self):
         return self.t_op.location
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_expr.visit(self, function, "Expression")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        yield "Expression", self.n_expr
 
     def __str__(self):
         if self.t_op.value in (".'", "'"):
@@ -2855,11 +2853,9 @@ class Binary_Operation(Expression):
     def loc(self):
         return self.t_op.location
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_lhs.visit(self, function, "LHS")
-        self.n_rhs.visit(self, function, "RHS")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        yield "LHS", self.n_lhs
+        yield "RHS", self.n_rhs
 
     def __str__(self):
         return "(%s %s %s)" % (self.n_lhs, self.t_op.value, self.n_rhs)
@@ -2915,11 +2911,10 @@ class Lambda_Function(Expression):
         self.n_body = n_body
         self.n_body.set_parent(self)
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self._visit_list(self.l_parameters, function, "Parameters")
-        self.n_body.visit(self, function, "Body")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        for n_item in self.l_parameters:
+            yield "Parameters", n_item
+        yield "Body", self.n_body
 
     def __str__(self):
         return "@(%s) %s" % (",".join(map(str, self.l_parameters)),
@@ -2944,10 +2939,8 @@ class Function_Pointer(Expression):
     def loc(self):
         return self.t_at.location
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_name.visit(self, function, "Name")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        yield "Name", self.n_name
 
     def __str__(self):
         return "@" + str(self.n_name)
@@ -2971,10 +2964,8 @@ class Metaclass(Expression):
     def loc(self):
         return self.t_mc.location
 
-    def visit(self, parent, function, relation):
-        self._visit(parent, function, relation)
-        self.n_name.visit(self, function, "Name")
-        self._visit_end(parent, function, relation)
+    def children(self):
+        yield "Name", self.n_name
 
     def __str__(self):
         return "?" + str(self.n_name)
@@ -111,6 +111,18 @@ class MATLAB_Lexer(Token_Generator):
         self.col_offset = 0
         self.line = 1
 
+        self.tab_width = None
+        self.raw_line = self.context_line
+        self.visual_map = {}
+        # If set (see correct_tabs), we report columns as if all tabs
+        # were expanded. The visual_map caches the raw column to
+        # visual column mapping for each line with tabs.
+
+        self.kept_tabs = set()
+        # (line, raw column) of all tabs that are part of a token
+        # (such as a string) and are therefore never replaced when
+        # correcting tabs.
+
         self.first_in_line = True
         # Keep track if this would be the first token on a
         # typographical line (i.e. we do not take into account line
@@ -190,23 +202,66 @@ class MATLAB_Lexer(Token_Generator):
         return len(self.context_line)
 
     def correct_tabs(self, tabwidth):
+        # Request that tabs are replaced with spaces. We do not change
+        # the text we lex; instead all locations we produce are in
+        # terms of visual columns (i.e. as if tabs were expanded to
+        # the next multiple of tabwidth), and the text of comments and
+        # continuations has its tabs expanded. Tabs inside strings
+        # and other literal text are preserved.
         assert isinstance(tabwidth, int) and tabwidth >= 2
 
-        new_lines = []
-        for line in self.context_line:
-            tmp = ""
-            for c in line:
-                if c == "\t":
-                    tmp += " " * (tabwidth - (len(tmp) % tabwidth))
-                else:
-                    tmp += c
-            new_lines.append(tmp)
-        self.context_line = new_lines
-        self.text = "\n".join(new_lines) + "\n"
+        self.tab_width = tabwidth
+        self.raw_line = self.context_line
+        self.context_line = [line.expandtabs(tabwidth)
+                             if "\t" in line
+                             else line
+                             for line in self.raw_line]
 
+        # As a side-effect the fixed file always ends in a newline,
+        # so we lex it like that.
+        self.text = "\n".join(self.raw_line) + "\n"
         self.cc = None
         self.nc = self.text[0] if len(self.text) > 0 else "\0"
         self.nnc = self.text[1] if len(self.text) > 1 else "\0"
+        self.nnnc = self.text[2] if len(self.text) > 2 else "\0"
+
+    def visual_col(self, col, line=None):
+        # Map a raw column on the given (by default the current) line
+        # to its visual column (if we're correcting tabs). The mapping
+        # for each line is only built when we first need it, and only
+        # for lines that actually contain a tab.
+        if line is None:
+            line = self.line
+        if self.tab_width is None or \
+           line > len(self.raw_line) or \
+           "\t" not in self.raw_line[line - 1]:
+            return col
+
+        if line not in self.visual_map:
+            mapping = []
+            vcol = 0
+            for c in self.raw_line[line - 1]:
+                mapping.append(vcol)
+                if c == "\t":
+                    vcol += self.tab_width - (vcol % self.tab_width)
+                else:
+                    vcol += 1
+            mapping.append(vcol)
+            self.visual_map[line] = mapping
+        mapping = self.visual_map[line]
+
+        if col < len(mapping):
+            return mapping[col]
+        else:
+            # Beyond the end of the line (e.g. the newline)
+            return mapping[-1] + (col - (len(mapping) - 1))
+
+    def expand_tabs(self, text, vcol):
+        # Expand tabs in text that starts on visual column vcol
+        if self.tab_width is None or "\t" not in text:
+            return text
+        offset = vcol % self.tab_width
+        return (" " * offset + text).expandtabs(self.tab_width)[offset:]
 
     def skip(self):
         self.lexpos += 1
@@ -233,11 +288,12 @@ class MATLAB_Lexer(Token_Generator):
             return match.group(0)
 
     def lex_error(self, message=None):
+        col = self.visual_col(self.lexpos - self.col_offset)
         self.mh.lex_error(Location(filename =self.filename,
                                    blockname=self.blockname,
                                    line     =self.line,
-                                   col_start=self.lexpos - self.col_offset,
-                                   col_end  =self.lexpos - self.col_offset,
+                                   col_start=col,
+                                   col_end  =col,
                                    context  =self.context_line[self.line - 1]),
                           (message
                            if message
@@ -257,7 +313,7 @@ class MATLAB_Lexer(Token_Generator):
         if self.add_comma:
             self.add_comma = False
             fake_line = self.context_line[self.line - 1]
-            fake_col = self.lexpos - self.col_offset + 1
+            fake_col = self.visual_col(self.lexpos - self.col_offset + 1)
             fake_line = fake_line[:fake_col] + "<anon,>" + fake_line[fake_col:]
             token = m_ast.MATLAB_Token(
                 self.language,
@@ -433,10 +489,12 @@ class MATLAB_Lexer(Token_Generator):
                               Location(filename  = self.filename,
                                        blockname = self.blockname,
                                        line      = self.line,
-                                       col_start = (self.lexpos + 1 -
-                                                    self.col_offset),
-                                       col_end   = (self.lexpos + 1 -
-                                                    self.col_offset),
+                                       col_start = self.visual_col(
+                                           self.lexpos + 1 -
+                                           self.col_offset),
+                                       col_end   = self.visual_col(
+                                           self.lexpos + 1 -
+                                           self.col_offset),
                                        context   =
                                          self.context_line[self.line - 1])
 
@@ -807,6 +865,19 @@ class MATLAB_Lexer(Token_Generator):
             raise ICE("line is larger than the length of the file %s" %
                       self.filename)
 
+        # Map columns if we're correcting tabs. We also fix tabs in
+        # comments, but not in strings or anything else where they
+        # could have a meaning.
+        if "\t" in raw_text and kind not in ("COMMENT", "CONTINUATION"):
+            self.kept_tabs.update((self.line, col_start + offset)
+                                  for offset, c in enumerate(raw_text)
+                                  if c == "\t")
+        if self.tab_width is not None:
+            col_start = self.visual_col(col_start)
+            col_end   = self.visual_col(col_end)
+            if kind in ("COMMENT", "CONTINUATION"):
+                raw_text = self.expand_tabs(raw_text, col_start)
+
         ######################################################################
         # Create token
 
@@ -1212,11 +1283,18 @@ class Token_Buffer(Token_Generator):
         self.mh = lexer.mh
         self.lines = lexer.line_count()
 
+        self.definition_positions = []
+        # Positions of all function and classdef keywords. Used to
+        # find docstrings without scanning all tokens.
+
         while True:
             tok = lexer.token()
             if tok is None:
                 break
             else:
+                if tok.kind == "KEYWORD" and tok.value in ("function",
+                                                           "classdef"):
+                    self.definition_positions.append(len(self.tokens))
                 self.tokens.append(tok)
 
     def token(self):
@@ -1440,7 +1518,8 @@ class Token_Buffer(Token_Generator):
 
         # Regurgitate the processed tokens to re-create the source
         # file, including comments
-        rv = ""
+        rv = []
+        use_correct_indent = self.cfg.active("indentation")
         for n, token in enumerate(new_tokens):
             if n + 1 < len(new_tokens):
                 next_token = new_tokens[n + 1]
@@ -1452,11 +1531,11 @@ class Token_Buffer(Token_Generator):
                 next_in_line = None
 
             if token.first_in_line:
-                if self.cfg.active("indentation") and \
+                if use_correct_indent and \
                    token.fix.correct_indent is not None:
-                    rv += " " * token.fix.correct_indent
+                    rv.append(" " * token.fix.correct_indent)
                 else:
-                    rv += " " * token.location.col_start
+                    rv.append(" " * token.location.col_start)
 
             if token.kind == "NEWLINE":
                 amount = min(2, token.raw_text.count("\n"))
@@ -1465,14 +1544,15 @@ class Token_Buffer(Token_Generator):
                     # newline. This newline is inserted manually at
                     # the end
                     amount = 0
-                rv += "\n" * amount
+                rv.append("\n" * amount)
             elif token.kind == "CONTINUATION":
-                rv += token.raw_text.rstrip() + "\n"
+                rv.append(token.raw_text.rstrip())
+                rv.append("\n")
             else:
-                rv += token.raw_text.rstrip()
+                rv.append(token.raw_text.rstrip())
 
             if token.fix.add_semicolon_after:
-                rv += ";"
+                rv.append(";")
 
             if next_in_line and next_in_line.kind != "NEWLINE":
                 gap = (next_in_line.location.col_start -
@@ -1503,10 +1583,10 @@ class Token_Buffer(Token_Generator):
                     else:
                         gap = min(gap, 1)
 
-                rv += " " * gap
-        rv += "\n"
+                rv.append(" " * gap)
+        rv.append("\n")
 
-        return rv
+        return "".join(rv)
 
     def debug_validate_links(self):
         for token in self.tokens:
@@ -23,9 +23,11 @@
 ##                                                                          ##
 ##############################################################################
 
+import itertools
+
 from miss_hit_core.errors import Message_Handler
 from miss_hit_core.m_ast import *
-from miss_hit_core.m_lexer import Token_Buffer
+from miss_hit_core.m_lexer import MATLAB_Lexer, Token_Buffer
 
 
 def parse_docstrings(mh, cfg, parse_tree, tbuf):
@@ -34,46 +36,107 @@ def parse_docstrings(mh, cfg, parse_tree, tbuf):
     assert isinstance(parse_tree, Compilation_Unit)
     assert isinstance(tbuf, Token_Buffer)
 
+    re_copyright = cfg.copyright_regex()
+    tokens = tbuf.tokens
+
     # The compilation unit's docstring are the leading comments in the
     # file (if any).
 
-    approaching_docstring = False
-    in_docstring = tbuf.tokens and tbuf.tokens[0].kind == "COMMENT"
-    if in_docstring:
-        ast_node = Docstring(cfg.style_config["copyright_regex"])
+    if tokens and tokens[0].kind == "COMMENT":
+        ast_node = Docstring(re_copyright)
         parse_tree.set_docstring(ast_node)
-    else:
-        ast_node = None
-
-    for token in tbuf.tokens:
-        # Recognise docstrings
-        if approaching_docstring:
-            # In this mode we keep eating tokens until we get to the
-            # first comment token, that is a _new_ statement. This
-            # deals with line continuations.
-            if token.first_in_statement:
-                if token.kind == "COMMENT":
-                    in_docstring = True
-                approaching_docstring = False
-
-        if in_docstring:
-            # In this mode we eat comments and newlines until we get
-            # to a non-comment token, or more than one newline.
+        eat_docstring(tokens, 0, ast_node)
+
+    # Function and class docstrings follow the function or classdef
+    # keyword. The token buffer knows where these are, so we only
+    # need to look at the tokens following them.
+
+    for pos in tbuf.definition_positions:
+        token = tokens[pos]
+        if token.ast_link is None:
+            raise ICE("keyword is not linked to AST")
+        elif not isinstance(token.ast_link, Definition):
+            raise ICE("AST link is %s and not a Definition" %
+                      token.ast_link.__class__.__name__)
+        ast_node = Docstring(re_copyright)
+        token.ast_link.set_docstring(ast_node)
+
+        # We keep eating tokens until we get to the first comment
+        # token, that is a _new_ statement. This deals with line
+        # continuations.
+        for n in range(pos + 1, len(tokens)):
+            if tokens[n].first_in_statement:
+                if tokens[n].kind == "COMMENT":
+                    eat_docstring(tokens, n, ast_node)
+                break
+
+
+def parse_header_docstrings(cfg, lexer):
+    """ Build file and primary entity docstrings from the file header
+
+    This is a cheaper alternative to parse_docstrings for tools that
+    only care about the header of a file (e.g. mh_copyright). Instead
+    of parsing the entire file we only lex the leading comments and,
+    if the file starts with a function or classdef, the comments
+    following its signature.
+
+    Returns a tuple of two docstrings (file, primary entity); either
+    of which may be None.
+    """
+    assert isinstance(lexer, MATLAB_Lexer)
+
+    re_copyright = cfg.copyright_regex()
+    n_file_docstring = None
+    n_entity_docstring = None
+
+    def eat_comments(token, n_docstring):
+        # Like eat_docstring, but pulling tokens directly from the
+        # lexer. Returns the first token that is not part of the
+        # docstring.
+        while token is not None and token.kind in ("COMMENT", "NEWLINE"):
             if token.kind == "COMMENT":
-                ast_node.add_comment(token)
-            elif token.kind == "NEWLINE":
-                pass
-            else:
-                in_docstring = False
-
-        if token.kind == "KEYWORD" and token.value in ("function",
-                                                       "classdef"):
-            # Recognise function docstrings
-            approaching_docstring = True
-            if token.ast_link is None:
-                raise ICE("keyword is not linked to AST")
-            elif not isinstance(token.ast_link, Definition):
-                raise ICE("AST link is %s and not a Definition" %
-                          token.ast_link.__class__.__name__)
-            ast_node = Docstring(cfg.style_config["copyright_regex"])
-            token.ast_link.set_docstring(ast_node)
+                n_docstring.add_comment(token)
+            token = lexer.token()
+        return token
+
+    token = lexer.token()
+    if token is not None and token.kind == "COMMENT":
+        n_file_docstring = Docstring(re_copyright)
+        token = eat_comments(token, n_file_docstring)
+
+    # Skip any further comments, newlines and pragmas, just like the
+    # parser does when deciding what kind of file this is.
+    while token is not None and (token.annotation or
+                                 token.kind in ("COMMENT",
+                                                "NEWLINE",
+                                                "ANNOTATION")):
+        token = lexer.token()
+
+    # The first real token tells us if this is a function or class
+    # file. Only then do we have a primary entity docstring, which
+    # is the first comment that starts a new statement.
+    if token is not None and \
+       token.kind == "KEYWORD" and \
+       token.value in ("function", "classdef"):
+        n_entity_docstring = Docstring(re_copyright)
+        token = lexer.token()
+        while token is not None and not token.first_in_statement:
+            token = lexer.token()
+        if token is not None and token.kind == "COMMENT":
+            eat_comments(token, n_entity_docstring)
+
+    return n_file_docstring, n_entity_docstring
+
+
+def eat_docstring(tokens, pos, n_docstring):
+    # Add comments starting at the given position to the docstring,
+    # until we get to a non-comment token. Newlines are ignored.
+    assert isinstance(tokens, list)
+    assert isinstance(pos, int)
+    assert isinstance(n_docstring, Docstring)
+
+    for token in itertools.islice(tokens, pos, None):
+        if token.kind == "COMMENT":
+            n_docstring.add_comment(token)
+        elif token.kind != "NEWLINE":
+            break
@@ -32,6 +32,8 @@ import sys
 import html
 import functools
 import json
+import csv
+import gzip
 
 from miss_hit_core import command_line
 from miss_hit_core import work_package
@@ -43,185 +45,19 @@ from miss_hit_core.m_ast import *
 from miss_hit_core.m_lexer import MATLAB_Lexer
 from miss_hit_core.m_parser import MATLAB_Parser
 
-MEASURE = {m : None for m in config.METRICS}
-
-
-def measures(metric_name):
-    assert isinstance(metric_name, str)
-    assert metric_name in config.METRICS
-
-    def decorator(func):
-        MEASURE[metric_name] = func
-        return func
-
-    return decorator
-
-
 ##############################################################################
 # Metrics
 ##############################################################################
 
-@measures("npath")
-def npath(node):
-    assert isinstance(node, (Sequence_Of_Statements,
-                             Statement,
-                             Pragma,
-                             Function_Definition,
-                             Script_File))
-
-    if isinstance(node, Function_Definition):
-        return npath(node.n_body)
-
-    elif isinstance(node, Script_File):
-        return npath(node.n_statements)
-
-    elif isinstance(node, Sequence_Of_Statements):
-        paths = 1
-        for n_statement in node.l_statements:
-            if isinstance(n_statement, (If_Statement,
-                                        For_Loop_Statement,
-                                        Switch_Statement,
-                                        Try_Statement,
-                                        While_Statement)):
-                paths *= npath(n_statement)
-        return paths
-
-    elif isinstance(node, If_Statement):
-        paths = 0
-        for n_action in node.l_actions:
-            paths += npath(n_action.n_body)
-        if not node.has_else:
-            paths += 1
-
-        return paths
-
-    elif isinstance(node, Switch_Statement):
-        paths = 0
-        for n_action in node.l_actions:
-            paths += npath(n_action.n_body)
-        if not node.has_otherwise:
-            paths += 1
-
-        return paths
-
-    elif isinstance(node, (For_Loop_Statement, While_Statement)):
-        return 1 + npath(node.n_body)
-
-    elif isinstance(node, Try_Statement):
-        return npath(node.n_body) * 2
-
-    else:
-        raise ICE("unexpected node %s" % node.__class__.__name__)
-
-
-@measures("cnest")
-def cnest(node):
-    assert isinstance(node, (Sequence_Of_Statements,
-                             Statement,
-                             Pragma,
-                             Function_Definition,
-                             Script_File))
-
-    if isinstance(node, Function_Definition):
-        return cnest(node.n_body)
-
-    elif isinstance(node, Script_File):
-        return cnest(node.n_statements)
-
-    elif isinstance(node, Sequence_Of_Statements):
-        return max(map(cnest, node.l_statements),
-                   default=0)
-
-    elif isinstance(node, (Simple_Statement,
-                           Pragma)):
-        return 0
-
-    elif isinstance(node, SPMD_Statement):
-        return cnest(node.n_body)
-
-    elif isinstance(node, If_Statement):
-        return 1 + max((cnest(a.n_body) for a in node.l_actions),
-                       default=0)
-
-    elif isinstance(node, Switch_Statement):
-        return 1 + max((cnest(a.n_body) for a in node.l_actions),
-                       default=0)
-
-    elif isinstance(node, (For_Loop_Statement, While_Statement)):
-        return 1 + cnest(node.n_body)
-
-    elif isinstance(node, Try_Statement):
-        if node.n_handler:
-            return 1 + max(cnest(node.n_body),
-                           cnest(node.n_handler))
-        else:
-            return 1 + cnest(node.n_body)
-
-    else:
-        raise ICE("unexpected node %s" % node.__class__.__name__)
-
-
-@measures("parameters")
-def parameters(node):
-    assert isinstance(node, (Function_Definition,
-                             Script_File))
-
-    if isinstance(node, Function_Definition):
-        return len(node.n_sig.l_inputs) + len(node.n_sig.l_outputs)
-
-    else:
-        return 0
-
-
-@measures("globals")
-def direct_globals(node):
-    assert isinstance(node, (Function_Definition,
-                             Script_File))
-
-    class Global_Visitor(AST_Visitor):
-        def __init__(self):
-            self.names = set()
-
-        def visit(self, node, n_parent, relation):
-            if isinstance(node, Global_Statement):
-                self.names |= set(n_ident.t_ident.value
-                                  for n_ident in node.l_names)
-
-    gvis = Global_Visitor()
-
-    if isinstance(node, Function_Definition):
-        node.n_body.visit(None, gvis, "Root")
-    else:
-        node.n_statements.visit(None, gvis, "Root")
-
-    return len(gvis.names)
-
-
-@measures("persistent")
-def persistent_variables(node):
-    assert isinstance(node, (Function_Definition,
-                             Script_File))
-
-    class Persistent_Visitor(AST_Visitor):
-        def __init__(self):
-            self.names = set()
-
-        def visit(self, node, n_parent, relation):
-            if isinstance(node, Persistent_Statement):
-                self.names |= set(n_ident.t_ident.value
-                                  for n_ident in node.l_names)
-
-    pvis = Persistent_Visitor()
+# Statements that contribute (multiplicatively) to the number of paths
+# through a sequence of statements.
+NPATH_STATEMENTS = (If_Statement,
+                    For_Loop_Statement,
+                    Switch_Statement,
+                    Try_Statement,
+                    While_Statement)
 
-    if isinstance(node, Function_Definition):
-        node.n_body.visit(None, pvis, "Root")
-    else:
-        node.n_statements.visit(None, pvis, "Root")
 
-    return len(pvis.names)
-
-
-@measures("function_length")
 def function_length(node):
     assert isinstance(node, (Function_Definition,
                              Script_File))
@@ -254,52 +90,237 @@ def function_length(node):
             return n_cu.file_length - node.t_fun.location.line + 1
 
 
-@measures("cyc")
-def cyclomatic_complexity(node):
+def parameters(node):
     assert isinstance(node, (Function_Definition,
                              Script_File))
-    # See
-    # https://uk.mathworks.com/help/matlab/ref/logicaloperatorsshortcircuit.html
-    # for short-circuit semantics
-
-    class Cyclomatic_Complexity_Visitor(AST_Visitor):
-        def __init__(self):
-            self.metric = 1
-
-        def visit(self, node, n_parent, relation):
-            if isinstance(node, Binary_Logical_Operation):
-                if node.short_circuit:
-                    self.metric += 1
-            elif isinstance(node, (For_Loop_Statement,
-                                   While_Statement,
-                                   Try_Statement)):
-                self.metric += 1
-            elif isinstance(node, If_Statement):
-                if node.has_else:
-                    self.metric += len(node.l_actions) - 1
-                else:
-                    self.metric += len(node.l_actions)
-            elif isinstance(node, Switch_Statement):
-                if node.has_otherwise:
-                    self.metric += len(node.l_actions) - 1
-                else:
-                    self.metric += len(node.l_actions)
-
-    cvis = Cyclomatic_Complexity_Visitor()
 
     if isinstance(node, Function_Definition):
-        node.n_body.visit(None, cvis, "Root")
+        return len(node.n_sig.l_inputs) + len(node.n_sig.l_outputs)
+
     else:
-        node.n_statements.visit(None, cvis, "Root")
+        return 0
+
+
+class Function_Metrics_Visitor(AST_Visitor):
+    """ Computes all enabled function metrics in a single traversal
+
+    The path count (npath) and control nesting (cnest) are computed
+    bottom-up and recorded for each statement (and sequence of
+    statements) so that each sub-tree is only considered once. The
+    remaining metrics are accumulated for the innermost function
+    whose body we are currently in. Nested functions are not part of
+    the body of their parent, and so are only visited once.
+    """
+    def __init__(self, enabled, npath_limit=None):
+        assert isinstance(enabled, frozenset)
+        assert npath_limit is None or callable(npath_limit)
+        self.enabled = enabled
+
+        self.npath_limit = npath_limit
+        # Path counts can become astronomically large. If there is a
+        # limit (a function giving the limit for each function
+        # definition), then we stop counting once we exceed it.
+
+        self.saturated = set()
+        # Functions (uids) where we stopped counting paths
+
+        self.npath = {}
+        self.cnest = {}
+        # node uid -> measure, for statements and sequences
+
+        self.frames = []
+        # Stack of functions (or script) we are currently in
+
+        self.results = []
+        # List of (node, metrics) in order of definition
+
+    def visit(self, node, n_parent, relation):
+        if isinstance(node, (Function_Definition, Script_File)):
+            metrics = {}
+            self.results.append((node, metrics))
+            if self.npath_limit and "npath" in self.enabled:
+                npath_cap = self.npath_limit(node) + 1
+            else:
+                npath_cap = None
+            self.frames.append({
+                "node"       : node,
+                "body"       : (node.n_body
+                                if isinstance(node, Function_Definition)
+                                else node.n_statements),
+                "active"     : False,
+                "metrics"    : metrics,
+                "npath_cap"  : npath_cap,
+                "cyc"        : 1,
+                "globals"    : set(),
+                "persistent" : set(),
+            })
+            return
+
+        elif not self.frames:
+            return
+
+        frame = self.frames[-1]
+        if node is frame["body"]:
+            frame["active"] = True
+        elif not frame["active"]:
+            return
+
+        # See
+        # https://uk.mathworks.com/help/matlab/ref/logicaloperatorsshortcircuit.html
+        # for short-circuit semantics
+        if isinstance(node, Binary_Logical_Operation):
+            if node.short_circuit:
+                frame["cyc"] += 1
+        elif isinstance(node, (For_Loop_Statement,
+                               While_Statement,
+                               Try_Statement)):
+            frame["cyc"] += 1
+        elif isinstance(node, If_Statement):
+            if node.has_else:
+                frame["cyc"] += len(node.l_actions) - 1
+            else:
+                frame["cyc"] += len(node.l_actions)
+        elif isinstance(node, Switch_Statement):
+            if node.has_otherwise:
+                frame["cyc"] += len(node.l_actions) - 1
+            else:
+                frame["cyc"] += len(node.l_actions)
+        elif isinstance(node, Global_Statement):
+            frame["globals"] |= set(n_ident.t_ident.value
+                                    for n_ident in node.l_names)
+        elif isinstance(node, Persistent_Statement):
+            frame["persistent"] |= set(n_ident.t_ident.value
+                                       for n_ident in node.l_names)
+
+    def visit_end(self, node, n_parent, relation):
+        if not self.frames:
+            return
+
+        frame = self.frames[-1]
+        if node is frame["node"]:
+            self.frames.pop()
+            self.finalize(frame)
+            return
+
+        elif not frame["active"]:
+            return
+
+        if "npath" in self.enabled:
+            self.record_npath(node, frame["npath_cap"])
+        if "cnest" in self.enabled:
+            self.record_cnest(node)
+
+        if node is frame["body"]:
+            frame["active"] = False
+
+    def record_npath(self, node, npath_cap):
+        if isinstance(node, Sequence_Of_Statements):
+            paths = 1
+            for n_statement in node.l_statements:
+                if isinstance(n_statement, NPATH_STATEMENTS):
+                    paths *= self.npath[n_statement.uid]
+                    # Every statement has at least one path, so once
+                    # we're over the limit there is no point in
+                    # continuing
+                    if npath_cap and paths >= npath_cap:
+                        break
+
+        elif isinstance(node, If_Statement):
+            paths = sum(self.npath[n_action.n_body.uid]
+                        for n_action in node.l_actions)
+            if not node.has_else:
+                paths += 1
+
+        elif isinstance(node, Switch_Statement):
+            paths = sum(self.npath[n_action.n_body.uid]
+                        for n_action in node.l_actions)
+            if not node.has_otherwise:
+                paths += 1
+
+        elif isinstance(node, (For_Loop_Statement, While_Statement)):
+            paths = 1 + self.npath[node.n_body.uid]
+
+        elif isinstance(node, Try_Statement):
+            paths = self.npath[node.n_body.uid] * 2
+
+        else:
+            return
 
-    return cvis.metric
+        if npath_cap:
+            self.npath[node.uid] = min(paths, npath_cap)
+        else:
+            self.npath[node.uid] = paths
+
+    def record_cnest(self, node):
+        if isinstance(node, Sequence_Of_Statements):
+            self.cnest[node.uid] = max((self.cnest[n_statement.uid]
+                                        for n_statement in node.l_statements),
+                                       default=0)
+
+        elif isinstance(node, (Simple_Statement,
+                               Pragma)):
+            self.cnest[node.uid] = 0
+
+        elif isinstance(node, SPMD_Statement):
+            self.cnest[node.uid] = self.cnest[node.n_body.uid]
+
+        elif isinstance(node, (If_Statement, Switch_Statement)):
+            self.cnest[node.uid] = 1 + max((self.cnest[a.n_body.uid]
+                                            for a in node.l_actions),
+                                           default=0)
+
+        elif isinstance(node, (For_Loop_Statement, While_Statement)):
+            self.cnest[node.uid] = 1 + self.cnest[node.n_body.uid]
+
+        elif isinstance(node, Try_Statement):
+            if node.n_handler:
+                self.cnest[node.uid] = 1 + max(
+                    self.cnest[node.n_body.uid],
+                    self.cnest[node.n_handler.uid])
+            else:
+                self.cnest[node.uid] = 1 + self.cnest[node.n_body.uid]
+
+        elif isinstance(node, Statement):
+            raise ICE("unexpected node %s" % node.__class__.__name__)
+
+    def finalize(self, frame):
+        node = frame["node"]
+        n_body = frame["body"]
+        measures = {
+            "npath"           : lambda: self.npath[n_body.uid],
+            "cnest"           : lambda: self.cnest[n_body.uid],
+            "parameters"      : lambda: parameters(node),
+            "globals"         : lambda: len(frame["globals"]),
+            "persistent"      : lambda: len(frame["persistent"]),
+            "function_length" : lambda: function_length(node),
+            "cyc"             : lambda: frame["cyc"],
+        }
+        assert set(measures) == set(config.FUNCTION_METRICS)
+
+        for metric in config.FUNCTION_METRICS:
+            if metric in self.enabled:
+                frame["metrics"][metric] = measures[metric]()
+
+        if frame["npath_cap"] and \
+           frame["metrics"]["npath"] >= frame["npath_cap"]:
+            self.saturated.add(node.uid)
 
 
 ##############################################################################
 # Infrastructure
 ##############################################################################
 
-def check_metric(mh, cfg, loc, metric, metrics, justifications):
+def format_measure(mres):
+    # Saturated measures are a lower bound, we only know that we
+    # exceeded the limit
+    if mres["saturated"]:
+        return ">%u" % (mres["measure"] - 1)
+    else:
+        return "%u" % mres["measure"]
+
+
+def check_metric(mh, cfg, loc, metric, metrics, *,
+                 justifications, in_baseline=False):
     if not cfg.metric_enabled(metric):
         return
 
@@ -317,6 +338,18 @@ def check_metric(mh, cfg, loc, metric, metrics, justifications):
                 justifications[metric].applies = True
                 metrics[metric]["reason"] = justifications[metric].reason()
                 metrics[metric]["tickets"] = justifications[metric].tickets
+            elif in_baseline:
+                # This violation is already present in the baseline,
+                # so we don't complain about it again
+                pass
+            elif metrics[metric]["saturated"]:
+                mh.metric_issue(loc,
+                                "exceeded %s: measured at least %u,"
+                                " limit is %u" %
+                                (config.METRICS[metric].longname.lower(),
+                                 measure,
+                                 limit),
+                                metric)
             else:
                 mh.metric_issue(loc,
                                 "exceeded %s: measured %u > limit %u" %
@@ -377,41 +410,79 @@ def get_file_justifications(mh, n_cu):
     return justifications
 
 
-def get_function_metrics(mh, cfg, tree):
+def get_function_metrics(mh, cfg, tree, file_name=None, baseline=None):
     assert isinstance(mh, Message_Handler)
     assert isinstance(cfg, config.Config)
     assert isinstance(tree, Compilation_Unit)
+    assert baseline is None or isinstance(file_name, str)
+    assert baseline is None or isinstance(baseline, Metric_Baseline)
 
     metrics = {}
     justifications = {}
 
-    class Function_Visitor(AST_Visitor):
-        def visit(self, node, n_parent, relation):
-            if isinstance(node, Function_Definition):
-                name = node.get_local_name()
-                n_body = node.n_body
-            elif isinstance(node, Script_File):
-                name = node.get_local_name()
-                n_body = node.n_statements
+    # Compute all metrics in one go
+
+    def npath_limit(node):
+        # We stop counting paths once we exceed the limit. When
+        # comparing against a baseline we need to count at least up
+        # to the baseline measure, so that we can see regressions.
+        # If the baseline itself was saturated we stop at the same
+        # point, so that both sides are capped the same way.
+        limit = cfg.metric_upper_limit("npath")
+        if baseline:
+            baseline_measure = baseline.get_measure(file_name,
+                                                    node.get_local_name(),
+                                                    "npath")
+            if baseline_measure is None:
+                pass
+            elif baseline.is_saturated(file_name,
+                                       node.get_local_name(),
+                                       "npath"):
+                limit = max(limit, baseline_measure - 1)
             else:
-                return
+                limit = max(limit, baseline_measure)
+        return limit
+
+    mvis = Function_Metrics_Visitor(frozenset(m
+                                              for m in config.FUNCTION_METRICS
+                                              if cfg.metric_enabled(m)),
+                                    (npath_limit
+                                     if cfg.metric_check("npath")
+                                     else None))
+    tree.visit(None, mvis, "Root")
+
+    # Check+justify function metrics
+
+    for node, measures in mvis.results:
+        name = node.get_local_name()
+        if isinstance(node, Function_Definition):
+            n_body = node.n_body
+        else:
+            n_body = node.n_statements
 
-            metrics[name] = {m: {"measure" : MEASURE[m](node),
-                                 "limit"   : None,
-                                 "reason"  : None,
-                                 "tickets" : set()}
-                             for m in config.FUNCTION_METRICS
-                             if cfg.metric_enabled(m)}
+        metrics[name] = {m: {"measure"   : measures[m],
+                             "saturated" : (m == "npath" and
+                                            node.uid in mvis.saturated),
+                             "limit"     : None,
+                             "reason"    : None,
+                             "tickets"   : set()}
+                         for m in measures}
 
-            justifications[name] = get_justifications(mh, n_body)
+        justifications[name] = get_justifications(mh, n_body)
 
-            # Check+justify function metrics
-            for function_metric in config.FUNCTION_METRICS:
-                check_metric(mh, cfg, node.loc(), function_metric,
-                             metrics[name],
-                             justifications[name])
+        for function_metric in config.FUNCTION_METRICS:
+            check_metric(mh, cfg, node.loc(), function_metric,
+                         metrics[name],
+                         justifications = justifications[name],
+                         in_baseline    = (
+                             baseline is not None and
+                             function_metric in metrics[name] and
+                             not baseline.regressed_measure(
+                                 file_name,
+                                 name,
+                                 function_metric,
+                                 metrics[name][function_metric])))
 
-    tree.visit(None, Function_Visitor(), "Root")
     return metrics
 
 
@@ -419,17 +490,11 @@ def warn_unused_justifications(mh, n_cu):
     assert isinstance(mh, Message_Handler)
     assert isinstance(n_cu, Compilation_Unit)
 
-    class Justification_Visitor(AST_Visitor):
-        def __init__(self):
-            self.name_stack = []
-
-        def visit(self, node, n_parent, relation):
-            if isinstance(node, Metric_Justification_Pragma):
-                if not node.applies:
-                    mh.warning(node.loc(),
-                               "this justification does not apply to anything")
-
-    n_cu.visit(None, Justification_Visitor(), "Root")
+    for node, _, _ in n_cu.pre_order():
+        if isinstance(node, Metric_Justification_Pragma):
+            if not node.applies:
+                mh.warning(node.loc(),
+                           "this justification does not apply to anything")
 
 
 def write_text_report(fd,
@@ -458,8 +523,8 @@ def write_text_report(fd,
             results = metrics["metrics"][file_metric]
             if results["measure"] is None:
                 continue
-            fd.write("  %s: %u" % (config.METRICS[file_metric].longname,
-                                   results["measure"]))
+            fd.write("  %s: %s" % (config.METRICS[file_metric].longname,
+                                   format_measure(results)))
             if results["reason"]:
                 fd.write(" (%s)\n" % results["reason"])
             elif results["limit"] and results["measure"] > results["limit"]:
@@ -479,10 +544,10 @@ def write_text_report(fd,
                 results = metrics["functions"][function][function_metric]
                 if results["measure"] is None:
                     continue
-                fd.write("    %-*s: %u" %
+                fd.write("    %-*s: %s" %
                          (max_len,
                           config.METRICS[function_metric].longname,
-                          results["measure"]))
+                          format_measure(results)))
                 if results["reason"]:
                     fd.write(" (%s)\n" % results["reason"])
                 elif results["limit"] and \
@@ -502,8 +567,8 @@ def write_text_report(fd,
             for rank, file_name in enumerate(worst_offenders[file_metric], 1):
                 if file_name:
                     mdata = all_metrics[file_name]["metrics"][file_metric]
-                    fd.write("  %u. %u (%s)\n" % (rank,
-                                                  mdata["measure"],
+                    fd.write("  %u. %s (%s)\n" % (rank,
+                                                  format_measure(mdata),
                                                   file_name))
             fd.write("\n")
 
@@ -517,9 +582,9 @@ def write_text_report(fd,
                     file_name, function_name = tup
                     mdata = (all_metrics[file_name]["functions"]
                              [function_name][function_metric])
-                    fd.write("  %u. %u (%s, function %s)\n" %
+                    fd.write("  %u. %s (%s, function %s)\n" %
                              (rank,
-                              mdata["measure"],
+                              format_measure(mdata),
                               file_name,
                               function_name))
             fd.write("\n")
@@ -602,10 +667,10 @@ def write_html_report(fd,
                 if file_name:
                     mdata = all_metrics[file_name]["metrics"][file_metric]
                     fd.write("  <td class='tip' tip='%s'>"
-                             "<a href='#%s'>%u</a></td>\n" %
+                             "<a href='#%s'>%s</a></td>\n" %
                              (os.path.basename(file_name),
                               file_name,
-                              mdata["measure"]))
+                              html.escape(format_measure(mdata))))
 
                 else:
                     fd.write("  <td class='na'></td>\n")
@@ -618,12 +683,11 @@ def write_html_report(fd,
                     mdata = (all_metrics[file_name]["functions"]
                              [function_name][function_metric])
                     fd.write("  <td class='tip' tip='%s'>"
-                             "<a href='#%s'>%u</a></td>\n" %
+                             "<a href='#%s'>%s</a></td>\n" %
                              ("%s in file %s" % (function_name,
                                                  os.path.basename(file_name)),
                               file_name,
-
-                              mdata["measure"]))
+                              html.escape(format_measure(mdata))))
 
                 else:
                     fd.write("  <td class='na'></td>\n")
@@ -715,12 +779,12 @@ def write_html_report(fd,
             if results["measure"] is None:
                 fd.write("  <td class='na'></td>\n")
             elif results["reason"]:
-                fd.write("  <td class='ok_justified tip' tip='%s'>%u</td>\n" %
+                fd.write("  <td class='ok_justified tip' tip='%s'>%s</td>\n" %
                          ("Justification: " + html.escape(results["reason"]),
-                          results["measure"]))
+                          html.escape(format_measure(results))))
             elif results["limit"] and results["measure"] > results["limit"]:
-                fd.write("  <td class='nok'>%u</td>\n" %
-                         results["measure"])
+                fd.write("  <td class='nok'>%s</td>\n" %
+                         html.escape(format_measure(results)))
             else:
                 fd.write("<td class='ok'>%u</td>" % results["measure"])
         fd.write("  <td class='na'></td>\n" * n_active_function_metrics)
@@ -739,14 +803,14 @@ def write_html_report(fd,
                     fd.write("  <td class='na'></td>\n")
                 elif results["reason"]:
                     fd.write("  <td class='ok_justified tip' tip='%s'>"
-                             "%u</td>\n" %
+                             "%s</td>\n" %
                              ("Justification: " +
                               html.escape(results["reason"]),
-                              results["measure"]))
+                              html.escape(format_measure(results))))
                 elif results["limit"] and \
                      results["measure"] > results["limit"]:
-                    fd.write("  <td class='nok'>%u</td>\n" %
-                             results["measure"])
+                    fd.write("  <td class='nok'>%s</td>\n" %
+                             html.escape(format_measure(results)))
                 else:
                     fd.write("  <td class='ok'>%u</td>\n" % results["measure"])
             fd.write("</tr>\n")
@@ -764,28 +828,36 @@ def write_html_report(fd,
     fd.write("</html>\n")
 
 
+def format_metrics_result(mres):
+    if mres["limit"] is None:
+        rv = {"status"  : "measured only",
+              "measure" : mres["measure"]}
+    elif mres["measure"] <= mres["limit"]:
+        rv = {"status"  : "checked: ok",
+              "measure" : mres["measure"],
+              "limit"   : mres["limit"]}
+    elif mres["reason"]:
+        rv = {"status"        : "checked: justified",
+              "measure"       : mres["measure"],
+              "limit"         : mres["limit"],
+              "justification" : mres["reason"]}
+    else:
+        rv = {"status"        : "checked: fail",
+              "measure"       : mres["measure"],
+              "limit"         : mres["limit"]}
+
+    if mres["saturated"]:
+        # We stopped measuring once the limit was exceeded, so the
+        # measure is a lower bound
+        rv["saturated"] = True
+
+    return rv
+
+
 def build_json_report(all_metrics, worst_offenders):
     rv = {"metrics" : {},
           "worst_case" : {}}
 
-    def format_metrics_result(mres):
-        if mres["limit"] is None:
-            return {"status"  : "measured only",
-                    "measure" : mres["measure"]}
-        elif mres["measure"] <= mres["limit"]:
-            return {"status"  : "checked: ok",
-                    "measure" : mres["measure"],
-                    "limit"   : mres["limit"]}
-        elif mres["reason"]:
-            return {"status"        : "checked: justified",
-                    "measure"       : mres["measure"],
-                    "limit"         : mres["limit"],
-                    "justification" : mres["reason"]}
-        else:
-            return {"status"        : "checked: fail",
-                    "measure"       : mres["measure"],
-                    "limit"         : mres["limit"]}
-
     def format_ml(mlst):
         return {name: format_metrics_result(mlst[name])
                 for name in mlst}
@@ -832,6 +904,218 @@ def build_json_report(all_metrics, worst_offenders):
     return rv
 
 
+class CSV_Report_Writer:
+    """ Flat, columnar metrics report
+
+    Each row is a single measurement (file, function, metric) so that
+    the report can be ingested in bulk by spreadsheets or dashboards
+    without having to walk the nested JSON report. Rows are written
+    as soon as the results for a file arrive. If the filename ends in
+    .gz the report is gzip compressed.
+    """
+
+    COLUMNS = ("file",
+               "function",
+               "metric",
+               "status",
+               "measure",
+               "limit",
+               "justification",
+               "tickets",
+               "saturated")
+
+    def __init__(self, filename):
+        assert isinstance(filename, str)
+
+        # pylint: disable=consider-using-with
+        if filename.endswith(".gz"):
+            self.fd = gzip.open(filename, "wt",
+                                encoding="UTF-8",
+                                newline="")
+        else:
+            self.fd = open(filename, "w", encoding="UTF-8", newline="")
+        # pylint: enable=consider-using-with
+        self.writer = csv.writer(self.fd, lineterminator="\n")
+        self.writer.writerow(self.COLUMNS)
+
+    def write_row(self, file_name, function_name, metric, mres):
+        if mres["measure"] is None:
+            return
+
+        tmp = format_metrics_result(mres)
+        self.writer.writerow((file_name,
+                              function_name,
+                              metric,
+                              tmp["status"],
+                              tmp["measure"],
+                              tmp.get("limit", ""),
+                              tmp.get("justification", ""),
+                              " ".join(sorted(mres["tickets"])),
+                              "yes" if mres["saturated"] else ""))
+
+    def write_file_metrics(self, file_name, metrics):
+        assert isinstance(file_name, str)
+        assert isinstance(metrics, dict)
+
+        if metrics["errors"]:
+            return
+
+        for file_metric in config.FILE_METRICS:
+            if file_metric in metrics["metrics"]:
+                self.write_row(file_name,
+                               "",
+                               file_metric,
+                               metrics["metrics"][file_metric])
+
+        for function_name in sorted(metrics["functions"]):
+            function_metrics = metrics["functions"][function_name]
+            for function_metric in config.FUNCTION_METRICS:
+                if function_metric in function_metrics:
+                    self.write_row(file_name,
+                                   function_name,
+                                   function_metric,
+                                   function_metrics[function_metric])
+
+    def close(self):
+        self.fd.close()
+
+
+class Metric_Baseline:
+    """ Index of a previous metrics report
+
+    The index is keyed by (file, function) (with function being the
+    empty string for file metrics) and contains the measures of the
+    baseline. It is used to only report regressions.
+
+    Saturated measures (where we stopped counting) are a lower bound.
+    """
+
+    def __init__(self):
+        self.index = {}
+        # (file, function) -> {metric -> measure}
+        self.saturated = set()
+        # (file, function, metric) for saturated measures
+
+    def register(self, file_name, function_name, metric, measure,
+                 saturated=False):
+        assert isinstance(file_name, str)
+        assert isinstance(function_name, str)
+        assert metric in config.METRICS
+        assert isinstance(measure, int)
+        assert isinstance(saturated, bool)
+
+        if (file_name, function_name) not in self.index:
+            self.index[(file_name, function_name)] = {}
+        self.index[(file_name, function_name)][metric] = measure
+        if saturated:
+            self.saturated.add((file_name, function_name, metric))
+
+    def is_saturated(self, file_name, function_name, metric):
+        return (file_name, function_name, metric) in self.saturated
+
+    def get_measure(self, file_name, function_name, metric):
+        entry = self.index.get((file_name, function_name), None)
+        if entry is None:
+            return None
+        else:
+            return entry.get(metric, None)
+
+    def regressed(self, file_name, function_name, metrics):
+        # Something has regressed if it's new, or if any measure is
+        # now worse than before
+        entry = self.index.get((file_name, function_name), None)
+        if entry is None:
+            return True
+
+        return any(self.regressed_measure(file_name, function_name,
+                                          metric, mres)
+                   for metric, mres in metrics.items())
+
+    def regressed_measure(self, file_name, function_name, metric, mres):
+        # A measure has regressed if it's new or worse than
+        # before. If the baseline is saturated we only know the true
+        # measure was at least that much, so we cap the new measure
+        # in the same way; hence it can never be worse.
+        if mres["measure"] is None:
+            return False
+
+        baseline_measure = self.get_measure(file_name, function_name, metric)
+        if baseline_measure is None:
+            return True
+
+        measure = mres["measure"]
+        if self.is_saturated(file_name, function_name, metric):
+            measure = min(measure, baseline_measure)
+
+        return measure > baseline_measure
+
+    def filter_regressions(self, file_name, metrics):
+        # Remove all file and function metrics that have not regressed
+        # with respect to the baseline. Returns True if anything is
+        # left to report.
+        assert isinstance(file_name, str)
+        assert isinstance(metrics, dict)
+
+        if metrics["errors"]:
+            return True
+
+        if not self.regressed(file_name, "", metrics["metrics"]):
+            metrics["metrics"] = {}
+
+        metrics["functions"] = {
+            function_name: function_metrics
+            for function_name, function_metrics
+            in metrics["functions"].items()
+            if self.regressed(file_name, function_name, function_metrics)
+        }
+
+        return bool(metrics["metrics"] or metrics["functions"])
+
+    def load_json(self, fd):
+        data = json.load(fd)
+        for file_name, file_data in data["metrics"].items():
+            for metric, mres in file_data["file_metrics"].items():
+                if mres["measure"] is not None:
+                    self.register(file_name, "", metric, mres["measure"],
+                                  mres.get("saturated", False))
+            function_metrics = file_data["function_metrics"]
+            for function_name, function_data in function_metrics.items():
+                for metric, mres in function_data.items():
+                    if mres["measure"] is not None:
+                        self.register(file_name, function_name,
+                                      metric, mres["measure"],
+                                      mres.get("saturated", False))
+
+    def load_csv(self, fd):
+        for row in csv.DictReader(fd):
+            self.register(row["file"],
+                          row["function"],
+                          row["metric"],
+                          int(row["measure"]),
+                          # Older reports have no saturated column
+                          row.get("saturated", "") == "yes")
+
+
+@functools.lru_cache(maxsize=None)
+def load_baseline(filename):
+    # We only load each baseline once per process, each worker
+    # consults the same index for all work packages.
+    assert isinstance(filename, str)
+
+    baseline = Metric_Baseline()
+    if filename.endswith(".json"):
+        with open(filename, "r", encoding="UTF-8") as fd:
+            baseline.load_json(fd)
+    elif filename.endswith(".gz"):
+        with gzip.open(filename, "rt", encoding="UTF-8", newline="") as fd:
+            baseline.load_csv(fd)
+    else:
+        with open(filename, "r", encoding="UTF-8", newline="") as fd:
+            baseline.load_csv(fd)
+
+    return baseline
+
+
 def worst_offender_count(worst_offenders):
     for metric in worst_offenders:
         return len(worst_offenders[metric])
@@ -947,6 +1231,11 @@ class MH_Metric(command_line.MISS_HIT_Back_End):
         # file -> { metrics -> {}
         #           functions -> {name -> {}} }
 
+        if self.options.csv:
+            self.csv_writer = CSV_Report_Writer(self.options.csv)
+        else:
+            self.csv_writer = None
+
     @classmethod
     def process_wp(cls, wp):
         if wp.blockname is None:
@@ -965,6 +1254,11 @@ class MH_Metric(command_line.MISS_HIT_Back_End):
         }
         justifications = {}
 
+        if wp.options.baseline:
+            baseline = load_baseline(wp.options.baseline)
+        else:
+            baseline = None
+
         # Create lexer
 
         lexer = MATLAB_Lexer(wp.cfg.language,
@@ -993,31 +1287,49 @@ class MH_Metric(command_line.MISS_HIT_Back_End):
 
         if wp.cfg.metric_enabled("file_length"):
             metrics[full_name]["metrics"]["file_length"] = {
-                "measure" : lexer.line_count(),
-                "limit"   : None,
-                "reason"  : None,
-                "tickets" : set(),
+                "measure"   : lexer.line_count(),
+                "saturated" : False,
+                "limit"     : None,
+                "reason"    : None,
+                "tickets"   : set(),
             }
 
         # Check+justify file metrics
 
         justifications = {full_name : get_file_justifications(wp.mh,
                                                               parse_tree)}
+        file_metrics = metrics[full_name]["metrics"]
         for file_metric in config.FILE_METRICS:
             check_metric(wp.mh, wp.cfg, lexer.get_file_loc(), file_metric,
-                         metrics[full_name]["metrics"],
-                         justifications[full_name])
+                         file_metrics,
+                         justifications = justifications[full_name],
+                         in_baseline    = (
+                             baseline is not None and
+                             file_metric in file_metrics and
+                             not baseline.regressed_measure(
+                                 full_name,
+                                 "",
+                                 file_metric,
+                                 file_metrics[file_metric])))
 
         # Collect, check, and justify function metrics
 
         metrics[full_name]["functions"] = get_function_metrics(wp.mh,
                                                                wp.cfg,
-                                                               parse_tree)
+                                                               parse_tree,
+                                                               full_name,
+                                                               baseline)
 
         # Complain about unused justifications
 
         warn_unused_justifications(wp.mh, parse_tree)
 
+        # Only keep regressions, if we compare against a baseline
+
+        if baseline and not baseline.filter_regressions(full_name,
+                                                        metrics[full_name]):
+            del metrics[full_name]
+
         return MH_Metric_Result(wp, metrics)
 
     def process_result(self, result):
@@ -1026,6 +1338,9 @@ class MH_Metric(command_line.MISS_HIT_Back_End):
         if isinstance(result, MH_Metric_Result):
             assert result.processed
             self.metrics.update(result.metrics)
+            if self.csv_writer:
+                for file_name, metrics in result.metrics.items():
+                    self.csv_writer.write_file_metrics(file_name, metrics)
 
         else:
             assert not result.processed
@@ -1066,6 +1381,10 @@ class MH_Metric(command_line.MISS_HIT_Back_End):
                           fd,
                           indent=4,
                           sort_keys=True)
+        elif self.options.csv:
+            # The CSV report is written while we collect results, so
+            # we just need to finish it
+            self.csv_writer.close()
         elif self.options.ci:
             # In the CI mode we don't produce any report at all
             pass
@@ -1121,13 +1440,34 @@ def main_handler():
         metavar="FILE",
         help=("Create JSON metrics report in the given file."))
 
+    clp["output_options"].add_argument(
+        "--csv",
+        default=None,
+        metavar="FILE",
+        help=("Create a flat CSV metrics report (one row per file,"
+              " function and metric) in the given file. If the filename"
+              " ends in .gz, the report is gzip compressed."))
+
+    clp["output_options"].add_argument(
+        "--baseline",
+        default=None,
+        metavar="FILE",
+        help=("Compare against a previous JSON or CSV metrics report, and"
+              " only report files and functions that are new or where"
+              " a measure got worse. Violations already present in the"
+              " baseline are not reported again."))
+
     options = command_line.parse_args(clp)
 
+    if options.baseline and not os.path.isfile(options.baseline):
+        clp["ap"].error("cannot read baseline %s, it does not exist or is"
+                        " not a file" % options.baseline)
+
     if options.text:
         if os.path.exists(options.text) and not os.path.isfile(options.text):
             clp["ap"].error("cannot write metrics to %s, it exists and is"
                             " not a file" % options.text)
-        if options.html or options.json:
+        if options.html or options.json or options.csv:
             clp["ap"].error("the text option is mutually exclusive with other"
                             " output options")
 
@@ -1135,7 +1475,7 @@ def main_handler():
         if os.path.exists(options.html) and not os.path.isfile(options.html):
             clp["ap"].error("cannot write metrics to %s, it exists and is"
                             " not a file" % options.text)
-        if options.text or options.json:
+        if options.text or options.json or options.csv:
             clp["ap"].error("the html option is mutually exclusive with other"
                             " output options")
 
@@ -1143,12 +1483,21 @@ def main_handler():
         if os.path.exists(options.json) and not os.path.isfile(options.json):
             clp["ap"].error("cannot write metrics to %s, it exists and is"
                             " not a file" % options.text)
-        if options.text or options.html:
+        if options.text or options.html or options.csv:
             clp["ap"].error("the json option is mutually exclusive with other"
                             " output options")
 
-    if options.ci and (options.text or options.html or options.json):
-        clp["ap"].error("the CI mode and and text/html/json options are"
+    if options.csv:
+        if os.path.exists(options.csv) and not os.path.isfile(options.csv):
+            clp["ap"].error("cannot write metrics to %s, it exists and is"
+                            " not a file" % options.csv)
+        if options.text or options.html or options.json:
+            clp["ap"].error("the csv option is mutually exclusive with other"
+                            " output options")
+
+    if options.ci and (options.text or options.html or options.json or
+                       options.csv):
+        clp["ap"].error("the CI mode and and text/html/json/csv options are"
                         "mutually exclusive")
 
     if options.worst_offenders < 0:
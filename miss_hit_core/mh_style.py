@@ -29,6 +29,7 @@
 
 import os
 import re
+import difflib
 from copy import copy
 
 from abc import ABCMeta, abstractmethod
@@ -55,6 +56,11 @@ class Style_Rule(metaclass=ABCMeta):
         self.autofix = autofix
         self.mandatory = False
 
+    def reset(self):
+        # Called before a rule is applied to a new file. Rules that
+        # carry state from one line to the next should clear it here.
+        pass
+
 
 class Style_Rule_File(Style_Rule):
     def __init__(self, name):
@@ -66,6 +72,15 @@ class Style_Rule_File(Style_Rule):
 
 
 class Style_Rule_Line(Style_Rule):
+    # Line rules are not applied to each line. Instead the regex
+    # returned by line_regex is used to find all lines (in the entire
+    # text) that may be relevant, and apply is only called for
+    # these, in order. The regex must match at most once per line.
+
+    @abstractmethod
+    def line_regex(self, cfg):
+        pass
+
     @abstractmethod
     def apply(self, mh, cfg, filename, line_no, line):
         pass
@@ -160,6 +175,9 @@ class Rule_Line_Length(Style_Rule_Line):
     def __init__(self):
         super().__init__("line_length", False)
 
+    def line_regex(self, cfg):
+        return "^.{%u,}$" % (cfg.style_config["line_length"] + 1)
+
     def apply(self, mh, cfg, filename, line_no, line):
         if len(line) > cfg.style_config["line_length"]:
             mh.style_issue(Location(filename,
@@ -184,19 +202,23 @@ class Rule_Line_Blank_Lines(Style_Rule_Line):
     def __init__(self):
         super().__init__("consecutive_blanks", True)
         self.mandatory = True
-        self.is_blank = False
+        self.last_blank = None
+
+    def reset(self):
+        self.last_blank = None
+
+    def line_regex(self, cfg):
+        return r"^[^\S\n]*$"
 
     def apply(self, mh, cfg, filename, line_no, line):
-        if len(line.strip()):
-            self.is_blank = False
-        elif self.is_blank:
+        assert len(line.strip()) == 0
+        if self.last_blank is not None and self.last_blank + 1 == line_no:
             mh.style_issue(Location(filename,
                                     line_no),
                            "more than one consecutive blank line",
                            None,
                            self.autofix)
-        else:
-            self.is_blank = True
+        self.last_blank = line_no
 
 
 class Rule_Line_Tabs(Style_Rule_Line):
@@ -206,21 +228,10 @@ class Rule_Line_Tabs(Style_Rule_Line):
     *everywhere*. When auto-fixing, a tab-width of 4 is used by default,
     but this can be configured with the options 'tab_width'.
 
-    Note that the fix replaces the tab everywhere, including in strings
-    literals. This means
-    ```
-    "a<tab>b"
-       "a<tab>b"
-    ```
-    might be fixed to
-    ```
-    "a        b"
-       "a     b"
-    ```
-
-    Which may or may not what you had intended originally. I am not sure
-    if this is a bug or a feature, but either way it would be *painful* to
-    change so I am going to leave this as is.
+    Note that the fix does not replace tabs inside string literals,
+    since this would change the meaning of your program. These are
+    still reported (but never fixed), so you may want to replace them
+    with e.g. char(9).
 
     """
 
@@ -240,17 +251,48 @@ class Rule_Line_Tabs(Style_Rule_Line):
     def __init__(self):
         super().__init__("tabs", True)
         self.mandatory = True
+        self.lexer = None
+        # The lexer for the file, see stage_2_analysis
+
+    def reset(self):
+        self.lexer = None
+
+    def line_regex(self, cfg):
+        return "^[^\t\n]*\t"
 
     def apply(self, mh, cfg, filename, line_no, line):
-        if "\t" in line:
+        # Tabs are found in the raw line, but we report them like the
+        # lexer does (i.e. with tabs expanded if we're fixing them) so
+        # that all messages for this line show the same context.
+        l_fixed = []
+        l_kept = []
+        for col, c in enumerate(line):
+            if c != "\t":
+                pass
+            elif (line_no, col) in self.lexer.kept_tabs:
+                l_kept.append(self.lexer.visual_col(col, line_no))
+            else:
+                l_fixed.append(self.lexer.visual_col(col, line_no))
+        context = self.lexer.context_line[line_no - 1]
+
+        if l_fixed:
             mh.style_issue(Location(filename,
                                     line_no,
-                                    line.index("\t"),
-                                    line.index("\t"),
-                                    line),
+                                    l_fixed[0],
+                                    l_fixed[0],
+                                    context),
                            "tab is not allowed",
                            None,
                            self.autofix)
+        if l_kept:
+            mh.style_issue(Location(filename,
+                                    line_no,
+                                    l_kept[0],
+                                    l_kept[0],
+                                    context),
+                           "tab is not allowed (it is part of a string,"
+                           " so it is not fixed)",
+                           None)
 
 
 class Rule_Line_Trailing_Whitesapce(Style_Rule_Line):
@@ -267,6 +309,9 @@ class Rule_Line_Trailing_Whitesapce(Style_Rule_Line):
         super().__init__("trailing_whitespace", True)
         self.mandatory = True
 
+    def line_regex(self, cfg):
+        return " $"
+
     def apply(self, mh, cfg, filename, line_no, line):
         if line.endswith(" "):
             if len(line.strip()) == 0:
@@ -354,8 +399,569 @@ KEYWORDS_WITH_WS = frozenset([
 ])
 
 
-def stage_3_analysis(mh, cfg, tbuf, is_embedded, fixed, valid_code):
+class Token_Context:
+    """ The neighbourhood of the token currently checked in stage 3
+
+    A single instance is re-used for all tokens of a file; it is
+    updated by stage_3_analysis before the token checks are invoked.
+    """
+    def __init__(self, tbuf, fixed, valid_code):
+        assert isinstance(tbuf, Token_Buffer)
+        assert isinstance(fixed, bool)
+        assert isinstance(valid_code, bool)
+
+        self.tbuf       = tbuf
+        self.fixed      = fixed
+        self.valid_code = valid_code
+
+        self.n            = None
+        self.token        = None
+        self.prev_token   = None
+        self.next_token   = None
+        self.prev_in_line = None
+        self.ws_before    = None
+        self.next_in_line = None
+        self.ws_after     = None
+
+
+# Corresponds to the old CodeChecker CommaWhitespace rule.
+# CommaLineEndings is now folded into the new end_of_statements rule,
+# which is much more strict and complete.
+def check_whitespace_comma(mh, ctx):
+    token = ctx.token
+    token.fix.ensure_trim_before = True
+    token.fix.ensure_ws_after = True
+
+    if (ctx.next_in_line and ctx.ws_after == 0) or \
+       (ctx.prev_in_line and ctx.ws_before > 0):
+        mh.style_issue(token.location,
+                       "comma cannot be preceeded by whitespace "
+                       "and must be followed by whitespace",
+                       "whitespace_comma",
+                       ctx.fixed)
+
+
+def check_spurious_row_comma(mh, ctx):
+    token = ctx.token
+    if token.fix.spurious:
+        token.fix.delete = True
+        mh.style_issue(token.location,
+                       "this comma is not required and can be removed",
+                       "spurious_row_comma",
+                       ctx.fixed)
+
+
+def check_whitespace_semicolon(mh, ctx):
+    token = ctx.token
+    token.fix.ensure_trim_before = True
+    token.fix.ensure_ws_after = True
+
+    if (ctx.next_in_line and ctx.ws_after == 0) or \
+       (ctx.prev_in_line and ctx.ws_before > 0):
+        mh.style_issue(token.location,
+                       "semicolon cannot be preceeded by "
+                       "whitespace and must be followed by "
+                       "whitespace",
+                       "whitespace_semicolon",
+                       ctx.fixed)
+
+
+def check_spurious_row_semicolon(mh, ctx):
+    token = ctx.token
+    if token.fix.spurious:
+        token.fix.delete = True
+        mh.style_issue(token.location,
+                       "this semicolon is not required and can "
+                       "be removed",
+                       "spurious_row_semicolon",
+                       ctx.fixed)
+
+
+def check_whitespace_colon(mh, ctx):
+    token = ctx.token
+    if ctx.prev_in_line and ctx.prev_in_line.kind == "COMMA":
+        pass
+        # We don't deal with this here. If anything it's the
+        # problem of the comma whitespace rules.
+    elif ctx.next_in_line and \
+         ctx.next_in_line.kind == "CONTINUATION":
+        # Special exception in the rare cases we continue a range
+        # expression
+        if ctx.prev_in_line and ctx.ws_before > 0:
+            token.fix.ensure_trim_before = True
+            mh.style_issue(token.location,
+                           "no whitespace before colon",
+                           "whitespace_colon",
+                           ctx.fixed)
+    elif (ctx.prev_in_line and ctx.ws_before > 0) or \
+         (ctx.next_in_line and ctx.ws_after > 0):
+        token.fix.ensure_trim_before = True
+        token.fix.ensure_trim_after = True
+        mh.style_issue(token.location,
+                       "no whitespace around colon"
+                       " allowed",
+                       "whitespace_colon",
+                       ctx.fixed)
+
+
+# Corresponds to the old CodeChecker EqualSignWhitespace rule
+def check_whitespace_assignment(mh, ctx):
+    token = ctx.token
+    token.fix.ensure_ws_before = True
+    token.fix.ensure_ws_after = True
+
+    if ctx.prev_in_line and ctx.ws_before == 0:
+        mh.style_issue(token.location,
+                       "= must be preceeded by whitespace",
+                       "whitespace_assignment",
+                       ctx.fixed)
+    elif ctx.next_in_line and ctx.ws_after == 0:
+        mh.style_issue(token.location,
+                       "= must be succeeded by whitespace",
+                       "whitespace_assignment",
+                       ctx.fixed)
+
+
+# Corresponds to the old CodeChecker ParenthesisWhitespace and
+# BracketsWhitespace rules
+def check_whitespace_open_bracket(mh, ctx):
+    token = ctx.token
+    if ctx.next_in_line and ctx.ws_after > 0 and \
+       ctx.next_in_line.kind != "CONTINUATION":
+        mh.style_issue(token.location,
+                       "%s must not be followed by whitespace" %
+                       token.raw_text,
+                       "whitespace_brackets",
+                       ctx.fixed)
+        token.fix.ensure_trim_after = True
+
+
+def check_whitespace_close_bracket(mh, ctx):
+    token = ctx.token
+    if ctx.prev_in_line and ctx.ws_before > 0:
+        mh.style_issue(token.location,
+                       "%s must not be preceeded by whitespace" %
+                       token.raw_text,
+                       "whitespace_brackets",
+                       ctx.fixed)
+        token.fix.ensure_trim_before = True
+
+
+# Corresponds to the old CodeChecker KeywordWhitespace rule
+def check_whitespace_keywords(mh, ctx):
+    token = ctx.token
+    if token.value in KEYWORDS_WITH_WS and \
+       ctx.next_in_line and ctx.ws_after == 0:
+        mh.style_issue(token.location,
+                       "keyword must be succeeded by whitespace",
+                       "whitespace_keywords",
+                       ctx.fixed)
+        token.fix.ensure_ws_after = True
+
+
+def check_whitespace_around_functions(mh, ctx):
+    token  = ctx.token
+    tokens = ctx.tbuf.tokens
+    n      = ctx.n
+
+    # Make sure we have whitespace _before_ the function keyword
+    if token.value == "function":
+        # There is a special exception here for comments before
+        # functions
+        true_fstart_token = token
+        true_fstart_prev_token = ctx.prev_token
+        for i in reversed(range(0, n)):
+            if tokens[i].kind == "COMMENT" and \
+               tokens[i].first_in_line:
+                true_fstart_token = tokens[i]
+                if i > 0:
+                    true_fstart_prev_token = tokens[i - 1]
+                else:
+                    true_fstart_prev_token = None
+            elif tokens[i].kind == "NEWLINE" and \
+                 tokens[i].value.count("\n") == 1:
+                pass
+            else:
+                break
+
+        if true_fstart_prev_token and \
+           not (true_fstart_prev_token.location.line + 1 <
+                true_fstart_token.location.line):
+            true_fstart_prev_token.fix.add_newline = True
+            mh.style_issue(token.location,
+                           "function should be preceeded by an empty"
+                           " line",
+                           "whitespace_around_functions",
+                           ctx.fixed)
+
+    # Make sure we have whitespace _after_ the function end
+    if ctx.valid_code and \
+       token.value == "end" and \
+       isinstance(token.ast_link, Function_Definition):
+        # We first need to find the actual last token on this line
+        true_end_id = n
+        true_end_next = None
+        true_end_nl = None
+        for i in range(n + 1, len(tokens)):
+            if tokens[i].kind == "NEWLINE":
+                true_end_nl = tokens[i]
+                break
+            elif tokens[i].location.line == token.location.line:
+                true_end_id = i
+            else:
+                break
+        true_end = tokens[true_end_id]
+        for i in range(true_end_id + 1, len(tokens)):
+            if tokens[i].kind == "NEWLINE":
+                pass
+            else:
+                true_end_next = tokens[i]
+                break
+
+        if true_end_next and \
+           not (true_end.location.line + 1 <
+                true_end_next.location.line):
+            mh.style_issue(token.location,
+                           "function should be suceeded by an"
+                           " empty line",
+                           "whitespace_around_functions",
+                           ctx.fixed)
+            if true_end_nl:
+                true_end_nl.fix.add_newline = True
+            else:
+                true_end.fix.add_newline = True
+
+
+# Corresponds to the old CodeChecker CommentWhitespace rule
+def check_whitespace_comments(mh, ctx):
+    token = ctx.token
+    language = ctx.tbuf.language
+
+    comment_char = token.raw_text[0]
+    comment_body = token.raw_text.lstrip(comment_char)
+    if re.match("^%#[a-zA-Z]", token.raw_text):
+        # Stuff like %#codegen or %#ok are pragmas and should not be
+        # subject to style checks
+        pass
+
+    elif token.raw_text.startswith("%!") and \
+         language.octave_test_pragmas:
+        # This is an octave test pragma. For now we ignore it, but it
+        # would be nice to pretty-print the contents.
+        pass
+
+    elif token.raw_text.startswith("%|"):
+        # This is a miss-hit pragma, but we've not processed it. This
+        # is fine.
+        pass
+
+    elif token.block_comment:
+        # Ignore block comments
+        pass
+
+    elif token.raw_text.strip() in (
+            "%s%s" % (cc, cb)
+            for cc in language.comment_chars
+            for cb in "{}"):
+        # Leave block comment indicators alone
+        pass
+
+    elif re.match("^%# +[a-zA-Z]", token.raw_text):
+        # This looks like a pragma, but there is a spurious space
+        mh.style_issue(token.location,
+                       "MATLAB pragma must not contain whitespace "
+                       "between %# and the pragma",
+                       "whitespace_comments",
+                       ctx.fixed)
+        token.raw_text = "%#" + token.raw_text[2:].strip()
+
+    elif re.match("^% +#[a-zA-Z]", token.raw_text):
+        # This looks like a pragma that got "fixed" before we fixed
+        # our pragma handling
+        mh.style_issue(token.location,
+                       "MATLAB pragma must not contain whitespace "
+                       "between % and the pragma",
+                       "whitespace_comments",
+                       ctx.fixed)
+        token.raw_text = "%#" + token.raw_text.split("#", 1)[1]
+
+    elif comment_body and not comment_body.startswith(" "):
+        # Normal comments should contain whitespace
+        mh.style_issue(token.location,
+                       "comment body must be separated with "
+                       "whitespace from the starting %s" %
+                       comment_char,
+                       "whitespace_comments",
+                       ctx.fixed)
+        token.raw_text = (comment_char * (len(token.raw_text) -
+                                          len(comment_body)) +
+                          " " +
+                          comment_body)
+
+    # Make sure we have whitespace before each comment
+    if ctx.prev_in_line and ctx.ws_before == 0:
+        mh.style_issue(token.location,
+                       "comment must be preceeded by whitespace",
+                       "whitespace_comments",
+                       ctx.fixed)
+        token.fix.ensure_ws_before = True
+
+
+# Make sure we have whitespace before each line continuation
+def check_whitespace_continuation(mh, ctx):
+    token = ctx.token
+    if ctx.prev_in_line and ctx.ws_before == 0:
+        mh.style_issue(token.location,
+                       "continuation must be preceeded by whitespace",
+                       "whitespace_continuation",
+                       ctx.fixed)
+        token.fix.ensure_ws_before = True
+
+
+def check_operator_after_continuation(mh, ctx):
+    next_token = ctx.next_token
+    if next_token and next_token.first_in_line and \
+       next_token.kind == "OPERATOR" and \
+       next_token.fix.binary_operator:
+        # Continuations should not start with operators unless its a
+        # unary.
+        mh.style_issue(next_token.location,
+                       "continuations should not start with binary "
+                       "operators",
+                       "operator_after_continuation")
+
+
+def check_useless_continuation(mh, ctx):
+    token = ctx.token
+    if ctx.next_token and ctx.next_token.kind in ("NEWLINE", "COMMENT"):
+        # Continuations followed immediately by a new-line or comment
+        # are not actually helpful at all.
+        mh.style_issue(token.location,
+                       "useless line continuation",
+                       "useless_continuation",
+                       ctx.fixed)
+        token.fix.replace_with_newline = True
+    elif ctx.prev_token and ctx.prev_token.fix.statement_terminator:
+        mh.style_issue(token.location,
+                       "useless line continuation",
+                       "useless_continuation",
+                       ctx.fixed)
+        token.fix.delete = True
+
+
+def check_operator_whitespace(mh, ctx):
+    token = ctx.token
+    if token.fix.unary_operator:
+        if (ctx.prev_in_line and ctx.ws_before > 0) and \
+           token.value in (".'", "'"):
+            mh.style_issue(token.location,
+                           "suffix operator must not be preceeded by"
+                           " whitespace",
+                           "operator_whitespace",
+                           ctx.fixed)
+            token.fix.ensure_trim_before = True
+        elif (ctx.next_in_line and ctx.ws_after > 0) and \
+             token.value not in (".'", "'"):
+            mh.style_issue(token.location,
+                           "unary operator must not be followed by"
+                           " whitespace",
+                           "operator_whitespace",
+                           ctx.fixed)
+            token.fix.ensure_trim_after = True
+    elif token.fix.binary_operator:
+        if token.value in (".^", "^"):
+            if (ctx.prev_in_line and ctx.ws_before > 0) or \
+               (ctx.next_in_line and ctx.ws_after > 0):
+                mh.style_issue(token.location,
+                               "power binary operator"
+                               " must not be surrounded by whitespace",
+                               "operator_whitespace",
+                               ctx.fixed)
+                token.fix.ensure_trim_before = True
+                token.fix.ensure_trim_after = True
+        else:
+            if (ctx.prev_in_line and ctx.ws_before == 0) or \
+               (ctx.next_in_line and ctx.ws_after == 0):
+                mh.style_issue(token.location,
+                               "non power binary operator"
+                               " must be surrounded by whitespace",
+                               "operator_whitespace",
+                               ctx.fixed)
+                token.fix.ensure_ws_before = True
+                token.fix.ensure_ws_after = True
+
+
+def check_annotation_whitespace(mh, ctx):
+    token = ctx.token
+    token.fix.ensure_ws_after = True
+
+    if ctx.next_in_line and ctx.ws_after == 0:
+        mh.style_issue(token.location,
+                       "annotation indication must be succeeded"
+                       " by whitespace",
+                       "annotation_whitespace",
+                       ctx.fixed)
+
+
+# Files should not *start* with newline(s)
+def check_no_starting_newline(mh, ctx):
+    token = ctx.token
+    if ctx.n == 0:
+        mh.style_issue(token.location,
+                       "files should not start with a newline",
+                       "no_starting_newline",
+                       ctx.fixed)
+        token.fix.delete = True
+
+
+# The token checks in stage 3. Each entry is (token kinds, rule,
+# check); for each token kind the checks are run in the order given
+# here, but only if the rule is active.
+#
+# Note that implicit_shortcircuit is deliberately missing. The rule
+# is *disabled* for now since it does not work in all
+# circumstances. Curiously, this bug is shared by mlint which also
+# mis-classifies & when applied to arrays. To fix this we need to
+# perform semantic analysis and type inference. We're keeping the
+# rule for compatibility with miss_hit.cfg files that contain
+# reference to it.
+TOKEN_CHECKS = (
+    (("COMMA",),
+     "whitespace_comma", check_whitespace_comma),
+    (("COMMA",),
+     "spurious_row_comma", check_spurious_row_comma),
+    (("SEMICOLON",),
+     "whitespace_semicolon", check_whitespace_semicolon),
+    (("SEMICOLON",),
+     "spurious_row_semicolon", check_spurious_row_semicolon),
+    (("COLON",),
+     "whitespace_colon", check_whitespace_colon),
+    (("ASSIGNMENT",),
+     "whitespace_assignment", check_whitespace_assignment),
+    (("BRA", "A_BRA", "M_BRA"),
+     "whitespace_brackets", check_whitespace_open_bracket),
+    (("KET", "A_KET", "M_KET"),
+     "whitespace_brackets", check_whitespace_close_bracket),
+    (("KEYWORD",),
+     "whitespace_keywords", check_whitespace_keywords),
+    (("KEYWORD",),
+     "whitespace_around_functions", check_whitespace_around_functions),
+    (("COMMENT",),
+     "whitespace_comments", check_whitespace_comments),
+    (("CONTINUATION",),
+     "whitespace_continuation", check_whitespace_continuation),
+    (("CONTINUATION",),
+     "operator_after_continuation", check_operator_after_continuation),
+    (("CONTINUATION",),
+     "useless_continuation", check_useless_continuation),
+    (("OPERATOR",),
+     "operator_whitespace", check_operator_whitespace),
+    (("ANNOTATION",),
+     "annotation_whitespace", check_annotation_whitespace),
+    (("NEWLINE",),
+     "no_starting_newline", check_no_starting_newline),
+)
+
+
+class Style_Plan:
+    """ Everything the style checker needs to know about a Config
+
+    This is compiled once for each distinct style configuration (see
+    get_style_plan) so that we do not need to query the configuration
+    for every rule and every token.
+    """
+    def __init__(self, cfg, rules):
+        assert isinstance(cfg, config.Config)
+        assert isinstance(rules, dict)
+
+        # Rule library for stage 1 and 2
+        self.lib = build_library(cfg, rules)
+
+        # Regex for each line rule
+        self.line_rules = [(rule, re.compile(rule.line_regex(cfg),
+                                             re.MULTILINE))
+                           for rule in self.lib["on_line"]]
+
+        # Token kind -> checks for stage 3
+        self.token_checks = {}
+        for kinds, rule, check in TOKEN_CHECKS:
+            if cfg.active(rule):
+                for kind in kinds:
+                    self.token_checks.setdefault(kind, []).append(check)
+
+        self.dangerous_continuation = cfg.active("dangerous_continuation")
+
+        # Indentation, and which brackets are relevant for us for
+        # aligning continuations
+        self.indentation = cfg.active("indentation")
+        self.tab_width = cfg.style_config["tab_width"]
+        self.relevant_brackets = set()
+        if self.indentation:
+            if cfg.style_config["align_round_brackets"]:
+                self.relevant_brackets.add("BRA")
+            if cfg.style_config["align_other_brackets"]:
+                self.relevant_brackets.add("M_BRA")
+                self.relevant_brackets.add("C_BRA")
+
+        # Encoding (None if we don't check it)
+        if cfg.active("unicode"):
+            self.encoding = cfg.style_config["enforce_encoding"]
+        else:
+            self.encoding = None
+        self.encoding_comments = \
+            cfg.style_config["enforce_encoding_comments"]
+
+    def reset(self):
+        for rules in self.lib.values():
+            for rule in rules:
+                rule.reset()
+
+
+def stage_2_analysis(mh, cfg, plan, lexer):
+    # Each line rule scans the entire (raw) text once for the lines
+    # that may be relevant to it. Since the text is the lines joined
+    # with newlines, line numbers agree with the list of lines.
+    #
+    # The tab rule also needs the lexer, to know which tabs are
+    # inside strings (see MATLAB_Lexer.kept_tabs), since these are
+    # not fixed, and where tabs end up once expanded.
+    assert isinstance(mh, Message_Handler)
+    assert isinstance(plan, Style_Plan)
+    assert isinstance(lexer, MATLAB_Lexer)
+
+    lines = lexer.raw_line
+    text = "\n".join(lines)
+    for rule, regex in plan.line_rules:
+        if isinstance(rule, Rule_Line_Tabs):
+            rule.lexer = lexer
+        line_no = 1
+        pos = 0
+        for match in regex.finditer(text):
+            line_no += text.count("\n", pos, match.start())
+            pos = match.start()
+            rule.apply(mh, cfg, lexer.filename, line_no, lines[line_no - 1])
+
+
+STYLE_PLANS = {}
+
+MAX_FIX_ITERATIONS = 10
+# The maximum number of times we re-check a file for
+# --fix-until-stable
+
+
+def get_style_plan(cfg, rules):
+    # Return the (cached) style plan for the given configuration. We
+    # cache on the style settings and not the object, since each work
+    # package brings its own copy of the configuration.
+    key = cfg.style_fingerprint()
+    if key not in STYLE_PLANS:
+        STYLE_PLANS[key] = Style_Plan(cfg, rules)
+    return STYLE_PLANS[key]
+
+
+def stage_3_analysis(mh, cfg, plan, tbuf, *, is_embedded, fixed, valid_code):
     assert isinstance(mh, Message_Handler)
+    assert isinstance(plan, Style_Plan)
     assert isinstance(tbuf, Token_Buffer)
     assert isinstance(is_embedded, bool)
     assert isinstance(fixed, bool)
@@ -366,25 +972,19 @@ def stage_3_analysis(mh, cfg, tbuf, is_embedded, fixed, valid_code):
     current_indent = 0
     enclosing_ast = None
     bracket_stack = []
-    relevant_brackets = set()
-
-    # Find out which brackets are relevant for us for aligning
-    # continuations
-    if cfg.active("indentation"):
-        if cfg.style_config["align_round_brackets"]:
-            relevant_brackets.add("BRA")
-        if cfg.style_config["align_other_brackets"]:
-            relevant_brackets.add("M_BRA")
-            relevant_brackets.add("C_BRA")
-
-    for n, token in enumerate(tbuf.tokens):
+
+    ctx = Token_Context(tbuf, fixed, valid_code)
+    tokens = tbuf.tokens
+    no_checks = ()
+
+    for n, token in enumerate(tokens):
         if n - 1 >= 0:
-            prev_token = tbuf.tokens[n - 1]
+            prev_token = tokens[n - 1]
         else:
             prev_token = None
 
-        if n + 1 < len(tbuf.tokens):
-            next_token = tbuf.tokens[n + 1]
+        if n + 1 < len(tokens):
+            next_token = tokens[n + 1]
         else:
             next_token = None
 
@@ -447,402 +1047,26 @@ def stage_3_analysis(mh, cfg, tbuf, is_embedded, fixed, valid_code):
         if token.anonymous:
             continue
 
-        # Corresponds to the old CodeChecker CommaWhitespace
-        # rule. CommaLineEndings is now folded into the new
-        # end_of_statements rule, which is much more strict and
-        # complete.
-        if token.kind == "COMMA":
-            if cfg.active("whitespace_comma"):
-                token.fix.ensure_trim_before = True
-                token.fix.ensure_ws_after = True
-
-                if (next_in_line and ws_after == 0) or \
-                   (prev_in_line and ws_before > 0):
-                    mh.style_issue(token.location,
-                                   "comma cannot be preceeded by whitespace "
-                                   "and must be followed by whitespace",
-                                   "whitespace_comma",
-                                   fixed)
-
-            if cfg.active("spurious_row_comma") and token.fix.spurious:
-                token.fix.delete = True
-                mh.style_issue(token.location,
-                               "this comma is not required and can be removed",
-                               "spurious_row_comma",
-                               fixed)
-
-        elif token.kind == "SEMICOLON":
-            if cfg.active("whitespace_semicolon"):
-                token.fix.ensure_trim_before = True
-                token.fix.ensure_ws_after = True
-
-                if (next_in_line and ws_after == 0) or \
-                   (prev_in_line and ws_before > 0):
-                    mh.style_issue(token.location,
-                                   "semicolon cannot be preceeded by "
-                                   "whitespace and must be followed by "
-                                   "whitespace",
-                                   "whitespace_semicolon",
-                                   fixed)
-
-            if cfg.active("spurious_row_semicolon") and token.fix.spurious:
-                token.fix.delete = True
-                mh.style_issue(token.location,
-                               "this semicolon is not required and can "
-                               "be removed",
-                               "spurious_row_semicolon",
-                               fixed)
-
-        elif token.kind == "COLON":
-            if cfg.active("whitespace_colon"):
-                if prev_in_line and prev_in_line.kind == "COMMA":
-                    pass
-                    # We don't deal with this here. If anything it's the
-                    # problem of the comma whitespace rules.
-                elif next_in_line and \
-                     next_in_line.kind == "CONTINUATION":
-                    # Special exception in the rare cases we
-                    # continue a range expression
-                    if prev_in_line and ws_before > 0:
-                        token.fix.ensure_trim_before = True
-                        mh.style_issue(token.location,
-                                       "no whitespace before colon",
-                                       "whitespace_colon",
-                                       fixed)
-                elif (prev_in_line and ws_before > 0) or \
-                     (next_in_line and ws_after > 0):
-                    token.fix.ensure_trim_before = True
-                    token.fix.ensure_trim_after = True
-                    mh.style_issue(token.location,
-                                   "no whitespace around colon"
-                                   " allowed",
-                                   "whitespace_colon",
-                                   fixed)
-
-        # Corresponds to the old CodeChecker EqualSignWhitespace rule
-        elif token.kind == "ASSIGNMENT":
-            if cfg.active("whitespace_assignment"):
-                token.fix.ensure_ws_before = True
-                token.fix.ensure_ws_after = True
-
-                if prev_in_line and ws_before == 0:
-                    mh.style_issue(token.location,
-                                   "= must be preceeded by whitespace",
-                                   "whitespace_assignment",
-                                   fixed)
-                elif next_in_line and ws_after == 0:
-                    mh.style_issue(token.location,
-                                   "= must be succeeded by whitespace",
-                                   "whitespace_assignment",
-                                   fixed)
-
-        # Corresponds to the old CodeChecker ParenthesisWhitespace and
-        # BracketsWhitespace rules
-        elif token.kind in ("BRA", "A_BRA", "M_BRA"):
-            if cfg.active("whitespace_brackets") and \
-               next_in_line and ws_after > 0 and \
-               next_in_line.kind != "CONTINUATION":
-                mh.style_issue(token.location,
-                               "%s must not be followed by whitespace" %
-                               token.raw_text,
-                               "whitespace_brackets",
-                               fixed)
-                token.fix.ensure_trim_after = True
-
-        elif token.kind in ("KET", "A_KET", "M_KET"):
-            if cfg.active("whitespace_brackets") and \
-               prev_in_line and ws_before > 0:
-                mh.style_issue(token.location,
-                               "%s must not be preceeded by whitespace" %
-                               token.raw_text,
-                               "whitespace_brackets",
-                               fixed)
-                token.fix.ensure_trim_before = True
-
-        elif token.kind == "KEYWORD":
-            # Corresponds to the old CodeChecker KeywordWhitespace rule
-            if token.value in KEYWORDS_WITH_WS and \
-               cfg.active("whitespace_keywords") and \
-               next_in_line and ws_after == 0:
-                mh.style_issue(token.location,
-                               "keyword must be succeeded by whitespace",
-                               "whitespace_keywords",
-                               fixed)
-                token.fix.ensure_ws_after = True
-
-            # Make sure we have whitespace _before_ the function
-            # keyword
-            if token.value == "function" and \
-               cfg.active("whitespace_around_functions"):
-                # There is a special exception here for comments
-                # before functions
-                true_fstart_token = token
-                true_fstart_prev_token = prev_token
-                for i in reversed(range(0, n)):
-                    if tbuf.tokens[i].kind == "COMMENT" and \
-                       tbuf.tokens[i].first_in_line:
-                        true_fstart_token = tbuf.tokens[i]
-                        if i > 0:
-                            true_fstart_prev_token = tbuf.tokens[i - 1]
-                        else:
-                            true_fstart_prev_token = None
-                    elif tbuf.tokens[i].kind == "NEWLINE" and \
-                         tbuf.tokens[i].value.count("\n") == 1:
-                        pass
-                    else:
-                        break
-
-                if true_fstart_prev_token and \
-                   not (true_fstart_prev_token.location.line + 1 <
-                        true_fstart_token.location.line):
-                    true_fstart_prev_token.fix.add_newline = True
-                    mh.style_issue(token.location,
-                                   "function should be preceeded by an empty"
-                                   " line",
-                                   "whitespace_around_functions",
-                                   fixed)
-
-            # Make sure we have whitespace _after_ the function end
-            if valid_code and \
-               token.value == "end" and \
-               cfg.active("whitespace_around_functions") and \
-               isinstance(token.ast_link, Function_Definition):
-                # We first need to find the actual last token on this line
-                true_end_id = n
-                true_end_next = None
-                true_end_nl = None
-                for i in range(n + 1, len(tbuf.tokens)):
-                    if tbuf.tokens[i].kind == "NEWLINE":
-                        true_end_nl = tbuf.tokens[i]
-                        break
-                    elif tbuf.tokens[i].location.line == token.location.line:
-                        true_end_id = i
-                    else:
-                        break
-                true_end = tbuf.tokens[true_end_id]
-                for i in range(true_end_id + 1, len(tbuf.tokens)):
-                    if tbuf.tokens[i].kind == "NEWLINE":
-                        pass
-                    else:
-                        true_end_next = tbuf.tokens[i]
-                        break
-
-                if true_end_next and \
-                   not (true_end.location.line + 1 <
-                        true_end_next.location.line):
-                    mh.style_issue(token.location,
-                                   "function should be suceeded by an"
-                                   " empty line",
-                                   "whitespace_around_functions",
-                                   fixed)
-                    if true_end_nl:
-                        true_end_nl.fix.add_newline = True
-                    else:
-                        true_end.fix.add_newline = True
-
-        # Corresponds to the old CodeChecker CommentWhitespace rule
-        elif token.kind == "COMMENT":
-            if cfg.active("whitespace_comments"):
-                comment_char = token.raw_text[0]
-                comment_body = token.raw_text.lstrip(comment_char)
-                if re.match("^%#[a-zA-Z]", token.raw_text):
-                    # Stuff like %#codegen or %#ok are pragmas and should
-                    # not be subject to style checks
-                    pass
-
-                elif token.raw_text.startswith("%!") and \
-                     tbuf.language.octave_test_pragmas:
-                    # This is an octave test pragma. For now we ignore
-                    # it, but it would be nice to pretty-print the
-                    # contents.
-                    pass
-
-                elif token.raw_text.startswith("%|"):
-                    # This is a miss-hit pragma, but we've not
-                    # processed it. This is fine.
-                    pass
-
-                elif token.block_comment:
-                    # Ignore block comments
-                    pass
-
-                elif token.raw_text.strip() in (
-                        "%s%s" % (cc, cb)
-                        for cc in tbuf.language.comment_chars
-                        for cb in "{}"):
-                    # Leave block comment indicators alone
-                    pass
-
-                elif re.match("^%# +[a-zA-Z]", token.raw_text):
-                    # This looks like a pragma, but there is a spurious
-                    # space
-                    mh.style_issue(token.location,
-                                   "MATLAB pragma must not contain whitespace "
-                                   "between %# and the pragma",
-                                   "whitespace_comments",
-                                   fixed)
-                    token.raw_text = "%#" + token.raw_text[2:].strip()
-
-                elif re.match("^% +#[a-zA-Z]", token.raw_text):
-                    # This looks like a pragma that got "fixed" before we
-                    # fixed our pragma handling
-                    mh.style_issue(token.location,
-                                   "MATLAB pragma must not contain whitespace "
-                                   "between % and the pragma",
-                                   "whitespace_comments",
-                                   fixed)
-                    token.raw_text = "%#" + token.raw_text.split("#", 1)[1]
-
-                elif comment_body and not comment_body.startswith(" "):
-                    # Normal comments should contain whitespace
-                    mh.style_issue(token.location,
-                                   "comment body must be separated with "
-                                   "whitespace from the starting %s" %
-                                   comment_char,
-                                   "whitespace_comments",
-                                   fixed)
-                    token.raw_text = (comment_char * (len(token.raw_text) -
-                                                      len(comment_body)) +
-                                      " " +
-                                      comment_body)
-
-                # Make sure we have whitespace before each comment
-                if prev_in_line and ws_before == 0:
-                    mh.style_issue(token.location,
-                                   "comment must be preceeded by whitespace",
-                                   "whitespace_comments",
-                                   fixed)
-                    token.fix.ensure_ws_before = True
-
-        elif token.kind == "CONTINUATION":
-            # Make sure we have whitespace before each line continuation
-            if cfg.active("whitespace_continuation") and \
-               prev_in_line and ws_before == 0:
-                mh.style_issue(token.location,
-                               "continuation must be preceeded by whitespace",
-                               "whitespace_continuation",
-                               fixed)
-                token.fix.ensure_ws_before = True
-
-            if cfg.active("operator_after_continuation") and \
-               next_token and next_token.first_in_line and \
-               next_token.kind == "OPERATOR" and \
-               next_token.fix.binary_operator:
-                # Continuations should not start with operators unless
-                # its a unary.
-                mh.style_issue(next_token.location,
-                               "continuations should not start with binary "
-                               "operators",
-                               "operator_after_continuation")
-
-            if cfg.active("useless_continuation"):
-                if next_token and next_token.kind in ("NEWLINE", "COMMENT"):
-                    # Continuations followed immediately by a new-line
-                    # or comment are not actually helpful at all.
-                    mh.style_issue(token.location,
-                                   "useless line continuation",
-                                   "useless_continuation",
-                                   fixed)
-                    token.fix.replace_with_newline = True
-                elif prev_token and prev_token.fix.statement_terminator:
-                    mh.style_issue(token.location,
-                                   "useless line continuation",
-                                   "useless_continuation",
-                                   fixed)
-                    token.fix.delete = True
-
-        elif token.kind == "OPERATOR":
-            if not cfg.active("operator_whitespace"):
-                pass
-            elif token.fix.unary_operator:
-                if (prev_in_line and ws_before > 0) and \
-                   token.value in (".'", "'"):
-                    mh.style_issue(token.location,
-                                   "suffix operator must not be preceeded by"
-                                   " whitespace",
-                                   "operator_whitespace",
-                                   fixed)
-                    token.fix.ensure_trim_before = True
-                elif (next_in_line and ws_after > 0) and \
-                     token.value not in (".'", "'"):
-                    mh.style_issue(token.location,
-                                   "unary operator must not be followed by"
-                                   " whitespace",
-                                   "operator_whitespace",
-                                   fixed)
-                    token.fix.ensure_trim_after = True
-            elif token.fix.binary_operator:
-                if token.value in (".^", "^"):
-                    if (prev_in_line and ws_before > 0) or \
-                       (next_in_line and ws_after > 0):
-                        mh.style_issue(token.location,
-                                       "power binary operator"
-                                       " must not be surrounded by whitespace",
-                                       "operator_whitespace",
-                                       fixed)
-                        token.fix.ensure_trim_before = True
-                        token.fix.ensure_trim_after = True
-                else:
-                    if (prev_in_line and ws_before == 0) or \
-                       (next_in_line and ws_after == 0):
-                        mh.style_issue(token.location,
-                                       "non power binary operator"
-                                       " must be surrounded by whitespace",
-                                       "operator_whitespace",
-                                       fixed)
-                        token.fix.ensure_ws_before = True
-                        token.fix.ensure_ws_after = True
-
-            if valid_code and \
-               cfg.active("implicit_shortcircuit") and \
-               token.value in ("&", "|") and \
-               token.ast_link and \
-               isinstance(token.ast_link, Binary_Logical_Operation) and \
-               token.ast_link.short_circuit:
-                # This rule is *disabled* for now since it does not
-                # work in all circumstances. Curiously, this bug is
-                # shared by mlint which also mis-classifies & when
-                # applied to arrays.
-                #
-                # To fix this we need to perform semantic analysis and
-                # type inference. We're leaving this in for
-                # compatibility with miss_hit.cfg files that contain
-                # reference to this rules.
-                #
-                # mh.style_issue(token.location,
-                #                "implicit short-circuit operation due to"
-                #                " expression being contained in "
-                #                " if/while guard",
-                #                True)
-                # token.fix.make_shortcircuit_explicit = True
-                pass
-
-        elif token.kind == "ANNOTATION":
-            if cfg.active("annotation_whitespace"):
-                token.fix.ensure_ws_after = True
-
-                if next_in_line and ws_after == 0:
-                    mh.style_issue(token.location,
-                                   "annotation indication must be succeeded"
-                                   " by whitespace",
-                                   "annotation_whitespace",
-                                   fixed)
-
-        elif token.kind == "NEWLINE":
-            if n == 0 and cfg.active("no_starting_newline"):
-                # Files should not *start* with newline(s)
-                mh.style_issue(token.location,
-                               "files should not start with a newline",
-                               "no_starting_newline",
-                               fixed)
-                token.fix.delete = True
+        # Run the checks enabled for this kind of token
+        checks = plan.token_checks.get(token.kind, no_checks)
+        if checks:
+            ctx.n            = n
+            ctx.token        = token
+            ctx.prev_token   = prev_token
+            ctx.next_token   = next_token
+            ctx.prev_in_line = prev_in_line
+            ctx.ws_before    = ws_before
+            ctx.next_in_line = next_in_line
+            ctx.ws_after     = ws_after
+            for check in checks:
+                check(mh, ctx)
 
         # Check some specific problems with continuations
         if token.fix.flag_continuations and \
            next_in_line and next_in_line.kind == "CONTINUATION":
             continuation_is_fixed = False
             token.fix.add_newline = False
-            if cfg.active("dangerous_continuation"):
+            if plan.dangerous_continuation:
                 next_in_line.fix.replace_with_newline = True
                 continuation_is_fixed = True
             mh.style_issue(next_in_line.location,
@@ -852,7 +1076,7 @@ def stage_3_analysis(mh, cfg, tbuf, is_embedded, fixed, valid_code):
 
         # Complain about indentation
         if valid_code and \
-           cfg.active("indentation") and \
+           plan.indentation and \
            token.kind != "NEWLINE":
             # Normally we ignore block comments, but the opening token
             # _is_ checked, as that one should align somehow.
@@ -866,7 +1090,7 @@ def stage_3_analysis(mh, cfg, tbuf, is_embedded, fixed, valid_code):
                     offset = 0
 
                 elif bracket_stack and \
-                     bracket_stack[-1].kind in relevant_brackets and \
+                     bracket_stack[-1].kind in plan.relevant_brackets and \
                      token.kind != "ANNOTATION":
                     # For stuff inside a bracket group we care about,
                     # we align it with the opening brace + 1, except
@@ -895,7 +1119,7 @@ def stage_3_analysis(mh, cfg, tbuf, is_embedded, fixed, valid_code):
                         # negative, then we add 1/2 tabs to continue
                         # the line, since previously it was not offset
                         # at all.
-                        offset = cfg.style_config["tab_width"] // 2
+                        offset = plan.tab_width // 2
                     elif token.annotation:
                         # However, for annotations, the correct offset
                         # is to always align with the opening %|
@@ -905,8 +1129,7 @@ def stage_3_analysis(mh, cfg, tbuf, is_embedded, fixed, valid_code):
                         # can wait. But this will be nasty. :(
                         offset = 0
 
-                correct_spaces = (cfg.style_config["tab_width"] *
-                                  current_indent +
+                correct_spaces = (plan.tab_width * current_indent +
                                   offset)
                 token.fix.correct_indent = correct_spaces
 
@@ -930,18 +1153,18 @@ def stage_3_analysis(mh, cfg, tbuf, is_embedded, fixed, valid_code):
             bracket_stack.pop()
 
         # Finally, check for unicode problems.
-        if cfg.active("unicode") and \
-           (cfg.style_config["enforce_encoding_comments"] or
+        if plan.encoding and \
+           (plan.encoding_comments or
             token.kind not in ("COMMENT", "CONTINUATION")):
             try:
-                token.raw_text.encode(cfg.style_config["enforce_encoding"])
+                token.raw_text.encode(plan.encoding)
             except UnicodeEncodeError as uee:
                 new_location = copy(token.location)
                 new_location.col_start = token.location.col_start + uee.start
                 new_location.col_end = token.location.col_start + (uee.end - 1)
                 mh.style_issue(new_location,
                                "non-%s character in source" %
-                               cfg.style_config["enforce_encoding"],
+                               plan.encoding,
                                "unicode")
 
 
@@ -1039,34 +1262,186 @@ def stage_4_analysis(mh, cfg, parse_tree, is_embedded):
     check_copyright(mh, cfg, parse_tree, is_embedded)
 
 
+def unified_diff(name, old_content, new_content):
+    # Produce a patch (that can be applied with patch -p1) for the
+    # given file.
+    assert isinstance(name, str)
+    assert isinstance(old_content, str)
+    assert isinstance(new_content, str)
+
+    rv = []
+    for line in difflib.unified_diff(old_content.splitlines(keepends=True),
+                                     new_content.splitlines(keepends=True),
+                                     fromfile = "a/" + name,
+                                     tofile   = "b/" + name):
+        rv.append(line)
+        if not line.endswith("\n"):
+            rv.append("\n\\ No newline at end of file\n")
+    return "".join(rv)
+
+
 class MH_Style_Result(work_package.Result):
-    def __init__(self, wp):
+    def __init__(self, wp, diff=None):
         super().__init__(wp, True)
+        assert diff is None or isinstance(diff, str)
+        self.diff = diff
+        # Unified diff of the fixes (only for --fix-diff)
 
 
 class MH_Style(command_line.MISS_HIT_Back_End):
-    def __init__(self):
+    def __init__(self, options):
         super().__init__("MH Style")
 
+        # pylint: disable=consider-using-with
+        if options.fix_diff:
+            self.fd_diff = open(options.fix_diff, "w", encoding="UTF-8")
+        else:
+            self.fd_diff = None
+        # pylint: enable=consider-using-with
+
+    def process_result(self, result):
+        assert isinstance(result, MH_Style_Result)
+
+        # Results arrive in order, so we can just stream the diffs
+        if self.fd_diff and result.diff:
+            self.fd_diff.write(result.diff)
+
+    def post_process(self):
+        if self.fd_diff:
+            self.fd_diff.close()
+
     @classmethod
     def process_wp(cls, wp):
         rule_set = wp.extra_options["rule_set"]
         autofix = wp.options.fix
-        fd_tree = wp.extra_options["fd_tree"]
-        debug_validate_links = wp.options.debug_validate_links
 
-        # Build rule library
+        # Get the compiled rules for this configuration
+
+        plan = get_style_plan(wp.cfg, rule_set)
+
+        # Check (and possibly fix) the file content. With
+        # --fix-until-stable the messages are collected separately,
+        # see fix_until_stable.
+
+        if wp.options.fix_until_stable:
+            mh = wp.mh.fork()
+            mh.register_file(wp.filename)
+        else:
+            mh = wp.mh
+
+        original = wp.get_content()
+        content = cls.check_content(wp, mh, plan,
+                                    content = original,
+                                    autofix = autofix,
+                                    debug   = True)
+
+        if wp.options.fix_until_stable:
+            content = cls.fix_until_stable(wp, plan, mh, content)
+
+        # Possibly re-write the file, with issues fixed. For
+        # --fix-diff we instead produce a diff of the changes.
+
+        if content is None:
+            return MH_Style_Result(wp)
 
-        rule_lib = build_library(wp.cfg, rule_set)
+        elif wp.options.fix_diff:
+            if wp.blockname is None:
+                return MH_Style_Result(wp,
+                                       unified_diff(
+                                           os.path.relpath(wp.filename),
+                                           original,
+                                           content))
+            elif content != original:
+                # There is no way to express changes to code embedded
+                # in a Simulink model as a patch
+                wp.mh.warning(Location(wp.filename,
+                                       blockname = wp.blockname),
+                              "fixes for code embedded in Simulink"
+                              " models are not included in the diff")
+            return MH_Style_Result(wp)
+
+        else:
+            # TODO: call modify()
+            wp.write_modified(content)
+            return MH_Style_Result(wp)
 
-        # Load file content
+    @classmethod
+    def fix_until_stable(cls, wp, plan, first_mh, content):
+        # Keep re-checking and fixing the content until it no longer
+        # changes, and return the final content. We report the
+        # issues fixed in the first pass (for the original content)
+        # and all issues left in the final content, including any
+        # issues or errors that were introduced by the fixes.
+        assert isinstance(first_mh, Message_Handler)
+        assert content is None or isinstance(content, str)
+
+        location = Location(wp.filename,
+                            blockname = wp.blockname)
+        last_mh = first_mh
+        iteration = 0
+        while content is not None:
+            iteration += 1
+            mh = wp.mh.fork()
+            mh.register_file(wp.filename)
+            new_content = cls.check_content(wp, mh, plan,
+                                            content = content,
+                                            autofix = True,
+                                            debug   = False)
+            last_mh = mh
+            if new_content is None:
+                wp.mh.warning(location,
+                              "file contains errors after %u round(s)"
+                              " of fixes" % iteration)
+                break
+            elif new_content == content:
+                break
+            elif iteration == MAX_FIX_ITERATIONS:
+                wp.mh.warning(location,
+                              "fixes did not stabilise after %u"
+                              " iterations" % MAX_FIX_ITERATIONS)
+                break
+            content = new_content
+
+        def remaining(msg):
+            # The fixes found in the final content are not applied
+            msg.fixed = False
+            return True
+
+        if last_mh is first_mh:
+            wp.mh.adopt_messages(first_mh,
+                                 lambda msg: True,
+                                 justifications = True)
+        else:
+            wp.mh.adopt_messages(first_mh,
+                                 lambda msg: msg.fixed,
+                                 justifications = False)
+            wp.mh.adopt_messages(last_mh,
+                                 remaining,
+                                 justifications = True)
 
-        content = wp.get_content()
+        return content
+
+    @classmethod
+    def check_content(cls, wp, mh, plan, *, content, autofix, debug):
+        # Style check the given content of the work package, reporting
+        # all issues to the given message handler. If autofix is set
+        # we return the fixed content; otherwise (or if the content
+        # cannot be fixed) None is returned.
+        assert isinstance(mh, Message_Handler)
+        assert isinstance(plan, Style_Plan)
+        assert isinstance(content, str)
+        assert isinstance(autofix, bool)
+        assert isinstance(debug, bool)
+
+        fd_tree = wp.extra_options["fd_tree"] if debug else None
+        debug_validate_links = debug and wp.options.debug_validate_links
+        rule_lib = plan.lib
+        plan.reset()
 
         # Create lexer
 
         lexer = MATLAB_Lexer(wp.cfg.language,
-                             wp.mh,
+                             mh,
                              content,
                              wp.filename,
                              wp.blockname)
@@ -1076,67 +1451,54 @@ class MH_Style(command_line.MISS_HIT_Back_End):
         # We're dealing with an empty file here. Lets just not do anything
 
         if len(lexer.text.strip()) == 0:
-            return MH_Style_Result(wp)
+            return None
 
         # Stage 1 - rules around the file itself
 
         for rule in rule_lib["on_file"]:
-            rule.apply(wp.mh, wp.cfg,
+            rule.apply(mh, wp.cfg,
                        lexer.filename,
                        lexer.text,
                        lexer.context_line)
 
-        # Stage 2 - rules around raw text lines
-
-        for line_no, line in enumerate(lexer.context_line, 1):
-            for rule in rule_lib["on_line"]:
-                rule.apply(wp.mh, wp.cfg,
-                           lexer.filename,
-                           line_no,
-                           line)
-
         # Tabs are just super annoying, and they require special
-        # treatment. There is a known but obscure bug here, in that tabs
-        # in strings are replaced as if they were part of normal
-        # text. This is probably not intentional. For example:
-        #
-        # "a<tab>b"
-        #    "a<tab>b"
-        #
-        # Will right now come out as
-        #
-        # "a   b"
-        # "  a b"
-        #
-        # This is probably not correct. Fixing this is will require a very
-        # different kind of lexing (which I am not in the mood for, I have
-        # suffered enough to deal with ') or a 2-pass solution (which is
-        # slow): first we lex and then fix up tabs inside tokens; and then
-        # we do the global replacement and lex again before we proceed.
+        # treatment. The lexer reports all locations as if tabs had
+        # been expanded, and the fixed file is then re-created from
+        # the tokens and their (visual) locations. This means tabs in
+        # strings are preserved.
 
         if autofix:
             lexer.correct_tabs(wp.cfg.style_config["tab_width"])
 
-        # Create tokenbuffer
+        # Create tokenbuffer. We do this before the line rules, so
+        # that we know which tabs are inside strings.
 
         try:
             tbuf = Token_Buffer(lexer, wp.cfg)
         except Error:
-            # If there are lex errors, we can stop here
-            return MH_Style_Result(wp)
+            tbuf = None
+
+        # Stage 2 - rules around raw text lines
+
+        stage_2_analysis(mh, wp.cfg, plan, lexer)
+
+        # If there are lex errors, we can stop here
+
+        if tbuf is None:
+            return None
 
         # Create parse tree
 
         try:
-            parser = MATLAB_Parser(wp.mh, tbuf, wp.cfg)
+            parser = MATLAB_Parser(mh, tbuf, wp.cfg)
             parse_tree = parser.parse_file()
 
             # Check naming (we do this after parsing, not during,
             # since we may need to re-write functions without end).
-            parse_tree.sty_check_naming(wp.mh, wp.cfg)
+            parse_tree.sty_check_naming(mh, wp.cfg)
 
             # Parse docstrings and attach them to the AST
-            parse_docstrings(wp.mh, wp.cfg, parse_tree, tbuf)
+            parse_docstrings(mh, wp.cfg, parse_tree, tbuf)
 
             if debug_validate_links:
                 tbuf.debug_validate_links()
@@ -1152,8 +1514,9 @@ class MH_Style(command_line.MISS_HIT_Back_End):
         # Stage 3 - rules around individual tokens
 
         stage_3_analysis(
-            mh          = wp.mh,
+            mh          = mh,
             cfg         = wp.cfg,
+            plan        = plan,
             tbuf        = tbuf,
             is_embedded = isinstance(wp, work_package.Embedded_MATLAB_WP),
             fixed       = parse_tree is not None,
@@ -1163,26 +1526,23 @@ class MH_Style(command_line.MISS_HIT_Back_End):
 
         if parse_tree:
             stage_4_analysis(
-                mh          = wp.mh,
+                mh          = mh,
                 cfg         = wp.cfg,
                 parse_tree  = parse_tree,
                 is_embedded = isinstance(wp, work_package.Embedded_MATLAB_WP))
 
-        # Possibly re-write the file, with issues fixed
-
-        if autofix:
-            if not parse_tree:
-                wp.mh.error(lexer.get_file_loc(),
-                            "file is not auto-fixed because it contains"
-                            " parse errors",
-                            fatal=False)
-            else:
-                # TODO: call modify()
-                wp.write_modified(tbuf.replay())
-
-        # Return results
+        # Produce the fixed content
 
-        return MH_Style_Result(wp)
+        if not autofix:
+            return None
+        elif not parse_tree:
+            mh.error(lexer.get_file_loc(),
+                     "file is not auto-fixed because it contains"
+                     " parse errors",
+                     fatal=False)
+            return None
+        else:
+            return tbuf.replay()
 
 
 def main_handler():
@@ -1194,6 +1554,22 @@ def main_handler():
                            default=False,
                            help=("Automatically fix issues where the fix"
                                  " is obvious"))
+    clp["ap"].add_argument("--fix-until-stable",
+                           action="store_true",
+                           default=False,
+                           help=("Like --fix, but keep re-checking and"
+                                 " fixing each file until no more changes"
+                                 " are made (some fixes only become"
+                                 " apparent after others are applied)."
+                                 " Fixed issues are reported for the"
+                                 " original file, and all other issues"
+                                 " for the fixed file."))
+    clp["ap"].add_argument("--fix-diff",
+                           default=None,
+                           metavar="FILE",
+                           help=("Do not modify any files, instead write"
+                                 " the changes --fix would make as a"
+                                 " unified diff to the given file."))
 
     clp["ap"].add_argument("--process-slx",
                            action="store_true",
@@ -1253,6 +1629,14 @@ def main_handler():
 
     options = command_line.parse_args(clp)
 
+    if options.fix_diff:
+        if os.path.exists(options.fix_diff) and \
+           not os.path.isfile(options.fix_diff):
+            clp["ap"].error("Cannot write to %s: it is not a file" %
+                            options.fix_diff)
+    if options.fix_until_stable or options.fix_diff:
+        options.fix = True
+
     if options.html:
         if options.json:
             clp["ap"].error("Cannot produce JSON and HTML at the same time")
@@ -1270,7 +1654,9 @@ def main_handler():
 
     mh.show_context = not options.brief
     mh.show_style   = not options.no_style
-    mh.autofix      = options.fix
+    # With --fix-diff nothing is written, so we don't claim that
+    # anything was fixed
+    mh.autofix      = options.fix and not options.fix_diff
 
     extra_options = {
         "fd_tree"  : None,
@@ -1284,7 +1670,7 @@ def main_handler():
                                         encoding="UTF-8")
     # pylint: enable=consider-using-with
 
-    style_backend = MH_Style()
+    style_backend = MH_Style(options)
     command_line.execute(mh, options, extra_options,
                          style_backend,
                          options.process_slx)
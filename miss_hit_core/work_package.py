@@ -24,7 +24,9 @@
 ##                                                                          ##
 ##############################################################################
 
-import os.path
+import os
+import shutil
+import tempfile
 
 from miss_hit_core import s_ast
 from miss_hit_core import cfg_tree
@@ -111,7 +113,40 @@ class MATLAB_File_WP(MATLAB_Work_Package):
     def write_modified(self, content):
         assert isinstance(content, str)
         self.modified = True
-        with open(self.filename, "w", encoding=self.encoding) as fd:
+
+        # We write to a temporary file next to the original and then
+        # move it over, so that an interrupted run never leaves a
+        # half-written file behind. We resolve symlinks first so that
+        # we update their target and not the link itself.
+        #
+        # Replacing the file would however break hard links, or
+        # change the owner of the file. In these cases we write the
+        # file in place instead.
+        target = os.path.realpath(self.filename)
+        target_stat = os.stat(target)
+        if target_stat.st_nlink > 1:
+            self.write_in_place(target, content)
+            return
+
+        fd_tmp, tmp_name = tempfile.mkstemp(dir    = os.path.dirname(target),
+                                            prefix = ".mh_",
+                                            suffix = ".tmp")
+        try:
+            with os.fdopen(fd_tmp, "w", encoding=self.encoding) as fd:
+                fd.write(content)
+            if not try_preserve_owner(target_stat, tmp_name):
+                os.unlink(tmp_name)
+                self.write_in_place(target, content)
+                return
+            shutil.copymode(target, tmp_name)
+            os.replace(tmp_name, target)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+    def write_in_place(self, target, content):
+        with open(target, "w", encoding=self.encoding) as fd:
             fd.write(content)
 
     def get_content(self):
@@ -177,6 +212,24 @@ class Embedded_MATLAB_WP(MATLAB_Work_Package):
         return self.block.get_text()
 
 
+def try_preserve_owner(target_stat, filename):
+    # Make sure filename has the same owner and group as the file
+    # described by target_stat (if we can). Returns False if this was
+    # not possible.
+    tmp_stat = os.stat(filename)
+    if (tmp_stat.st_uid, tmp_stat.st_gid) == (target_stat.st_uid,
+                                              target_stat.st_gid):
+        return True
+    elif not hasattr(os, "chown"):  # pragma: no cover
+        return False
+
+    try:
+        os.chown(filename, target_stat.st_uid, target_stat.st_gid)
+        return True
+    except OSError:
+        return False
+
+
 class Result:
     def __init__(self, wp, processed):
         assert isinstance(wp, Work_Package)
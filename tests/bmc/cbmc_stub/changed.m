@@ -0,0 +1,3 @@
+function rv = changed(x)
+    rv = x;
+end
@@ -0,0 +1,3 @@
+function rv = crash(x)
+    rv = x;
+end
@@ -0,0 +1,3 @@
+function rv = ok(x)
+    rv = x;
+end
@@ -0,0 +1,3 @@
+function rv = overflow(x)
+    rv = x + 1;
+end
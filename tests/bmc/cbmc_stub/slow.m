@@ -0,0 +1,3 @@
+function rv = slow(x)
+    rv = x;
+end
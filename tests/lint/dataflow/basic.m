@@ -0,0 +1,41 @@
+function rv = basic(x, mode)
+  % Overwritten before use
+  tmp = x * 2;
+  tmp = x * 3;
+
+  % Only defined on one path
+  if mode > 1
+    y = 1;
+  end
+
+  % Set on all paths, error does not return
+  switch mode
+    case 1
+      z = 1;
+    case 2
+      z = 2;
+    otherwise
+      error('bad mode');
+  end
+
+  % Loops
+  acc = 0;
+  for i = 1:x
+    acc = acc + i;
+  end
+
+  % Partial updates do not read the variable
+  v(3) = tmp;
+  v(1) = acc;
+
+  % Unused outputs should be ~
+  [a, b] = size(v);
+
+  % Clean-up objects are fine
+  cleanup = onCleanup(@() disp('done'));
+
+  % Lambda parameters are not variables
+  f = @(x) x + z;
+  rv = f(y) + a + w;
+  w = 1;
+end
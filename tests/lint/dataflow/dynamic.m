@@ -0,0 +1,6 @@
+function dynamic(x)
+  if ~exist('x', 'var')
+    y = 1;
+  end
+  disp(y);
+end
@@ -0,0 +1,40 @@
+function rv = exceptions(x)
+  % The handler sees the state before any statement that raised
+  try
+    stage = 'load';
+    load_stuff(x);
+    stage = 'parse';
+    parse_stuff(x);
+  catch
+    fprintf('failed in %s\n', stage);
+  end
+
+  % If the first statement raises, y is not set
+  try
+    y = compute(x);
+    z = 1;
+  catch
+    z = 2;
+  end
+  rv = y + z;
+
+  % Without a handler we continue after the try
+  try
+    w = compute(x);
+  end
+  rv = rv + w;
+end
+
+function rv = empty_try(x)
+  % An empty try does not stop the rest of the function
+  try
+  catch
+    disp('never happens');
+  end
+  y = 1;
+  try
+  end
+  if x
+    rv = x;
+  end
+end
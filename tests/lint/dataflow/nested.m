@@ -0,0 +1,7 @@
+function nested
+  x = 1;
+  function inner
+    disp(x);
+    z = 1;
+  end
+end
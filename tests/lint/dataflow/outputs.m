@@ -0,0 +1,18 @@
+function [a, b, varargout] = outputs(x)
+  persistent count
+  if isempty(count)
+    count = 0;
+  end
+  count = count + 1;
+  if x
+    a = 1;
+    return
+  end
+  a = 2;
+  while true
+    b = 3;
+    if x > 2
+      break
+    end
+  end
+end
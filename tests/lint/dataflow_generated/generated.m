@@ -0,0 +1,6057 @@
+function rv = generated(a)
+  % Generated code can contain very large functions, which the
+  % data-flow analysis must deal with quickly: this one has over
+  % 5000 assignments and 500 if statements.
+  v0 = 0;
+  v1 = 1;
+  v2 = 2;
+  v3 = 3;
+  v4 = 4;
+  v5 = 5;
+  v6 = 6;
+  v7 = 7;
+  v8 = 8;
+  v9 = 9;
+  v10 = 10;
+  v11 = 11;
+  v12 = 12;
+  v13 = 13;
+  v14 = 14;
+  v15 = 15;
+  v16 = 16;
+  v17 = 17;
+  v18 = 18;
+  v19 = 19;
+  v20 = 20;
+  v21 = 21;
+  v22 = 22;
+  v23 = 23;
+  v24 = 24;
+  v25 = 25;
+  v26 = 26;
+  v27 = 27;
+  v28 = 28;
+  v29 = 29;
+  v30 = 30;
+  v31 = 31;
+  v32 = 32;
+  v33 = 33;
+  v34 = 34;
+  v35 = 35;
+  v36 = 36;
+  v37 = 37;
+  v38 = 38;
+  v39 = 39;
+  v40 = 40;
+  v41 = 41;
+  v42 = 42;
+  v43 = 43;
+  v44 = 44;
+  v45 = 45;
+  v46 = 46;
+  v47 = 47;
+  v48 = 48;
+  v49 = 49;
+  if a > 0
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 1
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 2
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 3
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 4
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 5
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 6
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 7
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 8
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 9
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 10
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 11
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 12
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 13
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 14
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 15
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 16
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 17
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 18
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 19
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 20
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 21
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 22
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 23
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 24
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 25
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 26
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 27
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 28
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 29
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 30
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 31
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 32
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 33
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 34
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 35
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 36
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 37
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 38
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 39
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 40
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 41
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 42
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 43
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 44
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 45
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 46
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 47
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 48
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 49
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 50
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 51
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 52
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 53
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 54
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 55
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 56
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 57
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 58
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 59
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 60
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 61
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 62
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 63
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 64
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 65
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 66
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 67
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 68
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 69
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 70
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 71
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 72
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 73
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 74
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 75
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 76
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 77
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 78
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 79
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 80
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 81
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 82
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 83
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 84
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 85
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 86
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 87
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 88
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 89
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 90
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 91
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 92
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 93
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 94
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 95
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 96
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 97
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 98
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 99
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 100
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 101
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 102
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 103
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 104
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 105
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 106
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 107
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 108
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 109
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 110
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 111
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 112
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 113
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 114
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 115
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 116
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 117
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 118
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 119
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 120
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 121
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 122
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 123
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 124
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 125
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 126
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 127
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 128
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 129
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 130
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 131
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 132
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 133
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 134
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 135
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 136
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 137
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 138
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 139
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 140
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 141
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 142
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 143
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 144
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 145
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 146
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 147
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 148
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 149
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 150
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 151
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 152
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 153
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 154
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 155
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 156
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 157
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 158
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 159
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 160
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 161
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 162
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 163
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 164
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 165
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 166
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 167
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 168
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 169
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 170
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 171
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 172
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 173
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 174
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 175
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 176
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 177
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 178
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 179
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 180
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 181
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 182
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 183
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 184
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 185
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 186
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 187
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 188
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 189
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 190
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 191
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 192
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 193
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 194
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 195
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 196
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 197
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 198
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 199
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 200
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 201
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 202
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 203
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 204
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 205
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 206
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 207
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 208
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 209
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 210
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 211
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 212
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 213
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 214
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 215
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 216
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 217
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 218
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 219
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 220
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 221
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 222
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 223
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 224
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 225
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 226
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 227
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 228
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 229
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 230
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 231
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 232
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 233
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 234
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 235
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 236
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 237
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 238
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 239
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 240
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 241
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 242
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 243
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 244
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 245
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 246
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 247
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 248
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 249
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 250
+    w = a;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  w = 1;
+  if a > 251
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 252
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 253
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 254
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 255
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 256
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 257
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 258
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 259
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 260
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 261
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 262
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 263
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 264
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 265
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 266
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 267
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 268
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 269
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 270
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 271
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 272
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 273
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 274
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 275
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 276
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 277
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 278
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 279
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 280
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 281
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 282
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 283
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 284
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 285
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 286
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 287
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 288
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 289
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 290
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 291
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 292
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 293
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 294
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 295
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 296
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 297
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 298
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 299
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 300
+    u = a;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 301
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 302
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 303
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 304
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 305
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 306
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 307
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 308
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 309
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 310
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 311
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 312
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 313
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 314
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 315
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 316
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 317
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 318
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 319
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 320
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 321
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 322
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 323
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 324
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 325
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 326
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 327
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 328
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 329
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 330
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 331
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 332
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 333
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 334
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 335
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 336
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 337
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 338
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 339
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 340
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 341
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 342
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 343
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 344
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 345
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 346
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 347
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 348
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 349
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 350
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 351
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 352
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 353
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 354
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 355
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 356
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 357
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 358
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 359
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 360
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 361
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 362
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 363
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 364
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 365
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 366
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 367
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 368
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 369
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 370
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 371
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 372
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 373
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 374
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 375
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 376
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 377
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 378
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 379
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 380
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 381
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 382
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 383
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 384
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 385
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 386
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 387
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 388
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 389
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 390
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 391
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 392
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 393
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 394
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 395
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 396
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 397
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 398
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 399
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 400
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 401
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 402
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 403
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 404
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 405
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 406
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 407
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 408
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 409
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 410
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 411
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 412
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 413
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 414
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 415
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 416
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 417
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 418
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 419
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 420
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 421
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 422
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 423
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 424
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 425
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 426
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 427
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 428
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 429
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 430
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 431
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 432
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 433
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 434
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 435
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 436
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 437
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 438
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 439
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 440
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 441
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 442
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 443
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 444
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 445
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 446
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 447
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 448
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 449
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 450
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 451
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 452
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 453
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 454
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 455
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 456
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 457
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 458
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 459
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 460
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 461
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 462
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 463
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 464
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 465
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 466
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 467
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 468
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 469
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 470
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 471
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 472
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 473
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 474
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 475
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 476
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 477
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 478
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 479
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 480
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 481
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 482
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 483
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 484
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 485
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 486
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 487
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 488
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 489
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 490
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 491
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 492
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 493
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 494
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  if a > 495
+    v0 = v0 + v7;
+    v1 = v1 + v8;
+    v2 = v2 + v9;
+    v3 = v3 + v10;
+    v4 = v4 + v11;
+    v5 = v5 + v12;
+    v6 = v6 + v13;
+    v7 = v7 + v14;
+    v8 = v8 + v15;
+    v9 = v9 + v16;
+  end
+  if a > 496
+    v10 = v10 + v17;
+    v11 = v11 + v18;
+    v12 = v12 + v19;
+    v13 = v13 + v20;
+    v14 = v14 + v21;
+    v15 = v15 + v22;
+    v16 = v16 + v23;
+    v17 = v17 + v24;
+    v18 = v18 + v25;
+    v19 = v19 + v26;
+  end
+  if a > 497
+    v20 = v20 + v27;
+    v21 = v21 + v28;
+    v22 = v22 + v29;
+    v23 = v23 + v30;
+    v24 = v24 + v31;
+    v25 = v25 + v32;
+    v26 = v26 + v33;
+    v27 = v27 + v34;
+    v28 = v28 + v35;
+    v29 = v29 + v36;
+  end
+  if a > 498
+    v30 = v30 + v37;
+    v31 = v31 + v38;
+    v32 = v32 + v39;
+    v33 = v33 + v40;
+    v34 = v34 + v41;
+    v35 = v35 + v42;
+    v36 = v36 + v43;
+    v37 = v37 + v44;
+    v38 = v38 + v45;
+    v39 = v39 + v46;
+  end
+  if a > 499
+    v40 = v40 + v47;
+    v41 = v41 + v48;
+    v42 = v42 + v49;
+    v43 = v43 + v0;
+    v44 = v44 + v1;
+    v45 = v45 + v2;
+    v46 = v46 + v3;
+    v47 = v47 + v4;
+    v48 = v48 + v5;
+    v49 = v49 + v6;
+  end
+  rv = u + w + v0 + v1 + v2 + v3 + v4 + v5 + v6 + v7 + v8 + v9 + v10 + v11 + v12 + v13 + v14 + v15 + v16 + v17 + v18 + v19 + v20 + v21 + v22 + v23 + v24 + v25 + v26 + v27 + v28 + v29 + v30 + v31 + v32 + v33 + v34 + v35 + v36 + v37 + v38 + v39 + v40 + v41 + v42 + v43 + v44 + v45 + v46 + v47 + v48 + v49;
+end
@@ -0,0 +1,3 @@
+function rv = used(x)
+    rv = x;
+end
@@ -0,0 +1,3 @@
+function obj = Kitten()
+    obj = class(struct(), 'Kitten');
+end
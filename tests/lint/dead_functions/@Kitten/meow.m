@@ -0,0 +1,3 @@
+function meow(obj)
+    disp(obj);
+end
@@ -0,0 +1,5 @@
+% Entry script: everything reachable from here is in use.
+x = helper(1);
+y = util.used(x);
+k = Kitten();
+disp(y);
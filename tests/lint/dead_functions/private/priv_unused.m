@@ -0,0 +1,4 @@
+function rv = priv_unused(x)
+    % Not called, even though a variable shares its name in helper
+    rv = x;
+end
@@ -0,0 +1,3 @@
+function rv = priv_used(x)
+    rv = x;
+end
@@ -0,0 +1,3 @@
+function report()
+    disp('done');
+end
@@ -0,0 +1,3 @@
+function unused()
+    disp('never called');
+end
@@ -0,0 +1,3 @@
+function rv = helper(x)
+    rv = x + 1;
+end
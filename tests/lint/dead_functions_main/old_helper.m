@@ -0,0 +1,4 @@
+function rv = old_helper(x)
+    % Not called by anything, since helper replaced it
+    rv = x + 2;
+end
@@ -0,0 +1,5 @@
+function run_all()
+    % The main function: everything reachable from here is in use.
+    disp(helper(1));
+    util.report();
+end
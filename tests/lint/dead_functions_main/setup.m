@@ -0,0 +1,2 @@
+% Scripts are still assumed to be used
+disp(setup_path());
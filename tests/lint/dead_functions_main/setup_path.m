@@ -0,0 +1,3 @@
+function rv = setup_path()
+    rv = pwd();
+end
@@ -0,0 +1,2004 @@
+function rv = deep_expressions (a)
+    % Generated code can contain very long expressions, which
+    % must not exhaust the stack when traversing the tree.
+    rv = a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a + ...
+        a;
+end
@@ -0,0 +1,11 @@
+function rv = helper(x)
+    rv = local_used(x);
+end
+
+function rv = local_used(x)
+    rv = x;
+end
+
+function local_unused()
+    disp('never called');
+end
@@ -0,0 +1,4 @@
+% Only this file is checked; everything else comes from the index
+% cache (if it has not changed)
+x = helper(1);
+disp(other(x));
@@ -0,0 +1,3 @@
+function rv = other(x)
+    rv = x;
+end
@@ -0,0 +1,3 @@
+function unrelated()
+    disp('not called, but could be called from outside');
+end
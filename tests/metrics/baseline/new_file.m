@@ -0,0 +1,6 @@
+function new_file (x)
+    % Not in the baseline at all
+    if x > 1
+        disp 'a';
+    end
+end
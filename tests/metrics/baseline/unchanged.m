@@ -0,0 +1,10 @@
+function unchanged (x)
+    % Violates the npath limit, but this is already known in the
+    % baseline
+    if x > 1
+        disp 'a';
+    end
+    if x > 2
+        disp 'b';
+    end
+end
@@ -0,0 +1,13 @@
+function worse (x)
+    % Violates the npath limit, and it got worse compared to the
+    % baseline
+    if x > 1
+        disp 'a';
+    end
+    if x > 2
+        disp 'b';
+    end
+    if x > 3
+        disp 'c';
+    end
+end
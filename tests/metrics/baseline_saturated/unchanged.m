@@ -0,0 +1,17 @@
+function unchanged(a)
+  if a
+    x = 1;
+  end
+  if a
+    x = 2;
+  end
+  if a
+    x = 3;
+  end
+  if a
+    x = 4;
+  end
+  if a
+    x = 5;
+  end
+end
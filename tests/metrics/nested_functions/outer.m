@@ -0,0 +1,34 @@
+function outer (a, b)
+    % The nested function below must not contribute to any of the
+    % metrics of its parent
+    global G1
+    if a && b
+        disp 'x';
+    elseif a
+        for i = 1:10
+            disp 'y';
+        end
+    end
+
+    function rv = inner (c)
+        persistent P1 P2
+        global G2 G3
+        rv = 0;
+        while c || rv < 3
+            try
+                rv = rv + 1;
+            catch
+                switch c
+                    case 1
+                        rv = 2;
+                    otherwise
+                        rv = 3;
+                end
+            end
+        end
+    end
+
+    function other ()
+        disp 'z';
+    end
+end
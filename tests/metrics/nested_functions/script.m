@@ -0,0 +1,12 @@
+global G1
+if true
+    spmd
+        disp 'x';
+    end
+end
+
+function local_function (x)
+    if x
+        disp 'y';
+    end
+end
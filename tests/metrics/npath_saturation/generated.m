@@ -0,0 +1,123 @@
+function generated (x)
+    % Generated code with an enormous number of paths
+    if x > 0
+        x = x - 1;
+    end
+    if x > 1
+        x = x - 1;
+    end
+    if x > 2
+        x = x - 1;
+    end
+    if x > 3
+        x = x - 1;
+    end
+    if x > 4
+        x = x - 1;
+    end
+    if x > 5
+        x = x - 1;
+    end
+    if x > 6
+        x = x - 1;
+    end
+    if x > 7
+        x = x - 1;
+    end
+    if x > 8
+        x = x - 1;
+    end
+    if x > 9
+        x = x - 1;
+    end
+    if x > 10
+        x = x - 1;
+    end
+    if x > 11
+        x = x - 1;
+    end
+    if x > 12
+        x = x - 1;
+    end
+    if x > 13
+        x = x - 1;
+    end
+    if x > 14
+        x = x - 1;
+    end
+    if x > 15
+        x = x - 1;
+    end
+    if x > 16
+        x = x - 1;
+    end
+    if x > 17
+        x = x - 1;
+    end
+    if x > 18
+        x = x - 1;
+    end
+    if x > 19
+        x = x - 1;
+    end
+    if x > 20
+        x = x - 1;
+    end
+    if x > 21
+        x = x - 1;
+    end
+    if x > 22
+        x = x - 1;
+    end
+    if x > 23
+        x = x - 1;
+    end
+    if x > 24
+        x = x - 1;
+    end
+    if x > 25
+        x = x - 1;
+    end
+    if x > 26
+        x = x - 1;
+    end
+    if x > 27
+        x = x - 1;
+    end
+    if x > 28
+        x = x - 1;
+    end
+    if x > 29
+        x = x - 1;
+    end
+    if x > 30
+        x = x - 1;
+    end
+    if x > 31
+        x = x - 1;
+    end
+    if x > 32
+        x = x - 1;
+    end
+    if x > 33
+        x = x - 1;
+    end
+    if x > 34
+        x = x - 1;
+    end
+    if x > 35
+        x = x - 1;
+    end
+    if x > 36
+        x = x - 1;
+    end
+    if x > 37
+        x = x - 1;
+    end
+    if x > 38
+        x = x - 1;
+    end
+    if x > 39
+        x = x - 1;
+    end
+end
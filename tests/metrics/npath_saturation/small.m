@@ -0,0 +1,12 @@
+function small (x)
+    % Is not saturated
+    if x > 0
+        x = x - 1;
+    end
+    if x > 1
+        x = x - 1;
+    end
+    if x > 2
+        x = x - 1;
+    end
+end
@@ -42,7 +42,7 @@ TEST_ENV["PYTHONPATH"] = MH_ROOT
 CBMC_AVILABLE=shutil.which("cbmc") is not None
 
 
-def run_command(command, args):
+def run_command(command, args, env=TEST_ENV):
     cmd = ["coverage",
            "run",
            "--rcfile=%s" % os.path.join(TEST_ROOT, "coverage.cfg"),
@@ -55,7 +55,7 @@ def run_command(command, args):
                         stdout=subprocess.PIPE,
                         stderr=subprocess.STDOUT,
                         encoding="utf-8",
-                        env=TEST_ENV)
+                        env=env)
 
     return rv
 
@@ -79,6 +79,19 @@ def run_module(module, args):
     return rv
 
 
+def cmdline_flags():
+    # Returns the extra flags (one per line) from the test's cmdline
+    # file, if there is one
+    flags = []
+    if os.path.isfile("cmdline"):
+        with open("cmdline", "r") as fd:
+            for raw_flag in fd.readlines():
+                flag = raw_flag.strip()
+                if flag:
+                    flags.append(flag)
+    return flags
+
+
 def relevant_files():
     rv = []
     for path, _, files in os.walk("."):
@@ -138,6 +151,8 @@ def execute_style_test(name):
     files = relevant_files()
     original_content = backup_files(files)
 
+    fix_flags = ["--fix"] + cmdline_flags()
+
     # Run in HTML mode
     r = run_command("mh_style",
                     [".",
@@ -151,8 +166,7 @@ def execute_style_test(name):
                     [".",
                      "--debug-validate-links",
                      "--single",
-                     "--process-slx",
-                     "--fix"])
+                     "--process-slx"] + fix_flags)
     plain_out = r.stdout
 
     # Write the fixed file to foo.m_fixed
@@ -162,8 +176,7 @@ def execute_style_test(name):
     r = run_command("mh_style",
                     [".",
                      "--single",
-                     "--process-slx",
-                     "--fix"])
+                     "--process-slx"] + fix_flags)
     plain_out_again = r.stdout
 
     # Check if fixed files not "fixed" again, and then restore
@@ -191,27 +204,28 @@ def execute_style_test(name):
 
 
 def execute_metric_test(name):
+    flags = [".", "--single"] + cmdline_flags()
+
     # Run
-    r = run_command("mh_metric",
-                    [".",
-                     "--single"])
+    r = run_command("mh_metric", flags)
     plain_out = r.stdout
 
     # HTML
     r = run_command("mh_metric",
-                    [".",
-                     "--single",
-                     "--portable-html",
-                     "--html=metrics.html"])
+                    flags + ["--portable-html",
+                             "--html=metrics.html"])
     html_out = r.stdout
 
     # JSON
     r = run_command("mh_metric",
-                    [".",
-                     "--single",
-                     "--json=metrics.json"])
+                    flags + ["--json=metrics.json"])
     json_out = r.stdout
 
+    # CSV
+    r = run_command("mh_metric",
+                    flags + ["--csv=metrics.csv"])
+    csv_out = r.stdout
+
     # Save stdout
     with open("expected_out.txt", "w") as fd:
         fd.write("=== PLAIN MODE ===\n")
@@ -223,16 +237,42 @@ def execute_metric_test(name):
         fd.write("\n\n=== JSON MODE ===\n")
         fd.write(json_out)
 
+        fd.write("\n\n=== CSV MODE ===\n")
+        fd.write(csv_out)
+
     return "Ran metrics test %s" % name
 
 
 def execute_lint_test(name):
     # Run
-    r = run_command("mh_lint",
-                    [".",
-                     "--single"])
+    flags = ["--single"]
+    if os.path.isfile("cmdline"):
+        flags += cmdline_flags()
+    else:
+        flags.append(".")
+    # If there are files called foo.m.new, then we run again after
+    # replacing foo.m with them (e.g. to see what is re-analysed with
+    # --index-cache=cache).
+    changed = sorted(f[:-len(".new")]
+                     for f in os.listdir(".")
+                     if f.endswith(".m.new"))
+    if changed:
+        shutil.rmtree("cache", ignore_errors=True)
+
+    r = run_command("mh_lint", flags)
     plain_out = r.stdout
 
+    if changed:
+        originals = backup_files(changed)
+        try:
+            for f in changed:
+                shutil.copyfile(f + ".new", f)
+            r = run_command("mh_lint", flags)
+        finally:
+            restore_originals(changed, originals)
+            shutil.rmtree("cache", ignore_errors=True)
+        plain_out += "=== SECOND RUN ===\n" + r.stdout
+
     # # HTML
     # r = subprocess.run([sys.executable,
     #                     "../../../mh_lint",
@@ -370,13 +410,7 @@ def execute_trace_test(name):
         if os.path.isfile(filename):
             os.unlink(filename)
 
-    flags = []
-    if os.path.isfile("cmdline"):
-        with open("cmdline", "r") as fd:
-            for raw_flag in fd.readlines():
-                flag = raw_flag.strip()
-                if flag:
-                    flags.append(flag)
+    flags = cmdline_flags()
 
     r = run_command("mh_trace", flags)
     plain_out = r.stdout
@@ -387,34 +421,70 @@ def execute_trace_test(name):
 
 
 def execute_bmc_test(name):
+    flags = ["--single"] + cmdline_flags()
+
+    # A test can bring its own stub of cbmc. These are run twice, so
+    # that we also see what happens with the results from the first
+    # run (if they are cached). If there is a foo.m.new, then it
+    # replaces foo.m for the second run. We also record for which
+    # functions cbmc was actually run.
+    stub = os.path.isfile("cbmc")
+    if stub:
+        env = copy.copy(TEST_ENV)
+        env["PATH"] = os.getcwd() + os.pathsep + env["PATH"]
+    else:
+        env = TEST_ENV
+
     m_files = []
     for path, _, files in os.walk("."):
         for f in files:
             if f.endswith(".m"):
                 m_files.append(os.path.join(path, f))
 
-    for filename in m_files:
+    for filename in sorted(m_files):
         file_root = os.path.splitext(filename)[0]
 
-        r = run_command("mh_bmc",
-                        ["--single",
-                         filename])
+        if stub:
+            shutil.rmtree("cache", ignore_errors=True)
+            if os.path.isfile("cbmc_calls.log"):
+                os.unlink("cbmc_calls.log")
+
+        r = run_command("mh_bmc", flags + [filename], env)
         plain_out = r.stdout
+        if stub:
+            if os.path.isfile(filename + ".new"):
+                with open(filename, "r") as fd:
+                    original = fd.read()
+                shutil.copyfile(filename + ".new", filename)
+            else:
+                original = None
+            try:
+                r = run_command("mh_bmc", flags + [filename], env)
+            finally:
+                if original is not None:
+                    with open(filename, "w") as fd:
+                        fd.write(original)
+            plain_out = (plain_out.rstrip() + "\n" +
+                         "=== SECOND RUN ===\n" +
+                         r.stdout)
+            with open("cbmc_calls.log", "r") as fd:
+                plain_out = (plain_out.rstrip() + "\n" +
+                             "=== CBMC CALLS ===\n" +
+                             fd.read())
 
         with open("%s.txt" % file_root, "w") as fd:
             fd.write(plain_out.rstrip() + "\n")
 
+    if stub:
+        shutil.rmtree("cache", ignore_errors=True)
+        if os.path.isfile("cbmc_calls.log"):
+            os.unlink("cbmc_calls.log")
+
     return "Ran bmc test %s" % name
 
 
 def execute_project_test(name):
-    flags = ["--single"]
-    if os.path.isfile("cmdline"):
-        with open("cmdline", "r") as fd:
-            for raw_flag in fd.readlines():
-                flag = raw_flag.strip()
-                if flag:
-                    flags.append(flag)
+    flags = ["--single"] + cmdline_flags()
 
     with open("output.txt", "w") as fd:
         fd.write("=== STYLE ===\n")
@@ -444,13 +514,7 @@ def execute_copyright_test(name):
     files = relevant_files()
     original_content = backup_files(files)
 
-    flags = ["--single", "--process-slx"]
-    if os.path.isfile("cmdline"):
-        with open("cmdline", "r") as fd:
-            for raw_flag in fd.readlines():
-                flag = raw_flag.strip()
-                if flag:
-                    flags.append(flag)
+    flags = ["--single", "--process-slx"] + cmdline_flags()
 
     # Run in plaintext mode and fix
     r = run_command("mh_copyright", flags)
@@ -491,7 +555,11 @@ def run_test(test):
                                    "ONLY_LINUX")):
         if sys.platform != "linux":
             return "SKIPPED linux-only test %s" % test["test"]
-    elif test["kind"] == "bmc" and not CBMC_AVILABLE:
+    elif test["kind"] == "bmc" and not CBMC_AVILABLE and \
+         not os.path.isfile(os.path.join(TEST_ROOT,
+                                         test["kind"],
+                                         test["test"],
+                                         "cbmc")):
         return "SKIPPED BMC test %s" % test["test"]
 
     # Set up in the correct directory
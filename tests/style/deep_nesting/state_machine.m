@@ -0,0 +1,57 @@
+function state_machine(x)
+% Generated state machine with deeply nested branches
+if x(1) > 0
+x(1) = x(1) - 1;
+ if x(2) > 0
+ x(2) = x(2) - 1;
+  if x(3) > 0
+x(3) = x(3) - 1;
+if x(4) > 0
+ x(4) = x(4) - 1;
+ if x(5) > 0
+x(5) = x(5) - 1;
+  if x(6) > 0
+ x(6) = x(6) - 1;
+if x(7) > 0
+x(7) = x(7) - 1;
+ if x(8) > 0
+ x(8) = x(8) - 1;
+  if x(9) > 0
+x(9) = x(9) - 1;
+if x(10) > 0
+ x(10) = x(10) - 1;
+ if x(11) > 0
+x(11) = x(11) - 1;
+  if x(12) > 0
+ x(12) = x(12) - 1;
+if x(13) > 0
+x(13) = x(13) - 1;
+ if x(14) > 0
+ x(14) = x(14) - 1;
+  if x(15) > 0
+x(15) = x(15) - 1;
+if x(16) > 0
+ x(16) = x(16) - 1;
+switch x(1)
+case 1
+disp('one');
+otherwise
+disp('other');
+end
+end
+end
+end
+end
+end
+end
+end
+end
+end
+end
+end
+end
+end
+end
+end
+end
+end
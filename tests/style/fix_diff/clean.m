@@ -0,0 +1,3 @@
+% (c) Copyright 2022 Florian Schanda
+
+x = 1;
@@ -0,0 +1,3 @@
+% (c) Copyright 2022 Florian Schanda
+
+y=2
\ No newline at end of file
@@ -0,0 +1,8 @@
+% (c) Copyright 2022 Florian Schanda
+
+function foo(a,b)
+x=a+b;
+  if x>1
+disp(x)
+end
+end
@@ -0,0 +1,18 @@
+% (c) Copyright 2020 Florian Schanda
+
+% Yes, comments
+% are nice
+function Test_11
+    x = 12;
+    %| pragma Justify(metric, "cyc", "just a test");
+    % This is a function
+    % With a multi-line commnt
+    function Potato
+        disp(x);
+    end
+    % This is a function call
+    % for potato
+    %| pragma Justify(metric, "cyc", "just a test");
+    Potato;
+end
+% another comment
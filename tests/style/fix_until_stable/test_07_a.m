@@ -0,0 +1,5 @@
+% (C) Copyright 2020 Florian Schanda
+
+a = [;        % a messy example
+     ;;1]     % with comments
+% a = 1
@@ -0,0 +1,5 @@
+% (C) Copyright 2020 Florian Schanda
+
+b = [;        ... a messy example
+     ;;1]     ... with continuations
+% b = 1
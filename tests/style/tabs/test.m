@@ -7,10 +7,14 @@ end
 
 % tabs in comments	are not ok
 
-% tabs in strings are not ok. its a bit weird since
-% those two should be the same string
+% tabs in strings are kept, since they are part of the string
+% (but they are still reported)
  "a	b"
 "a	b"
 
 % tabs to align are not ok
 x	= 12;
+
+% tabs after strings are ok to fix
+y = 'a	b';	% comment
+z = {'a	b',	'c'};
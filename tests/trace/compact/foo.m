@@ -0,0 +1,4 @@
+function x = foo
+  %| pragma Tag ("FeatureA");
+  x = 1;
+end